@@ -0,0 +1,126 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The decision tool as a library.  Every public name is loaded from its module on first use, so importing
+# the package has no side effects and costs almost nothing; scoring a model with calculate_weighted_scores
+# never loads NumPy, tabulate or the reporting code.
+#
+#     from decision_tool import calculate_weighted_scores, garfield_example
+#     option_scores = calculate_weighted_scores(*garfield_example())
+#
+# The interactive tool runs with: python -m decision_tool
+
+from importlib import import_module
+
+# Public name -> module that defines it
+_EXPORTS = {
+    "MIN_SCORE": "scoring",
+    "MAX_SCORE": "scoring",
+    "TIE_TOLERANCE": "scoring",
+    "normalize_weights": "scoring",
+    "ScoreBreakdown": "scoring",
+    "calculate_score_breakdown": "scoring",
+    "calculate_weighted_scores": "scoring",
+    "simple_2_by_2_example": "examples",
+    "mixed_factors_example": "examples",
+    "garfield_example": "examples",
+    "print_instructions": "interactive",
+    "get_list": "interactive",
+    "get_user_input": "interactive",
+    "input_available": "interactive",
+    "decision_making_tool": "interactive",
+    "DecisionMatrix": "matrix",
+    "compile_decision_matrix": "matrix",
+    "stack_weight_profiles": "matrix",
+    "evaluate_weight_scenarios": "matrix",
+    "AggregationInputs": "aggregation",
+    "AggregationMethod": "aggregation",
+    "AGGREGATION_METHODS": "aggregation",
+    "register_aggregation_method": "aggregation",
+    "aggregate": "aggregation",
+    "compare_aggregation_methods": "aggregation",
+    "calculate_aggregated_scores": "aggregation",
+    "pairwise_matrix": "aggregation",
+    "ahp_priorities": "aggregation",
+    "ahp_weights": "aggregation",
+    "pareto_front": "pareto",
+    "dominance_points": "pareto",
+    "pareto_filter": "pareto",
+    "pareto_filter_model": "pareto",
+    "sample_weights": "sensitivity",
+    "SensitivityAccumulator": "sensitivity",
+    "accumulate_weight_draws": "sensitivity",
+    "weight_sensitivity_analysis": "sensitivity",
+    "display_sensitivity_results": "sensitivity",
+    "WeightStability": "stability",
+    "weight_stability_intervals": "stability",
+    "display_weight_stability": "stability",
+    "DecisionModel": "incremental",
+    "CriteriaTree": "hierarchy",
+    "HierarchicalModel": "hierarchy",
+    "compile_hierarchical_model": "hierarchy",
+    "hierarchy_from_model": "hierarchy",
+    "RATER_AGGREGATIONS": "raters",
+    "RaterPanel": "raters",
+    "compile_rater_panel": "raters",
+    "aggregate_rater_scores": "raters",
+    "average_ranks": "raters",
+    "kendalls_w": "raters",
+    "PanelResult": "raters",
+    "analyse_panel": "raters",
+    "display_panel_results": "raters",
+    "NameTable": "compact",
+    "CompactModel": "compact",
+    "group_ties": "ranking",
+    "top_k_options": "ranking",
+    "Leaderboard": "ranking",
+    "ParallelScenarioExecutor": "parallel",
+    "read_table_chunks": "loaders",
+    "load_weights_table": "loaders",
+    "ScoreTableBuilder": "loaders",
+    "load_decision_tables": "loaders",
+    "save_decision_matrix": "model_file",
+    "load_decision_matrix": "model_file",
+    "REPORT_FORMATS": "report",
+    "REPORT_MODES": "report",
+    "format_plain_table": "report",
+    "report_selection": "report",
+    "ReportWriter": "report",
+    "write_results": "report",
+    "breakdown_from_results": "report",
+    "display_results": "report",
+    "report_format": "report",
+    "save_display_results_to_file": "report",
+    "display_and_save_results": "report",
+    "synthetic_example": "benchmark",
+    "run_benchmarks": "benchmark",
+    "compare_benchmarks": "benchmark",
+    "find_model_files": "batch",
+    "score_model_files": "batch",
+    "ScoringService": "service",
+    "ValidationIssue": "validation",
+    "ValidationReport": "validation",
+    "ModelValidationError": "validation",
+    "validate_model": "validation",
+    "validate_matrix": "validation",
+    "LRUCache": "cache",
+    "ScoringCache": "cache",
+    "default_cache": "cache",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value    # later lookups skip this function
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,41 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# This module runs the tool from the command line:
+#
+#     python -m decision_tool                             interactive tool (Garfield example without a terminal)
+#     python -m decision_tool --benchmark [results.json]  benchmark sweep
+#     python -m decision_tool batch MODELS... [options]   score saved models (see batch.py)
+#     python -m decision_tool serve [options]             scoring service (see service.py)
+#
+# Any of these can be preceded by --profile FILE, which times the stages of the run and writes them, with
+# a cProfile summary and the peak memory, to FILE as JSON (see instrumentation.py).
+
+import sys
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) >= 2 and argv[0] == "--profile":
+        from .instrumentation import capture
+        with capture(argv[1]):
+            return main(argv[2:])
+    if argv and argv[0] == "--benchmark":
+        from .benchmark import run_benchmarks
+        run_benchmarks(output=argv[1] if len(argv) > 1 else "benchmark_results.json")
+    elif argv and argv[0] == "batch":
+        from .batch import main as batch_main
+        sys.exit(batch_main(argv[1:]))
+    elif argv and argv[0] == "serve":
+        from .service import main as service_main
+        sys.exit(service_main(argv[1:]))
+    else:
+        from .interactive import decision_making_tool
+        decision_making_tool()
+
+if __name__ == "__main__":
+    main()
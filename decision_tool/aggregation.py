@@ -0,0 +1,231 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions and classes below score a compiled DecisionMatrix with other aggregation methods than the
+# weighted sum of calculate_weighted_scores, so rankings can be cross-checked on the same data:
+#
+#     "weighted_sum"       the tool's own formula
+#     "weighted_product"   weighted geometric mean of the scores, which does not let a strength on one
+#                          factor make up fully for a weakness on another
+#     "topsis"             closeness of each option to the ideal and anti-ideal options
+#     "ahp"                AHP synthesis in distributive mode, with the scores taken as ratio-scale priorities
+#
+# Every (criterion, factor) column is treated as one attribute with its effective weight (normalised factor
+# weight x normalised criterion weight).  The weights and the normalised score arrays are computed once per
+# AggregationInputs and shared by every method run on it, so each method costs about one pass over the
+# matrix.  New methods are added with register_aggregation_method.  ahp_weights derives weights from
+# AHP pairwise comparisons.
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from .scoring import MAX_SCORE, MIN_SCORE
+
+# Saaty's random consistency index for 1 to 10 compared items; the last value is used for larger sets
+RANDOM_CONSISTENCY_INDEX = (0.0, 0.0, 0.58, 0.90, 1.12, 1.24, 1.32, 1.41, 1.45, 1.49)
+
+# This class holds what the aggregation methods share for one matrix and one set of weights: the effective
+# column weights, and the normalised versions of the score array, each computed the first time a method
+# asks for it.  The weights default to the matrix's own; pass raw weights (e.g. from ahp_weights) to
+# override them.
+
+class AggregationInputs:
+
+    def __init__(self, matrix, criterion_weights=None, factor_weights=None, min_score=MIN_SCORE, max_score=MAX_SCORE):
+        if max_score <= min_score:
+            raise ValueError(f"The score range {min_score}-{max_score} is empty.")
+        self.matrix = matrix
+        self.min_score = min_score
+        self.max_score = max_score
+        self.weights = matrix.effective_weights(criterion_weights, factor_weights)
+        self._derived = {}
+
+    # This method returns a derived array, computing it with compute(self) on first use.
+
+    def derived(self, name, compute):
+        if name not in self._derived:
+            self._derived[name] = compute(self)
+        return self._derived[name]
+
+    # Scores shifted so that the lowest possible score is 1, since a score of 0 would zero a whole product
+
+    def log_shifted_scores(self):
+        return self.derived("log_shifted_scores", lambda inputs: np.log(inputs.matrix.scores - inputs.min_score + 1.0))
+
+    # Scores divided by the Euclidean norm of their column (TOPSIS normalisation)
+
+    def vector_normalized_scores(self):
+        def compute(inputs):
+            norms = np.sqrt(np.einsum("ij,ij->j", inputs.matrix.scores, inputs.matrix.scores))
+            return np.divide(inputs.matrix.scores, norms, out=np.zeros_like(inputs.matrix.scores), where=norms > 0)
+        return self.derived("vector_normalized_scores", compute)
+
+    # Scores divided by the sum of their column (AHP distributive normalisation)
+
+    def sum_normalized_scores(self):
+        def compute(inputs):
+            sums = inputs.matrix.scores.sum(axis=0)
+            return np.divide(inputs.matrix.scores, sums, out=np.zeros_like(inputs.matrix.scores), where=sums != 0)
+        return self.derived("sum_normalized_scores", compute)
+
+# This class is the interface of an aggregation method.  scores returns one score per option (higher is
+# better) for the given AggregationInputs.
+
+class AggregationMethod(ABC):
+
+    name = None
+    description = ""
+
+    @abstractmethod
+    def scores(self, inputs):
+        pass
+
+class WeightedSumMethod(AggregationMethod):
+
+    name = "weighted_sum"
+    description = "Weighted sum of the scores (the tool's own formula)"
+
+    def scores(self, inputs):
+        return inputs.matrix.total_scores(inputs.weights)
+
+# The weighted geometric mean is taken on the shifted scores and shifted back, so the result stays on the
+# score scale and equals the weighted sum when an option scores the same on every factor.
+
+class WeightedProductMethod(AggregationMethod):
+
+    name = "weighted_product"
+    description = "Weighted geometric mean of the scores"
+
+    def scores(self, inputs):
+        return np.exp(inputs.log_shifted_scores() @ inputs.weights) + inputs.min_score - 1.0
+
+# Every factor is treated as a benefit (higher scores are better), as in the rest of the tool, and weights
+# are non-negative, so the ideal takes every column's best normalised score and the anti-ideal its worst.
+# The squared distances are expanded as |v|^2 - 2 v.ideal + |ideal|^2, so they come from an einsum and
+# matrix-vector products rather than from options x columns temporaries.  An option is scored 0.5 when it is both the
+# ideal and the anti-ideal, i.e. when all options score alike.
+
+class TopsisMethod(AggregationMethod):
+
+    name = "topsis"
+    description = "TOPSIS closeness to the ideal option"
+
+    def scores(self, inputs):
+        normalized = inputs.vector_normalized_scores()
+        if not len(normalized):
+            return np.zeros(0)
+        squared_weights = inputs.weights * inputs.weights
+        squared_norms = np.einsum("ij,ij,j->i", normalized, normalized, squared_weights)
+
+        def distance(target):
+            squared = squared_norms - 2.0 * (normalized @ (squared_weights * target)) + squared_weights @ (target * target)
+            return np.sqrt(np.maximum(squared, 0.0))
+
+        to_ideal = distance(normalized.max(axis=0))
+        to_anti_ideal = distance(normalized.min(axis=0))
+        total = to_ideal + to_anti_ideal
+        return np.divide(to_anti_ideal, total, out=np.full(len(total), 0.5), where=total > 0)
+
+class AHPMethod(AggregationMethod):
+
+    name = "ahp"
+    description = "AHP synthesis (distributive mode)"
+
+    def scores(self, inputs):
+        return inputs.sum_normalized_scores() @ inputs.weights
+
+AGGREGATION_METHODS = {}
+
+# This function makes an aggregation method available under its name, replacing any method of that name.
+
+def register_aggregation_method(method):
+    if not method.name:
+        raise ValueError("An aggregation method needs a name.")
+    AGGREGATION_METHODS[method.name] = method
+    return method
+
+for _method in (WeightedSumMethod(), WeightedProductMethod(), TopsisMethod(), AHPMethod()):
+    register_aggregation_method(_method)
+
+def _get_method(method):
+    if isinstance(method, AggregationMethod):
+        return method
+    if method not in AGGREGATION_METHODS:
+        raise ValueError(f"Unknown aggregation method '{method}', expected one of {', '.join(AGGREGATION_METHODS)}.")
+    return AGGREGATION_METHODS[method]
+
+# This function scores every option of a matrix with one method and returns an array lined up with
+# matrix.options.  inputs may be an AggregationInputs to reuse; otherwise one is built from the matrix.
+
+def aggregate(matrix, method="weighted_sum", inputs=None, **weights):
+    if inputs is None:
+        inputs = AggregationInputs(matrix, **weights)
+    return _get_method(method).scores(inputs)
+
+# This function scores every option with several methods (all registered methods by default) on shared
+# inputs, and returns {method name: array of option scores}.
+
+def compare_aggregation_methods(matrix, methods=None, **weights):
+    inputs = AggregationInputs(matrix, **weights)
+    methods = [_get_method(method) for method in (methods or list(AGGREGATION_METHODS))]
+    return {method.name: method.scores(inputs) for method in methods}
+
+# This function returns the option scores of a model in the same form as calculate_weighted_scores,
+# using the given aggregation method.
+
+def calculate_aggregated_scores(options, criteria, criterion_weights, factors, factor_weights, scores, method="weighted_sum"):
+    from .matrix import compile_decision_matrix
+
+    matrix = compile_decision_matrix(options, criteria, criterion_weights, factors, factor_weights, scores)
+    return dict(zip(matrix.options, aggregate(matrix, method).tolist()))
+
+# This function builds the square pairwise comparison matrix of items from {(a, b): value} entries, where
+# value says how many times more important a is than b (Saaty's 1-9 scale).  The reciprocal entries are
+# filled in; pairs that are not given default to 1 (equal importance).
+
+def pairwise_matrix(items, comparisons):
+    index = {item: i for i, item in enumerate(items)}
+    matrix = np.ones((len(items), len(items)))
+    for (a, b), value in comparisons.items():
+        if a not in index or b not in index:
+            raise ValueError(f"Comparison ({a!r}, {b!r}) refers to an unknown item.")
+        if value <= 0:
+            raise ValueError(f"Comparison ({a!r}, {b!r}) must be positive, got {value}.")
+        matrix[index[a], index[b]] = value
+        matrix[index[b], index[a]] = 1.0 / value
+    return matrix
+
+# This function returns the AHP priority vector (principal eigenvector, normalised to add up to 1) and the
+# consistency ratio of pairwise comparison matrices.  pairwise may carry leading dimensions, e.g. one matrix
+# per rater, and all of them are solved together.  A consistency ratio above 0.1 usually means the
+# comparisons should be revisited.
+
+def ahp_priorities(pairwise):
+    pairwise = np.asarray(pairwise, dtype=float)
+    n = pairwise.shape[-1]
+    if pairwise.shape[-2] != n:
+        raise ValueError(f"Pairwise comparison matrices must be square, got shape {pairwise.shape}.")
+
+    eigenvalues, eigenvectors = np.linalg.eig(pairwise)
+    principal = np.argmax(eigenvalues.real, axis=-1)
+    vector = np.abs(np.take_along_axis(eigenvectors.real, principal[..., None, None], axis=-1)[..., 0])
+    priorities = vector / vector.sum(axis=-1, keepdims=True)
+
+    lambda_max = np.take_along_axis(eigenvalues.real, principal[..., None], axis=-1)[..., 0]
+    random_index = RANDOM_CONSISTENCY_INDEX[min(n, len(RANDOM_CONSISTENCY_INDEX)) - 1]
+    consistency_index = (lambda_max - n) / (n - 1) if n > 1 else np.zeros_like(lambda_max)
+    consistency_ratio = consistency_index / random_index if random_index > 0 else np.zeros_like(lambda_max)
+    return priorities, np.maximum(consistency_ratio, 0.0)
+
+# This function turns pairwise comparisons of items (see pairwise_matrix) into {item: weight} and the
+# consistency ratio.  The weights can be used as criterion_weights or as the factor weights of a criterion.
+
+def ahp_weights(items, comparisons):
+    priorities, consistency_ratio = ahp_priorities(pairwise_matrix(items, comparisons))
+    return dict(zip(items, priorities.tolist())), float(consistency_ratio)
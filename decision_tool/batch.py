@@ -0,0 +1,155 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# This module scores many saved decision models (binary model files, see model_file) in one run:
+#
+#     python -m decision_tool batch models/ "archive/*.dtm" --output results/ --format csv
+#
+# Loading and writing are I/O bound and run on a thread pool; scoring is CPU bound and runs on a process
+# pool.  Each I/O thread carries one model at a time (hand its path to a scoring process, write the
+# result), so the number of results held in memory is bounded by the number of I/O threads.  The scoring
+# process loads the file itself, memory-mapping the scores, so the score array is never pickled.  One
+# result file is written per model, plus a summary of all of them.
+
+import argparse
+import glob
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from .model_file import load_decision_matrix
+from .report import REPORT_FORMATS, ReportWriter
+from .scoring import TIE_TOLERANCE
+from .validation import validate_matrix
+
+MODEL_FILE_EXTENSION = ".dtm"
+SUMMARY_HEADERS = ["Model", "Options", "Criteria", "Best Option(s)", "Best Score", "Result File", "Seconds", "Error"]
+
+# This function expands directories and glob patterns into a sorted list of model files.
+
+def find_model_files(patterns):
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.update(glob.glob(os.path.join(pattern, "*" + MODEL_FILE_EXTENSION)))
+        else:
+            paths.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    return sorted(paths)
+
+# This function runs in a scoring process.  It returns every option's total and weighted criterion scores.
+
+def score_matrix(matrix):
+    norm_criterion_weights, _ = matrix.normalized_weights()
+    weighted_scores = matrix.criterion_scores() * norm_criterion_weights
+    return weighted_scores.sum(axis=1), weighted_scores
+
+# This function runs in a scoring process: it loads, validates and scores one model file.  It returns the
+# option and criterion names with the scores, so the file is only read once.
+
+def score_model_file(path):
+    matrix = load_decision_matrix(path, mmap=True)
+    validate_matrix(matrix).raise_if_invalid()
+    return (matrix.options, matrix.criteria) + score_matrix(matrix)
+
+# This function writes the result file of one model: every option from best to worst with its total
+# and weighted criterion scores.
+
+def write_model_result(options, criteria, totals, weighted_scores, filename, fmt):
+    order = np.argsort(-totals, kind="stable")
+    rows = (
+        [rank + 1, options[i], totals[i]] + weighted_scores[i].tolist()
+        for rank, i in enumerate(order.tolist())
+    )
+    with open(filename, "w", encoding="utf-8", newline="") as f:
+        writer = ReportWriter((f, fmt))
+        writer.section("Decision Results")
+        writer.table(["Rank", "Option", "Score"] + criteria, rows,
+                     formats=[None, None, ".2f"] + [".2f"] * len(criteria))
+    return order
+
+# This function handles one model file on an I/O thread: it has the file loaded, validated and scored on
+# the process pool and writes the result.  Failures are reported in the summary row rather than stopping
+# the batch.
+
+def process_model_file(path, filename, fmt, scoring_pool):
+    start = time.perf_counter()
+    summary = {"Model": path, "Result File": filename, "Error": ""}
+    try:
+        options, criteria, totals, weighted_scores = scoring_pool.submit(score_model_file, path).result()
+        order = write_model_result(options, criteria, totals, weighted_scores, filename, fmt)
+
+        summary.update({"Options": len(options), "Criteria": len(criteria)})
+        if len(order):
+            best_score = totals[order[0]].item()
+            best_options = [options[i] for i in np.flatnonzero(np.abs(totals - best_score) < TIE_TOLERANCE)]
+            summary.update({"Best Option(s)": "; ".join(best_options), "Best Score": best_score})
+    except Exception as error:
+        summary.update({"Result File": "", "Error": f"{type(error).__name__}: {error}"})
+    summary["Seconds"] = round(time.perf_counter() - start, 6)
+    return [summary.get(header, "") for header in SUMMARY_HEADERS]
+
+# This function scores every model file and writes one result per model into output_dir, followed by
+# summary.<format> listing each model's best option(s).  It returns the summary rows in input order.
+
+def score_model_files(paths, output_dir, fmt="csv", workers=None, io_threads=None):
+    if fmt not in REPORT_FORMATS:
+        raise ValueError(f"Unknown report format '{fmt}', expected one of {', '.join(REPORT_FORMATS)}.")
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    io_threads = io_threads or 2 * workers    # enough models in flight to keep every scoring process busy
+    extension = "txt" if fmt == "text" else fmt
+
+    # One result file per model, numbered when two models share a name
+    filenames = []
+    used = set()
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        name, count = stem, 1
+        while name in used:
+            count += 1
+            name = f"{stem}-{count}"
+        used.add(name)
+        filenames.append(os.path.join(output_dir, f"{name}.{extension}"))
+
+    # Scoring processes are spawned rather than forked: the first one starts from an I/O thread, and
+    # forking a process while other threads run can leave locks held in the child
+    scoring_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=scoring_context) as scoring_pool, \
+            ThreadPoolExecutor(max_workers=io_threads) as io_pool:
+        futures = [io_pool.submit(process_model_file, path, filename, fmt, scoring_pool)
+                   for path, filename in zip(paths, filenames)]
+        summary = [future.result() for future in futures]
+
+    with open(os.path.join(output_dir, f"summary.{extension}"), "w", encoding="utf-8", newline="") as f:
+        writer = ReportWriter((f, fmt))
+        writer.section("Batch Summary")
+        writer.table(SUMMARY_HEADERS, summary)
+    return summary
+
+# This function is the command line of the batch mode.
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m decision_tool batch",
+                                     description="Score many saved decision models without interaction.")
+    parser.add_argument("models", nargs="+", help=f"model files ({MODEL_FILE_EXTENSION}), directories or glob patterns")
+    parser.add_argument("--output", default="decision_results", help="directory for the result files (default: %(default)s)")
+    parser.add_argument("--format", default="csv", choices=REPORT_FORMATS, help="result file format (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=None, help="scoring processes (default: one per core)")
+    parser.add_argument("--io-threads", type=int, default=None, help="loading/writing threads (default: twice the workers)")
+    args = parser.parse_args(argv)
+
+    paths = find_model_files(args.models)
+    if not paths:
+        parser.error("no model files found")
+    summary = score_model_files(paths, args.output, args.format, args.workers, args.io_threads)
+    failures = sum(1 for row in summary if row[-1])
+    print(f"Scored {len(summary) - failures} of {len(summary)} models; results saved to {args.output}")
+    return 1 if failures else 0
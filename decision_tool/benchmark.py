@@ -0,0 +1,145 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions below benchmark the tool on synthetic decision models of configurable size.
+# Run them with: python -m decision_tool --benchmark [results.json]
+
+import json
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from .matrix import compile_decision_matrix
+from .ranking import top_k_options
+from .report import REPORT_FORMATS, ReportWriter, save_display_results_to_file, write_results
+from .scoring import MAX_SCORE, MIN_SCORE, calculate_score_breakdown, calculate_weighted_scores
+
+# This function generates a synthetic decision model in the same form as the hardcoded examples.
+# Criteria get a ragged number of factors (1 + a Poisson draw around mean_factors), and about
+# direct_share of them are scored directly.  The same seed always gives the same model.
+
+def synthetic_example(option_count, criterion_count, mean_factors=4, direct_share=0.25, seed=0):
+    rng = np.random.default_rng(seed)
+
+    options = [f"Option {i + 1}" for i in range(option_count)]
+    criteria = [f"Criterion {j + 1}" for j in range(criterion_count)]
+    criterion_weights = dict(zip(criteria, rng.integers(MIN_SCORE + 1, MAX_SCORE + 1, criterion_count).tolist()))
+
+    factors = {}
+    factor_weights = {}
+    for criterion in criteria:
+        if rng.random() < direct_share:
+            factors[criterion] = [criterion]
+            factor_weights[criterion] = {criterion: 1.0}
+        else:
+            count = 2 + rng.poisson(max(mean_factors - 2, 0))
+            factors[criterion] = [f"{criterion} / Factor {k + 1}" for k in range(count)]
+            factor_weights[criterion] = dict(zip(factors[criterion], rng.integers(MIN_SCORE + 1, MAX_SCORE + 1, count).tolist()))
+
+    columns = [(criterion, factor) for criterion in criteria for factor in factors[criterion]]
+    score_rows = rng.integers(MIN_SCORE, MAX_SCORE + 1, (option_count, len(columns))).tolist()
+    scores = {}
+    for option, row in zip(options, score_rows):
+        scores[option] = {criterion: {} for criterion in criteria}
+        for (criterion, factor), score in zip(columns, row):
+            scores[option][criterion][factor] = score
+
+    return options, criteria, criterion_weights, factors, factor_weights, scores
+
+# This function times a call, returning the best and mean of several repeats in seconds.
+
+def time_call(function, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), sum(timings) / len(timings)
+
+# This function times scoring, ranking, reporting and file saving over a sweep of model sizes and
+# writes the results to a JSON file.  sizes is a list of (options, criteria) pairs.  Reporting and saving
+# render every option in full, so they are skipped for models with more than report_max_options options.
+
+def run_benchmarks(sizes=((100, 5), (1000, 10), (10000, 20), (20000, 40)), repeats=3, seed=0,
+                   report_max_options=2000, output="benchmark_results.json"):
+    results = []
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w", encoding="utf-8") as null_stream:
+        for option_count, criterion_count in sizes:
+            model = synthetic_example(option_count, criterion_count, seed=seed)
+            options, criteria, criterion_weights, factors, factor_weights, scores = model
+            matrix = compile_decision_matrix(*model)
+            totals = matrix.total_scores()
+            breakdown = calculate_score_breakdown(*model)
+            option_scores = breakdown.option_scores
+
+            stages = {
+                "calculate_weighted_scores": lambda: calculate_weighted_scores(*model),
+                "calculate_score_breakdown": lambda: calculate_score_breakdown(*model),
+                "compile_decision_matrix": lambda: compile_decision_matrix(*model),
+                "matrix_total_scores": lambda: matrix.total_scores(),
+                "rank_full_sort": lambda: sorted(option_scores.items(), key=lambda x: x[1], reverse=True),
+                "rank_top_10_dict": lambda: top_k_options(option_scores, 10),
+                "rank_top_10_array": lambda: top_k_options(totals, 10, matrix.options),
+            }
+            if option_count <= report_max_options:
+                stages["report_text"] = lambda: write_results(ReportWriter(null_stream), breakdown)
+                for fmt in REPORT_FORMATS:
+                    filename = os.path.join(directory, f"results.{'txt' if fmt == 'text' else fmt}")
+                    stages[f"save_{fmt}"] = lambda filename=filename: save_display_results_to_file(
+                        option_scores, scores, criterion_weights, factor_weights, filename, breakdown=breakdown)
+
+            for stage, function in stages.items():
+                best, mean = time_call(function, repeats)
+                results.append({
+                    "options": option_count,
+                    "criteria": criterion_count,
+                    "columns": len(matrix.columns),
+                    "cells": option_count * len(matrix.columns),
+                    "stage": stage,
+                    "best_seconds": best,
+                    "mean_seconds": mean,
+                })
+                print(f"{option_count:>8} x {len(matrix.columns):<5} {stage:<28} {best:.6f} s")
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeats": repeats,
+        "results": results,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Benchmark results saved to {output}")
+    return report
+
+# This function compares two benchmark result files and lists the stages that got slower by more than
+# the given ratio (best time of the new run over best time of the old run).
+
+def compare_benchmarks(old_filename, new_filename, ratio=1.2):
+    with open(old_filename, encoding="utf-8") as f:
+        old = {(r["options"], r["criteria"], r["stage"]): r["best_seconds"] for r in json.load(f)["results"]}
+    with open(new_filename, encoding="utf-8") as f:
+        new = {(r["options"], r["criteria"], r["stage"]): r["best_seconds"] for r in json.load(f)["results"]}
+
+    regressions = []
+    for key in sorted(old.keys() & new.keys()):
+        if old[key] > 0 and new[key] / old[key] > ratio:
+            regressions.append([*key, old[key], new[key], new[key] / old[key]])
+    if regressions:
+        from tabulate import tabulate
+        print(tabulate(regressions, headers=["Options", "Criteria", "Stage", "Old (s)", "New (s)", "Ratio"], tablefmt="grid"))
+    else:
+        print("No regressions found.")
+    return regressions
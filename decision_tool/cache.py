@@ -0,0 +1,171 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# This module memoises scoring results, so identical models are not rescored from scratch.  Only work
+# that costs more than its key is memoised: building a content key means reading every score, which
+# is slower than a plain weighted sum.  DecisionMatrix results are keyed by a SHA-256 hash of the raw
+# arrays, or by a key the caller supplies (e.g. a model id and version), which is the only cheap way to
+# key a dictionary model.  Entries are evicted least-recently-used first once the cache holds too many
+# entries or too many bytes.  A cache can be shared between threads.
+
+import hashlib
+import json
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+
+from .scoring import calculate_weighted_scores
+
+# This function returns a rough size in bytes of a cached value.
+
+def approximate_size(value):
+    if hasattr(value, "nbytes"):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(approximate_size(key) + approximate_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(approximate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+# This class is a thread-safe LRU cache bounded by a number of entries and, optionally, by total size.
+# Values are computed outside the lock, so a slow computation never blocks other lookups.
+
+class LRUCache:
+
+    def __init__(self, max_entries=1024, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()    # key -> (value, size)
+        self._lock = threading.Lock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    # This method returns the cached value for key, or default, and counts the hit or miss.
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    # This method stores a value, evicting the least recently used entries as needed.
+
+    def put(self, key, value, size=None):
+        size = approximate_size(value) if size is None else size
+        if self.max_bytes is not None and size > self.max_bytes:
+            return value    # too large to cache at all
+        with self._lock:
+            if key in self._entries:
+                self.size_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.size_bytes += size
+            while len(self._entries) > self.max_entries or (self.max_bytes is not None and self.size_bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+                self.evictions += 1
+        return value
+
+    # This method returns the cached value for key, computing and storing it on a miss.
+
+    def get_or_compute(self, key, compute, size=None):
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = self.put(key, compute(), size)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"entries": len(self._entries), "bytes": self.size_bytes, "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+# The functions below build the content hashes.  JSON with sorted keys gives a canonical text form of
+# the dictionaries; arrays are hashed in place from their raw bytes together with their shape and type.
+
+def _digest(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, memoryview):
+            data = part.cast("B")
+        elif isinstance(part, bytes):
+            data = part
+        else:
+            data = json.dumps(part, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+# The score cells are packed into a flat array in option and column order, which is both canonical and
+# much cheaper than writing the nested dictionaries out as text.  It still visits every cell in Python.
+
+def model_key(options, criteria, criterion_weights, factors, factor_weights, scores):
+    cells = array("d", [scores[option][criterion][factor]
+                        for option in options for criterion in criteria for factor in factors[criterion]])
+    return _digest("model", options, criteria, criterion_weights, factors, factor_weights, cells.tobytes())
+
+def _array_parts(array):
+    if not array.flags.c_contiguous:
+        array = array.copy()
+    return f"{array.dtype.str}{array.shape}".encode("ascii"), memoryview(array)
+
+def matrix_key(matrix):
+    return _digest("matrix", matrix.options, matrix.criteria, matrix.columns, *_array_parts(matrix.criterion_weights),
+                   *_array_parts(matrix.factor_weights), *_array_parts(matrix.scores))
+
+# This class memoises the scoring functions on top of an LRUCache.  Cached option scores are returned as
+# copies.  Cached breakdowns are shared between callers, so they must be treated as read-only.
+
+class ScoringCache:
+
+    def __init__(self, max_entries=1024, max_bytes=256 * 1024 * 1024):
+        self.cache = LRUCache(max_entries, max_bytes)
+
+    # This method is a memoised calculate_weighted_scores, keyed by the caller's key for the model (any
+    # hashable value that changes whenever the model does, such as a model id and a version number).
+
+    def calculate_weighted_scores(self, key, options, criteria, criterion_weights, factors, factor_weights, scores):
+        return dict(self.cache.get_or_compute(("weighted scores", key), lambda: calculate_weighted_scores(
+            options, criteria, criterion_weights, factors, factor_weights, scores)))
+
+    # This method returns the memoised ScoreBreakdown of a DecisionMatrix.  Without a key the matrix is
+    # keyed by a hash of its contents.  The size is estimated at about 100 bytes per dictionary entry.
+
+    def score_breakdown(self, matrix, key=None):
+        key = ("breakdown", matrix_key(matrix) if key is None else key)
+        size = 100 * len(matrix.options) * (len(matrix.columns) + 2 * len(matrix.criteria) + 1)
+        return self.cache.get_or_compute(key, matrix.score_breakdown, size)
+
+    def stats(self):
+        return self.cache.stats()
+
+    def clear(self):
+        self.cache.clear()
+
+# A cache shared by the whole process, for callers that do not manage their own.
+
+default_cache = ScoringCache()
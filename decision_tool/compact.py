@@ -0,0 +1,162 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# This module holds a compact, integer-indexed form of a decision model for large models.  In the
+# dictionary form every score cell sits under three string keys and factor names are repeated for every
+# option.  Here each name is stored once in a name table, columns refer to factors by number, and the
+# scores are one contiguous NumPy buffer, with per-criterion offsets marking the ragged factor lists.
+
+import sys
+
+import numpy as np
+
+from .matrix import DecisionMatrix
+
+# This class is a table of interned names with their positions.
+
+class NameTable:
+
+    __slots__ = ("names", "index")
+
+    def __init__(self, names=()):
+        self.names = []
+        self.index = {}
+        for name in names:
+            self.add(name)
+
+    # This method returns the position of a name, adding it to the table if it is new.
+
+    def add(self, name):
+        position = self.index.get(name)
+        if position is None:
+            name = sys.intern(name) if isinstance(name, str) else name
+            position = len(self.names)
+            self.names.append(name)
+            self.index[name] = position
+        return position
+
+    def position(self, name):
+        return self.index[name]
+
+    def __getitem__(self, position):
+        return self.names[position]
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+# This class is the compact model.  Column k belongs to the criterion whose offset range contains k,
+# i.e. criterion_starts[j] <= k < criterion_starts[j + 1], and scores factor column_factors[k].
+# Direct scoring criteria have a single column whose factor name is the criterion's own name.
+
+class CompactModel:
+
+    __slots__ = ("options", "criteria", "factors", "criterion_starts", "column_factors",
+                 "scores", "criterion_weights", "factor_weights")
+
+    def __init__(self, options, criteria, factors, criterion_starts, column_factors, scores,
+                 criterion_weights, factor_weights):
+        self.options = options
+        self.criteria = criteria
+        self.factors = factors
+        self.criterion_starts = np.asarray(criterion_starts, dtype=np.int64)
+        self.column_factors = np.asarray(column_factors, dtype=np.int32)
+        self.scores = scores
+        self.criterion_weights = np.asarray(criterion_weights, dtype=np.float64)
+        self.factor_weights = np.asarray(factor_weights, dtype=np.float64)
+
+    # This method builds a compact model from options, criteria, criterion_weights, factors, factor_weights
+    # and scores, as returned by the examples or get_user_input.  dtype=np.float32 halves the score buffer
+    # again and is exact for the whole-number scores of the usual 0-5 scale.
+
+    @classmethod
+    def from_dicts(cls, options, criteria, criterion_weights, factors, factor_weights, scores, dtype=np.float64):
+        option_table = NameTable(options)
+        criterion_table = NameTable(criteria)
+        factor_table = NameTable()
+
+        criterion_starts = [0]
+        column_factors = []
+        column_weights = []
+        for criterion in criteria:
+            direct = len(factors[criterion]) == 1 and factors[criterion][0] == criterion
+            for factor in factors[criterion]:
+                column_factors.append(factor_table.add(factor))
+                column_weights.append(1.0 if direct else factor_weights[criterion][factor])
+            criterion_starts.append(len(column_factors))
+
+        score_buffer = np.fromiter(
+            (scores[option][criterion][factor] for option in options for criterion in criteria for factor in factors[criterion]),
+            dtype=dtype, count=len(options) * len(column_factors)
+        ).reshape(len(options), len(column_factors))
+
+        return cls(option_table, criterion_table, factor_table, criterion_starts, column_factors, score_buffer,
+                   [criterion_weights[criterion] for criterion in criteria], column_weights)
+
+    # This method converts back to options, criteria, criterion_weights, factors, factor_weights and scores.
+    # The dictionaries share the interned name strings.
+
+    def to_dicts(self):
+        options = list(self.options)
+        criteria = list(self.criteria)
+        criterion_weights = dict(zip(criteria, self.criterion_weights.tolist()))
+        factors = {}
+        factor_weights = {}
+        for j, criterion in enumerate(criteria):
+            start, stop = self.criterion_starts[j], self.criterion_starts[j + 1]
+            factors[criterion] = [self.factors[f] for f in self.column_factors[start:stop].tolist()]
+            factor_weights[criterion] = dict(zip(factors[criterion], self.factor_weights[start:stop].tolist()))
+
+        scores = {}
+        for option, row in zip(options, self.scores.tolist()):
+            scores[option] = {}
+            for j, criterion in enumerate(criteria):
+                start, stop = self.criterion_starts[j], self.criterion_starts[j + 1]
+                scores[option][criterion] = dict(zip(factors[criterion], row[start:stop]))
+        return options, criteria, criterion_weights, factors, factor_weights, scores
+
+    # This method builds a compact model from a DecisionMatrix, sharing its score buffer.
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        factor_table = NameTable()
+        column_factors = [factor_table.add(factor) for _, factor in matrix.columns]
+        return cls(NameTable(matrix.options), NameTable(matrix.criteria), factor_table, matrix.criterion_starts,
+                   column_factors, matrix.scores, matrix.criterion_weights, matrix.factor_weights)
+
+    # This method returns a DecisionMatrix over the same score buffer (converted to float64 if needed).
+
+    def to_matrix(self):
+        columns = [(self.criteria[j], self.factors[f])
+                   for j in range(len(self.criteria))
+                   for f in self.column_factors[self.criterion_starts[j]:self.criterion_starts[j + 1]].tolist()]
+        return DecisionMatrix(self.options.names, self.criteria.names, columns, self.scores,
+                              self.criterion_weights, self.factor_weights)
+
+    # This method returns the score of one cell by name.
+
+    def score(self, option, criterion, factor):
+        j = self.criteria.position(criterion)
+        start, stop = self.criterion_starts[j], self.criterion_starts[j + 1]
+        f = self.factors.position(factor)
+        k = start + int(np.flatnonzero(self.column_factors[start:stop] == f)[0])
+        return self.scores[self.options.position(option), k].item()
+
+    # This method returns the approximate memory held by the model, in bytes.
+
+    def memory_usage(self):
+        total = sum(array.nbytes for array in (self.criterion_starts, self.column_factors, self.scores,
+                                               self.criterion_weights, self.factor_weights))
+        for table in (self.options, self.criteria, self.factors):
+            total += sys.getsizeof(table.names) + sys.getsizeof(table.index) + sum(sys.getsizeof(name) for name in table.names)
+        return total
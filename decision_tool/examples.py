@@ -0,0 +1,315 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# This module holds the three hardcoded examples.
+
+# This function gathers hardcoded values for options, criteria, criterion_weights and scores.
+# Once they have been assigned, the gathered information is all returned.
+
+def simple_2_by_2_example():
+    
+    # Hardcoded values for simple 2 by 2 example
+
+    MIN_SCORE = 0 # reset for consistency with hardcoded scores
+    MAX_SCORE = 5 # reset for consistency with hardcoded scores
+
+    options = [
+        "Project A",
+        "Project B",
+        "Project C"
+    ]
+
+    criteria = [
+        "Cost",
+        "Quality",
+        "Speed"
+    ]
+
+    criterion_weights = {
+        "Cost": 3,
+        "Quality": 5,
+        "Speed": 2
+    }
+
+    # For direct scoring, each criterion is its own "factor"
+    factors = {criterion: [criterion] for criterion in criteria}
+    factor_weights = {criterion: {criterion: 1.0} for criterion in criteria}
+
+    # Structure: scores[option][criterion][criterion] = score
+    scores = {
+        "Project A": {
+            "Cost":    {"Cost":    5},
+            "Quality": {"Quality": 3},
+            "Speed":   {"Speed":   2}
+        },
+        "Project B": {
+            "Cost":    {"Cost":    2},
+            "Quality": {"Quality": 5},
+            "Speed":   {"Speed":   4}
+        },
+        "Project C": {
+            "Cost":    {"Cost":    3},
+            "Quality": {"Quality": 4},
+            "Speed":   {"Speed":   5}
+        }
+    }
+
+    return options, criteria, criterion_weights, factors, factor_weights, scores
+
+# This function gathers hardcoded values for options, criteria, criterion_weights, factors, 
+# factor_weights, and scores.  Once they have been assigned, the gathered information is all returned.
+
+def mixed_factors_example():
+
+    # Hardcoded values for mixed factor example
+    
+    MIN_SCORE = 0
+    MAX_SCORE = 5
+
+    options = [
+        "System Alpha",
+        "System Beta",
+        "System Gamma"
+    ]
+
+    criteria = [
+        "Cost Efficiency",      # 3 factors
+        "User Experience",      # 2 factors
+        "Implementation Time"   # No factors (direct scoring)
+    ]
+
+    criterion_weights = {
+        "Cost Efficiency": 4,
+        "User Experience": 5,
+        "Implementation Time": 3
+    }
+
+    factors = {
+        "Cost Efficiency": ["Hardware Costs", "Maintenance", "Scalability"],
+        "User Experience": ["Learnability", "Satisfaction"],
+        "Implementation Time": ["Implementation Time"]  # Single factor == direct scoring
+    }
+
+    factor_weights = {
+        "Cost Efficiency": {
+            "Hardware Costs": 5,
+            "Maintenance":    3,
+            "Scalability":    4
+        },
+        "User Experience": {
+            "Learnability":   4,
+            "Satisfaction":   5
+        },
+        "Implementation Time": {
+            "Implementation Time": 1.0  # Auto-normalized to 1.0
+        }
+    }
+
+    scores = {
+        "System Alpha": {
+            "Cost Efficiency": {
+                "Hardware Costs": 4,
+                "Maintenance":    3,
+                "Scalability":    2
+            },
+            "User Experience": {
+                "Learnability":   3,
+                "Satisfaction":   4
+            },
+            "Implementation Time": {
+                "Implementation Time": 5
+            }
+        },
+        "System Beta": {
+            "Cost Efficiency": {
+                "Hardware Costs": 2,
+                "Maintenance":    4,
+                "Scalability":    5
+            },
+            "User Experience": {
+                "Learnability":   5,
+                "Satisfaction":   3
+            },
+            "Implementation Time": {
+                "Implementation Time": 3
+            }
+        },
+        "System Gamma": {
+            "Cost Efficiency": {
+                "Hardware Costs": 3,
+                "Maintenance":    3,
+                "Scalability":    4
+            },
+            "User Experience": {
+                "Learnability":   4,
+                "Satisfaction":   5
+            },
+            "Implementation Time": {
+                "Implementation Time": 4
+            }
+        }
+    }
+
+    return options, criteria, criterion_weights, factors, factor_weights, scores
+
+# This function gathers hardcoded values for options, criteria, criterion_weights, factors, 
+# factor_weights, and scores.  Once they have been assigned, the gathered information is all returned.
+
+def garfield_example():
+
+    # Hardcoded values for Garfield example
+
+    MIN_SCORE = 0 # reset for consistency with hardcoded scores
+    MAX_SCORE = 5 # reset for consistency with hardcoded scores
+
+    options = [
+        "Sleep",
+        "Eat cat food", 
+        "Eat Jon's lasagne", 
+        "Hassle Jon",
+        "Prank Odie"
+    ]
+    
+    criteria = ["Relieve tiredness", "Satisfy hunger", "Have fun", "Avoid retaliation/punishment"]
+    
+    criterion_weights = {
+        "Relieve tiredness": 5,
+        "Satisfy hunger": 5,
+        "Have fun": 4,
+        "Avoid retaliation/punishment": 3
+    }
+    
+    factors = {
+        "Relieve tiredness": ["Current tiredness", "Presence of Jon or Odie"],
+        "Satisfy hunger": ["Current hunger level", "Availability of delicious food"],
+        "Have fun": ["Presence of Jon or Odie", "Good idea what to do", "Hilarity of action"],
+        "Avoid retaliation/punishment": ["Shouting danger", "Barking danger", "Biting danger", "Exclusion danger", "Starvation danger"]
+    }
+    
+    factor_weights = {
+        "Relieve tiredness": {"Current tiredness": 5, "Presence of Jon or Odie": 3},
+        "Satisfy hunger": {"Current hunger level": 5, "Availability of delicious food": 4},
+        "Have fun": {"Presence of Jon or Odie": 5, "Good idea what to do": 4, "Hilarity of action": 3},
+        "Avoid retaliation/punishment": {"Shouting danger": 1, "Barking danger": 2, "Biting danger": 4, "Exclusion danger": 4, "Starvation danger": 5}
+    }
+
+    scores = {
+        "Sleep": {
+            "Relieve tiredness": {
+                "Current tiredness":              2,
+                "Presence of Jon or Odie":        0
+                },
+            "Satisfy hunger": {
+                "Current hunger level":           0,
+                "Availability of delicious food": 0
+                },
+            "Have fun": {
+                "Presence of Jon or Odie":        0,
+                "Good idea what to do":           0,
+                "Hilarity of action":             0
+                },
+            "Avoid retaliation/punishment": {
+                "Shouting danger":                4,
+                "Barking danger":                 4,
+                "Biting danger":                  3,
+                "Exclusion danger":               5,
+                "Starvation danger":              5
+                }
+            },
+        "Eat cat food": {
+            "Relieve tiredness": {
+                "Current tiredness":              0,
+                "Presence of Jon or Odie":        0
+                },
+            "Satisfy hunger": {
+                "Current hunger level":           3,
+                "Availability of delicious food": 1
+                },
+            "Have fun": {
+                "Presence of Jon or Odie":        0,
+                "Good idea what to do":           0,
+                "Hilarity of action":             0
+                },
+            "Avoid retaliation/punishment": {
+                "Shouting danger":                5,
+                "Barking danger":                 5,
+                "Biting danger":                  5,
+                "Exclusion danger":               5,
+                "Starvation danger":              5
+                }
+            },
+        "Eat Jon's lasagne": {
+            "Relieve tiredness": {
+                "Current tiredness":              3,
+                "Presence of Jon or Odie":        2
+                },
+            "Satisfy hunger": {
+                "Current hunger level":           3,
+                "Availability of delicious food": 5
+                },
+            "Have fun": {
+                "Presence of Jon or Odie":        2,
+                "Good idea what to do":           2,
+                "Hilarity of action":             1
+                },
+            "Avoid retaliation/punishment": {
+                "Shouting danger":                2,
+                "Barking danger":                 4,
+                "Biting danger":                  4,
+                "Exclusion danger":               2,
+                "Starvation danger":              1
+                }
+            },
+        "Hassle Jon": {
+            "Relieve tiredness": {
+                "Current tiredness":              3,
+                "Presence of Jon or Odie":        5
+                },
+            "Satisfy hunger": {
+                "Current hunger level":           0,
+                "Availability of delicious food": 2
+                },
+            "Have fun": {
+                "Presence of Jon or Odie":        5,
+                "Good idea what to do":           3,
+                "Hilarity of action":             3
+                },
+            "Avoid retaliation/punishment": {
+                "Shouting danger":                1,
+                "Barking danger":                 4,
+                "Biting danger":                  4,
+                "Exclusion danger":               1,
+                "Starvation danger":              1
+                }
+            },
+        "Prank Odie": {
+            "Relieve tiredness": {
+                "Current tiredness":              3,
+                "Presence of Jon or Odie":        5
+                },
+            "Satisfy hunger": {
+                "Current hunger level":           0,
+                "Availability of delicious food": 0
+                },
+            "Have fun": {
+                "Presence of Jon or Odie":        5,
+                "Good idea what to do":           5,
+                "Hilarity of action":             5
+                },
+            "Avoid retaliation/punishment": {
+                "Shouting danger":                3,
+                "Barking danger":                 0,
+                "Biting danger":                  1,
+                "Exclusion danger":               2,
+                "Starvation danger":              4
+                }
+            }
+    }
+
+    # Return all gathered information
+    return options, criteria, criterion_weights, factors, factor_weights, scores
@@ -0,0 +1,233 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The classes and functions below support criteria trees of any depth, e.g. criterion -> sub-criterion ->
+# factor -> sub-factor.  A tree is given as a dictionary where each entry is either a leaf weight or a
+# (weight, children) pair, children being a dictionary of the same form:
+#
+#     tree = {
+#         "Cost": (4, {"Hardware": 5, "Running": (3, {"Energy": 2, "Staff": 1})}),
+#         "Speed": 3,                                   # a leaf at the top level is scored directly
+#     }
+#
+# Weights are normalised among siblings, as normalize_weights does, and the weight of a leaf is the product
+# of the normalised weights down its path.  The tree is compiled once into flat arrays in pre-order, so the
+# leaf weights form one vector, every option's total is one matrix-vector product however deep the tree is,
+# and a subtree (a node and all its descendants) is a contiguous range of nodes and of leaves.
+
+import numpy as np
+
+from .matrix import DecisionMatrix
+
+# This class holds a compiled criteria tree.  Nodes are identified by their path, a tuple of names from the
+# top level down.  leaf_weights holds the flattened weight of every leaf, in the order of leaf_paths.
+
+class CriteriaTree:
+
+    def __init__(self, tree):
+        paths, parents, weights, depths, ends = [], [], [], [], []
+
+        # Iterative pre-order walk, so very deep trees do not hit the recursion limit
+        stack = [(iter(tree.items()), (), -1)]
+        while stack:
+            entries, prefix, parent = stack[-1]
+            entry = next(entries, None)
+            if entry is None:
+                stack.pop()
+                if parent >= 0:
+                    ends[parent] = len(paths)
+                continue
+            name, value = entry
+            children = None
+            if isinstance(value, tuple):
+                if len(value) != 2 or not isinstance(value[1], dict):
+                    raise ValueError(f"Node {prefix + (name,)} must be a weight or a (weight, children) pair.")
+                value, children = value
+                if not children:
+                    raise ValueError(f"Node {prefix + (name,)} has no children (give it a plain weight to make it a leaf).")
+            weight = float(value)
+            if not weight >= 0:
+                raise ValueError(f"Node {prefix + (name,)} has an invalid weight {value!r}; weights must not be negative.")
+
+            node = len(paths)
+            paths.append(prefix + (name,))
+            parents.append(parent)
+            weights.append(weight)
+            depths.append(len(prefix))
+            ends.append(node + 1)
+            if children is not None:
+                stack.append((iter(children.items()), prefix + (name,), node))
+
+        if not paths:
+            raise ValueError("A criteria tree needs at least one criterion.")
+
+        self.paths = paths
+        self.node_index = {path: n for n, path in enumerate(paths)}
+        self.parents = np.array(parents, dtype=np.intp)
+        self.weights = np.array(weights, dtype=float)
+        self.depths = np.array(depths, dtype=np.intp)
+        self.ends = np.array(ends, dtype=np.intp)          # node n's subtree is nodes n to ends[n] - 1
+        self.is_leaf = self.ends == np.arange(len(paths)) + 1
+        self.leaves = np.flatnonzero(self.is_leaf)
+        self.leaf_paths = [paths[n] for n in self.leaves.tolist()]
+        self.leaf_index = {path: i for i, path in enumerate(self.leaf_paths)}
+        self.leaves_before = np.concatenate([[0], np.cumsum(self.is_leaf)])    # leaves among the first n nodes
+
+        # Children of every interior node, and the top-level nodes under the key -1
+        self.children = {}
+        for n, parent in enumerate(parents):
+            self.children.setdefault(parent, []).append(n)
+        self.children = {parent: np.array(nodes, dtype=np.intp) for parent, nodes in self.children.items()}
+
+        self.local_weights = np.empty(len(paths))
+        self.path_weights = np.empty(len(paths))
+        for parent in self.children:
+            self._normalize_children(parent)
+        self._propagate(0, len(paths))
+        self.leaf_weights = self.path_weights[self.leaves]
+
+    # This method normalises the weights of one node's children among themselves.
+
+    def _normalize_children(self, parent):
+        children = self.children[parent]
+        total = self.weights[children].sum()
+        self.local_weights[children] = self.weights[children] / total if total > 0 else self.weights[children]
+
+    # This method recomputes the path weights of nodes start to stop - 1, which must be whole subtrees whose
+    # parents' path weights are up to date.  It works one depth at a time, parents before children.
+
+    def _propagate(self, start, stop):
+        parents = self.parents[start:stop]
+        depths = self.depths[start:stop]
+        for depth in range(depths.min(), depths.max() + 1):
+            nodes = np.flatnonzero(depths == depth) + start
+            parent_weights = np.where(parents[nodes - start] >= 0, self.path_weights[parents[nodes - start]], 1.0)
+            self.path_weights[nodes] = parent_weights * self.local_weights[nodes]
+
+    # This method returns the range of leaves (start, stop) under a node.
+
+    def leaf_range(self, path):
+        n = self.node_index[tuple(path)]
+        return int(self.leaves_before[n]), int(self.leaves_before[self.ends[n]])
+
+    # This method changes the raw weight of one node.  Its siblings' normalised weights change with it, so
+    # the leaves under its parent are recomputed, and only those.  The range of leaves that changed is returned.
+
+    def set_weight(self, path, weight):
+        n = self.node_index[tuple(path)]
+        if not weight >= 0:
+            raise ValueError(f"Weights must not be negative, got {weight}.")
+        self.weights[n] = weight
+        parent = self.parents[n]
+        self._normalize_children(parent)
+        start, stop = (parent + 1, self.ends[parent]) if parent >= 0 else (0, len(self.paths))
+        self._propagate(start, stop)
+
+        leaf_start, leaf_stop = int(self.leaves_before[start]), int(self.leaves_before[stop])
+        self.leaf_weights[leaf_start:leaf_stop] = self.path_weights[self.leaves[leaf_start:leaf_stop]]
+        return leaf_start, leaf_stop
+
+# This class is a decision model scored over the leaves of a criteria tree.  scores is an options x leaves
+# array in the order of tree.leaf_paths.  Like DecisionModel it keeps the totals up to date: a weight change
+# only touches the leaves under the changed node's parent.
+
+class HierarchicalModel:
+
+    def __init__(self, options, tree, scores):
+        self.options = list(options)
+        self.option_index = {option: i for i, option in enumerate(self.options)}
+        self.tree = tree if isinstance(tree, CriteriaTree) else CriteriaTree(tree)
+        self.scores = np.array(scores, dtype=float)
+        if self.scores.shape != (len(self.options), len(self.tree.leaf_paths)):
+            raise ValueError(f"Score array has shape {self.scores.shape}, expected {(len(self.options), len(self.tree.leaf_paths))}.")
+        self.refresh()
+
+    # This method recomputes every total from scratch, e.g. to clear rounding drift after many edits.
+
+    def refresh(self):
+        self.totals = self.scores @ self.tree.leaf_weights
+
+    def total_scores(self):
+        return self.totals
+
+    # This method returns the option scores in the same form as calculate_weighted_scores.
+
+    def option_scores(self):
+        return dict(zip(self.options, self.totals.tolist()))
+
+    # This method returns every option's score on one node of the tree (its normalised subtree score,
+    # before the weights above the node are applied).
+
+    def node_scores(self, path):
+        start, stop = self.tree.leaf_range(path)
+        node_weight = self.tree.path_weights[self.tree.node_index[tuple(path)]]
+        subtotal = self.scores[:, start:stop] @ self.tree.leaf_weights[start:stop]
+        return subtotal / node_weight if node_weight > 0 else subtotal
+
+    # This method changes the raw weight of one node and updates the totals from the leaves that changed.
+
+    def set_weight(self, path, weight):
+        n = self.tree.node_index[tuple(path)]
+        parent = self.tree.parents[n]
+        start, stop = self.tree.leaf_range(self.tree.paths[parent]) if parent >= 0 else (0, len(self.tree.leaf_paths))
+        old_weights = self.tree.leaf_weights[start:stop].copy()
+        self.tree.set_weight(path, weight)
+        self.totals += self.scores[:, start:stop] @ (self.tree.leaf_weights[start:stop] - old_weights)
+
+    # This method changes one score.  Only that option's total is updated.
+
+    def set_score(self, option, leaf_path, score):
+        i = self.option_index[option]
+        k = self.tree.leaf_index[tuple(leaf_path)]
+        self.totals[i] += (score - self.scores[i, k]) * self.tree.leaf_weights[k]
+        self.scores[i, k] = score
+
+    # This method returns the model as a DecisionMatrix in which every leaf is a directly scored criterion
+    # weighted by its flattened weight, so the matrix tools (sensitivity, stability, Pareto filtering and
+    # the other aggregation methods) can run on it.  Leaf names are their paths joined by separator.
+
+    def to_matrix(self, separator=" / "):
+        criteria = [separator.join(map(str, path)) for path in self.tree.leaf_paths]
+        return DecisionMatrix(self.options, criteria, [(criterion, criterion) for criterion in criteria],
+                              self.scores.copy(), self.tree.leaf_weights.copy(), np.ones(len(criteria)))
+
+# This function compiles a model whose scores are nested dictionaries following the tree, i.e.
+# scores[option][name][name]... = score along every leaf's path.
+
+def compile_hierarchical_model(options, tree, scores):
+    tree = tree if isinstance(tree, CriteriaTree) else CriteriaTree(tree)
+
+    def lookup(option, path):
+        value = scores[option]
+        for name in path:
+            value = value[name]
+        return value
+
+    score_matrix = np.fromiter(
+        (lookup(option, path) for option in options for path in tree.leaf_paths),
+        dtype=float, count=len(options) * len(tree.leaf_paths)
+    ).reshape(len(options), len(tree.leaf_paths))
+    return HierarchicalModel(options, tree, score_matrix)
+
+# This function converts the usual two-level model (options, criteria, criterion_weights, factors,
+# factor_weights, scores) into a HierarchicalModel.  Directly scored criteria become top-level leaves.
+
+def hierarchy_from_model(options, criteria, criterion_weights, factors, factor_weights, scores):
+    tree = {}
+    for criterion in criteria:
+        if len(factors[criterion]) == 1 and factors[criterion][0] == criterion:
+            tree[criterion] = criterion_weights[criterion]
+        else:
+            tree[criterion] = (criterion_weights[criterion],
+                               {factor: factor_weights[criterion][factor] for factor in factors[criterion]})
+    tree = CriteriaTree(tree)
+    score_matrix = np.fromiter(
+        (scores[option][path[0]][path[-1]] for option in options for path in tree.leaf_paths),
+        dtype=float, count=len(options) * len(tree.leaf_paths)
+    ).reshape(len(options), len(tree.leaf_paths))
+    return HierarchicalModel(options, tree, score_matrix)
@@ -0,0 +1,118 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+import numpy as np
+
+from .matrix import DecisionMatrix
+from .ranking import Leaderboard
+
+# This class is an editable decision model that keeps its option scores up to date incrementally.
+# It caches, for every option and criterion, the unnormalised factor-weighted subtotal and the resulting
+# criterion score, together with the factor weight total of every criterion and the criterion weight total.
+# Changing one score then touches a single option, and changing one weight touches one criterion column,
+# instead of recomputing every option over every factor.
+
+class DecisionModel:
+
+    def __init__(self, matrix):
+        self.options = matrix.options
+        self.criteria = matrix.criteria
+        self.columns = matrix.columns
+        self.option_index = matrix.option_index
+        self.criterion_index = matrix.criterion_index
+        self.column_index = matrix.column_index
+        self.column_criterion = matrix.column_criterion
+        self.criterion_starts = matrix.criterion_starts
+        self.direct = matrix.direct
+
+        self.scores = np.array(matrix.scores, dtype=float)
+        self.criterion_weights = np.array(matrix.criterion_weights, dtype=float)
+        self.factor_weights = np.where(self.direct[self.column_criterion], 1.0, matrix.factor_weights)
+        self.leaderboard = None
+        self.refresh()
+
+    # This method rebuilds every cached total from scratch, e.g. to clear rounding drift after many edits.
+
+    def refresh(self):
+        self.factor_totals = np.add.reduceat(self.factor_weights, self.criterion_starts[:-1])
+        self.criterion_total = self.criterion_weights.sum()
+        self.subtotals = np.add.reduceat(self.scores * self.factor_weights, self.criterion_starts[:-1], axis=1)
+        self.criterion_scores = self.subtotals / np.where(self.factor_totals > 0, self.factor_totals, 1.0)
+        self.weighted_totals = self.criterion_scores @ self.criterion_weights
+        if self.leaderboard is not None:
+            self.leaderboard.rebuild(self.total_scores())
+
+    # This method returns the total score of every option, normalised like calculate_weighted_scores.
+
+    def total_scores(self):
+        return self.weighted_totals / (self.criterion_total if self.criterion_total > 0 else 1.0)
+
+    # This method returns the option scores in the same form as calculate_weighted_scores.
+
+    def option_scores(self):
+        return dict(zip(self.options, self.total_scores().tolist()))
+
+    # This method changes one score.  Only that option's criterion subtotal and total are updated.
+
+    def set_score(self, option, criterion, factor, score):
+        i = self.option_index[option]
+        k = self.column_index[(criterion, factor)]
+        j = self.column_criterion[k]
+
+        self.subtotals[i, j] += (score - self.scores[i, k]) * self.factor_weights[k]
+        self.scores[i, k] = score
+        criterion_score = self.subtotals[i, j] / (self.factor_totals[j] if self.factor_totals[j] > 0 else 1.0)
+        self.weighted_totals[i] += (criterion_score - self.criterion_scores[i, j]) * self.criterion_weights[j]
+        self.criterion_scores[i, j] = criterion_score
+        if self.leaderboard is not None:
+            self.leaderboard.update(option, self.weighted_totals[i] / (self.criterion_total if self.criterion_total > 0 else 1.0))
+
+    # This method changes the weight of one criterion.  Every option's total moves by the change in
+    # weight times its score on that criterion, and the criterion weight total is adjusted.
+
+    def set_criterion_weight(self, criterion, weight):
+        j = self.criterion_index[criterion]
+        change = weight - self.criterion_weights[j]
+        self.weighted_totals += change * self.criterion_scores[:, j]
+        self.criterion_weights[j] = weight
+        self.criterion_total = self.criterion_weights.sum()
+        if self.leaderboard is not None:
+            self.leaderboard.rebuild(self.total_scores())
+
+    # This method changes the weight of one factor within its criterion.  Only that criterion's
+    # subtotals and scores are updated, for every option.
+
+    def set_factor_weight(self, criterion, factor, weight):
+        j = self.criterion_index[criterion]
+        if self.direct[j]:
+            raise ValueError(f"'{criterion}' is scored directly and has no factor weights.")
+        k = self.column_index[(criterion, factor)]
+
+        self.subtotals[:, j] += (weight - self.factor_weights[k]) * self.scores[:, k]
+        self.factor_weights[k] = weight
+        start, stop = self.criterion_starts[j], self.criterion_starts[j + 1]
+        self.factor_totals[j] = self.factor_weights[start:stop].sum()
+
+        criterion_scores = self.subtotals[:, j] / (self.factor_totals[j] if self.factor_totals[j] > 0 else 1.0)
+        self.weighted_totals += (criterion_scores - self.criterion_scores[:, j]) * self.criterion_weights[j]
+        self.criterion_scores[:, j] = criterion_scores
+        if self.leaderboard is not None:
+            self.leaderboard.rebuild(self.total_scores())
+
+    # This method attaches a Leaderboard that is kept in step with every later edit.
+    # Score edits move a single entry; weight edits change every total and rebuild it.
+
+    def track_leaderboard(self):
+        self.leaderboard = Leaderboard(self.options, self.total_scores())
+        return self.leaderboard
+
+    # This method returns the current state of the model as a DecisionMatrix.
+
+    def to_matrix(self):
+        return DecisionMatrix(self.options, self.criteria, self.columns, self.scores.copy(),
+                              self.criterion_weights.copy(), self.factor_weights.copy())
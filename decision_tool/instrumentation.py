@@ -0,0 +1,221 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions below time the stages of a run (input, loading, normalisation, scoring, rendering and file
+# writing) and count events, so we can see where the time goes.  Instrumentation is off by default; while it
+# is off an instrumented function costs one extra call and a flag check.  It only uses the standard library,
+# so the scoring module can use it without loading anything else.
+#
+#     from decision_tool import instrumentation
+#     instrumentation.enable()
+#     ...                                    # run as usual
+#     print(instrumentation.stats())
+#
+#     with instrumentation.capture("profile.json"):    # also cProfile and tracemalloc
+#         ...
+#
+# Stage times are inclusive: a stage that calls another stage includes its time.  The profiling modules are
+# only imported by capture, so importing this module (and the scoring module with it) stays cheap.  Stages
+# may run on several threads at once (e.g. the batch mode's loading threads): the records are updated
+# under a lock and every thread nests its own stages.  tracemalloc only has one peak for the whole process,
+# so while threads overlap, a stage's peak memory includes what the other threads allocated meanwhile.
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+# This class holds the instrumentation state.  A single module-level instance is used.
+
+class _State:
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()    # guards stages, counters and overall_peak
+        self.stages = {}      # stage -> [calls, total seconds, max seconds, peak memory bytes]
+        self.counters = {}
+        self.overall_peak = 0    # highest traced memory seen before a stage reset the tracemalloc peak
+        self.threads = threading.local()
+        self.generation = 0      # changed by capture, so stacks left open by an earlier capture are dropped
+
+_state = _State()
+
+# This function returns the calling thread's stack of open stages while tracing memory: [memory at entry,
+# peak of finished inner stages] per open stage.
+
+def _memory_stack():
+    threads = _state.threads
+    if getattr(threads, "generation", None) != _state.generation:
+        threads.generation = _state.generation
+        threads.memory = []
+    return threads.memory
+
+# This function switches instrumentation on.
+
+def enable():
+    _state.enabled = True
+
+# This function switches instrumentation off.  The collected statistics are kept.
+
+def disable():
+    _state.enabled = False
+
+def is_enabled():
+    return _state.enabled
+
+# This function discards the collected statistics.
+
+def reset():
+    with _state.lock:
+        _state.stages.clear()
+        _state.counters.clear()
+
+# This function adds to a named counter.
+
+def count(name, amount=1):
+    if _state.enabled:
+        with _state.lock:
+            _state.counters[name] = _state.counters.get(name, 0) + amount
+
+# This function returns the tracemalloc module while it is tracing, and None otherwise.  It never imports
+# tracemalloc itself: if nothing else has, nothing can be tracing.
+
+def _tracing():
+    tracemalloc = sys.modules.get("tracemalloc")
+    return tracemalloc if tracemalloc is not None and tracemalloc.is_tracing() else None
+
+def _start_stage():
+    tracemalloc = _tracing()
+    if tracemalloc is not None:
+        current, peak = tracemalloc.get_traced_memory()
+        with _state.lock:
+            _state.overall_peak = max(_state.overall_peak, peak)    # reset_peak below would lose it
+        tracemalloc.reset_peak()
+        _memory_stack().append([current, 0])
+    return time.perf_counter()
+
+def _finish_stage(stage, start):
+    elapsed = time.perf_counter() - start
+    peak = None
+    memory = _memory_stack()
+    tracemalloc = _tracing() if memory else None
+    if tracemalloc is not None:
+        entry, inner_peak = memory.pop()
+        peak = max(tracemalloc.get_traced_memory()[1], inner_peak)
+        if memory:
+            memory[-1][1] = max(memory[-1][1], peak)
+        peak -= entry
+
+    with _state.lock:
+        record = _state.stages.get(stage)
+        if record is None:
+            record = _state.stages[stage] = [0, 0.0, 0.0, None]
+        record[0] += 1
+        record[1] += elapsed
+        record[2] = max(record[2], elapsed)
+        if peak is not None:
+            record[3] = peak if record[3] is None else max(record[3], peak)
+
+# This function times a block of code as a stage.
+
+@contextmanager
+def timer(stage):
+    if not _state.enabled:
+        yield
+        return
+    start = _start_stage()
+    try:
+        yield
+    finally:
+        _finish_stage(stage, start)
+
+# This function is a decorator that times every call of a function as a stage.
+
+def instrumented(stage):
+    def decorate(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return function(*args, **kwargs)
+            start = _start_stage()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _finish_stage(stage, start)
+        return wrapper
+    return decorate
+
+# This function returns the statistics collected so far: per stage the number of calls, total, mean and
+# maximum seconds, and (when memory was traced) the peak memory allocated during the stage in bytes.
+
+def stats():
+    with _state.lock:
+        records = [(stage, list(record)) for stage, record in _state.stages.items()]
+        counters = dict(_state.counters)
+    stages = {}
+    for stage, (calls, total, longest, peak) in records:
+        stages[stage] = {"calls": calls, "total_seconds": total, "mean_seconds": total / calls,
+                         "max_seconds": longest, "peak_memory_bytes": peak}
+    return {"stages": stages, "counters": counters}
+
+# This function runs a block with instrumentation on, optionally under cProfile and tracemalloc, and writes
+# the statistics to a JSON file at the end, together with the total run time, the overall peak memory and
+# the top_functions functions by cumulative time.  The previous on/off setting is restored afterwards.
+
+@contextmanager
+def capture(path, profile=True, trace_memory=True, top_functions=30):
+    import cProfile
+    import json
+    import tracemalloc
+
+    was_enabled = _state.enabled
+    reset()
+    enable()
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    _state.overall_peak = 0
+    _state.generation += 1
+    profiler = cProfile.Profile() if profile else None
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        result = {"wall_seconds": time.perf_counter() - start}
+        if tracemalloc.is_tracing():
+            result["peak_memory_bytes"] = max(_state.overall_peak, tracemalloc.get_traced_memory()[1])
+        if started_tracing:
+            tracemalloc.stop()
+        _state.generation += 1
+        result.update(stats())
+        if profiler is not None:
+            result["profile"] = _profile_summary(profiler, top_functions)
+        _state.enabled = was_enabled
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+# This function summarises a cProfile run as a list of the functions with the largest cumulative time.
+
+def _profile_summary(profiler, top_functions):
+    import io
+    import pstats
+
+    profile_stats = pstats.Stats(profiler, stream=io.StringIO())
+    rows = []
+    for (filename, line, name), (_, calls, own, cumulative, _) in profile_stats.stats.items():
+        rows.append({"function": f"{filename}:{line}({name})", "calls": calls,
+                     "own_seconds": own, "cumulative_seconds": cumulative})
+    rows.sort(key=lambda row: row["cumulative_seconds"], reverse=True)
+    return rows[:top_functions]
@@ -0,0 +1,192 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# This module holds the interactive side of the tool: the instructions, the prompts for the user's
+# own model and the main program.
+
+import sys
+
+from .examples import garfield_example, mixed_factors_example, simple_2_by_2_example
+from .instrumentation import instrumented
+from .scoring import MAX_SCORE, MIN_SCORE, calculate_score_breakdown
+
+# This function prints the introductory instructions.
+
+def print_instructions():
+    print("""
+             This tool facilitates multi-level criteria analysis to make decisions.\n\n
+             In general, you specify options i, criteria j and factors (sub-criteria) k.\n
+             You then give the criteria overall weights and factors weights within their criteria.\n
+             Finally, you score each option according to the criteria-factor pairs.\n
+             The program computes the weighted score for each option i using:\n\n
+             Total Scoreᵢ = Σⱼ [ CriterionWeightⱼ × Σₖ (Scoreᵢⱼₖ × FactorWeightₖ) ]\n\n
+             The optimal option is that which has the highest weighted score.\n\n
+             Factor specification is flexible, so criteria can have different numbers of factors,\n
+             or even no factors.  If no factors are specified for all criteria the analysis reduces\n
+             to the standard option-criteria decision matrix method.\n\n
+             The user may select one of three hardcoded examples, or input their own data.\n\n
+         """)
+
+# This function prompts the user to enter multiple strings, one per line.
+# Once a blank line is entered, the list of strings is returned.
+  
+def get_list(prompt):
+    print(prompt)
+    items = []
+    while True:
+        item = input()
+        if item == "":
+            break
+        items.append(item)
+    return items
+
+# This function prompts the user to enter options, criteria, criterion_weights, factors, 
+# and factor_weights.  Once it has been entered, the gathered information is all returned.
+
+@instrumented("get_user_input")
+def get_user_input():
+    print("""
+             Specify options that you need to choose from,\n
+             criteria you would use to decide the best option,\n
+             and factors / components of criteria if needed.\n
+          """)
+
+    # Get options
+    options = get_list("Enter your options, one per line. Press Enter on a blank line to finish:")
+
+    # Get criteria
+    criteria = get_list("\nEnter decision criteria, one per line. Press Enter on a blank line to finish:")
+
+    # Get weights for each criterion
+    criterion_weights = {}
+    print("\nAssign a weight to each criterion to reflect its overall importance:")
+    for criterion in criteria:
+        while True:
+            try:
+                value = float(input(f"\nEnter weight ({MIN_SCORE}-{MAX_SCORE}) for overall importance of'{criterion}': "))
+                if MIN_SCORE <= value <= MAX_SCORE:
+                    criterion_weights[criterion] = value
+                    break
+                else:
+                    print(f"Please enter a number between {MIN_SCORE} and {MAX_SCORE}.")
+            except ValueError:
+                print(f"Please enter a valid number between {MIN_SCORE} and {MAX_SCORE}.")
+
+    # Get factors for each criterion
+    factors = {}
+    for criterion in criteria:
+        prompt = f"\nFor '{criterion}', press Enter again for direct scoring, or enter factors, one per line. Press Enter on a blank line to finish:"
+        entered_factors = get_list(prompt)
+        factors[criterion] = entered_factors if entered_factors else [criterion]  # Default to criterion name
+
+    # Get weights for factor-criterion pairs
+    factor_weights = {}
+    for criterion in criteria:
+        factor_weights[criterion] = {}
+        if len(factors[criterion]) == 1 and factors[criterion][0] == criterion:
+            # Auto-set weight to 1 if no factors
+            factor_weights[criterion][criterion] = 1.0
+        else:
+            for factor in factors[criterion]:
+                while True:
+                    try:
+                        value = float(input(
+                            f"\nEnter weight ({MIN_SCORE}-{MAX_SCORE}) for importance of '{factor}' in '{criterion}': "))
+                        if MIN_SCORE <= value <= MAX_SCORE:
+                            factor_weights[criterion][factor] = value
+                            break
+                        else:
+                            print(f"Please enter a number between {MIN_SCORE} and {MAX_SCORE}.")
+                    except ValueError:
+                            print(f"Please enter a valid number between {MIN_SCORE} and {MAX_SCORE}.")
+
+    # Get scores for options in reference to criteria or factor-criterion pairs
+    scores = {}
+    print("\n=== Scoring Phase ===")
+    for option in options:
+        scores[option] = {}
+        print(f"\nScoring '{option}':")
+        for criterion in criteria:
+            scores[option][criterion] = {}
+            if len(factors[criterion]) == 1 and factors[criterion][0] == criterion:
+                # Direct criterion scoring
+                while True:
+                    try:
+                        score = float(input(
+                            f"Score ({MIN_SCORE}-{MAX_SCORE}) for '{option}' considering '{criterion}': "))
+                        if MIN_SCORE <= score <= MAX_SCORE:
+                            scores[option][criterion][criterion] = score
+                            break
+                        else:
+                            print(f"Please enter a number between {MIN_SCORE} and {MAX_SCORE}.")
+                    except ValueError:
+                        print(f"Please enter a valid number between {MIN_SCORE} and {MAX_SCORE}.")
+            else:
+                # Factor-based scoring
+                for factor in factors[criterion]:
+                    while True:
+                        try:
+                            score = float(input(
+                                f"Score ({MIN_SCORE}-{MAX_SCORE}) for '{option}' considering '{factor}' ({criterion}): "))
+                            if MIN_SCORE <= score <= MAX_SCORE:
+                                scores[option][criterion][factor] = score
+                                break
+                            else:
+                                print(f"Please enter a number between {MIN_SCORE} and {MAX_SCORE}.")
+                        except ValueError:
+                            print(f"Please enter a valid number between {MIN_SCORE} and {MAX_SCORE}.")
+
+    # Return all gathered information
+    return options, criteria, criterion_weights, factors, factor_weights, scores
+
+# This function detects if user input is possible in the environment
+
+def input_available():
+    try:
+        return sys.stdin.isatty()
+    except Exception:
+        return False
+
+# This is the main program.
+
+def decision_making_tool():
+
+    print("""
+             Welcome to the Decision-Making Assistant!\n\n
+          """)
+    if input_available():    # prevents crash in environments where user input is not possible
+
+        response = input("Do you need introductory instructions? (Press Enter for no or any other input for yes): ")
+        if response.strip() != "":
+            print_instructions()
+
+        simple = input("Do you want to run the simple 2x2 example? (Press Enter for no or any other input for yes): ")
+        if simple.strip() != "":
+            options, criteria, criterion_weights, factors, factor_weights, scores = simple_2_by_2_example()
+        else:
+            mixed = input("Do you want to run the mixed factor example? (Press Enter for no or any other input for yes): ")
+            if mixed.strip() != "":
+                options, criteria, criterion_weights, factors, factor_weights, scores = mixed_factors_example()
+            else:
+                garfield = input("Do you want to run the Garfield example? (Press Enter for no or any other input for yes): ")
+                if garfield.strip() != "":
+                    options, criteria, criterion_weights, factors, factor_weights, scores = garfield_example()
+                else:
+                    options, criteria, criterion_weights, factors, factor_weights, scores = get_user_input()
+    else:
+        print("\nUser input not available in this environment. Printing instructions and defaulting to the Garfield example.\n")
+        print_instructions()
+        options, criteria, criterion_weights, factors, factor_weights, scores = garfield_example()
+
+    from .report import display_and_save_results
+
+    breakdown = calculate_score_breakdown(options, criteria, criterion_weights, factors, factor_weights, scores)
+    option_scores = breakdown.option_scores
+
+    display_and_save_results(option_scores, scores, criterion_weights, factor_weights, breakdown=breakdown)
+    print("Results saved to decision_results.txt")
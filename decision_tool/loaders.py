@@ -0,0 +1,190 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions and class below load a whole decision model from tables instead of interactive input.
+# Scores come from a long-format table with one row per cell (option, criterion, factor, score) and
+# weights from a table of (criterion, factor, weight) rows, where a blank factor gives the weight of the
+# criterion itself.  A criterion with no factor rows is scored directly, and its score rows may leave the
+# factor blank.  Tables are CSV files, or Parquet files (.parquet / .pq) when pyarrow is installed.
+
+import csv
+from itertools import islice
+
+import numpy as np
+
+from .instrumentation import count, instrumented
+from .matrix import DecisionMatrix
+from .scoring import MAX_SCORE, MIN_SCORE
+
+# This function reads the named columns of a table in chunks, yielding a dictionary of arrays per chunk.
+
+def read_table_chunks(path, columns, chunk_size=100000):
+    if str(path).lower().endswith((".parquet", ".pq")):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet files requires pyarrow (pip install pyarrow).") from None
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+            chunk = {}
+            for name in columns:
+                values = batch.column(name).to_numpy(zero_copy_only=False)
+                if values.dtype == object:
+                    values[np.equal(values, None)] = ""    # null text cells read like blank CSV cells
+                chunk[name] = values
+            yield chunk
+        return
+
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader, [])]
+        missing = [name for name in columns if name not in header]
+        if missing:
+            raise ValueError(f"{path} is missing the column(s): {', '.join(missing)}")
+        positions = [header.index(name) for name in columns]
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                break
+            yield {name: np.array([row[position].strip() if position < len(row) else "" for row in rows], dtype=object)
+                   for name, position in zip(columns, positions)}
+
+# This function converts a column of a chunk to numbers, reporting the first bad row on failure.
+
+def _numeric_column(values, name, first_row):
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        for i, value in enumerate(values):
+            try:
+                float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Row {first_row + i}: '{value}' is not a valid {name}.") from None
+        raise
+
+# This function loads a weights table and returns criteria, criterion_weights, factors and factor_weights
+# in the same form as get_user_input.
+
+@instrumented("load_weights_table")
+def load_weights_table(path):
+    criteria = []
+    criterion_weights = {}
+    factors = {}
+    factor_weights = {}
+    row_number = 2    # first data row, after the header
+    for chunk in read_table_chunks(path, ["criterion", "factor", "weight"]):
+        weights = _numeric_column(chunk["weight"], "weight", row_number)
+        for criterion, factor, weight in zip(chunk["criterion"].tolist(), chunk["factor"].tolist(), weights.tolist()):
+            if criterion not in factors:
+                criteria.append(criterion)
+                factors[criterion] = []
+                factor_weights[criterion] = {}
+            if factor is None or factor == "":
+                criterion_weights[criterion] = weight
+            else:
+                factors[criterion].append(factor)
+                factor_weights[criterion][factor] = weight
+        row_number += len(weights)
+
+    for criterion in criteria:
+        if criterion not in criterion_weights:
+            raise ValueError(f"No weight given for criterion '{criterion}' (a row with a blank factor).")
+        if not factors[criterion]:
+            factors[criterion] = [criterion]    # direct scoring
+            factor_weights[criterion] = {criterion: 1.0}
+    return criteria, criterion_weights, factors, factor_weights
+
+# This class fills a dense score array from chunks of long-format rows.  Options are numbered in order of
+# first appearance, the array grows by doubling, and unfilled cells are kept as NaN so that missing and
+# duplicate cells can be found with array operations.
+
+class ScoreTableBuilder:
+
+    def __init__(self, criteria, factors, min_score=MIN_SCORE, max_score=MAX_SCORE):
+        self.criteria = criteria
+        self.factors = factors
+        self.columns = [(criterion, factor) for criterion in criteria for factor in factors[criterion]]
+        self.column_keys = {f"{criterion}\x1f{factor}": k for k, (criterion, factor) in enumerate(self.columns)}
+        self.direct_criteria = np.array([criterion for criterion in criteria if factors[criterion] == [criterion]], dtype=object)
+        self.min_score = min_score
+        self.max_score = max_score
+        self.options = []
+        self.option_index = {}
+        self.scores = np.full((1024, len(self.columns)), np.nan)
+        self.rows_read = 0
+
+    def add_chunk(self, options, criteria, factors, values):
+        first_row = self.rows_read + 2    # data rows start after the header
+        self.rows_read += len(values)
+        values = _numeric_column(values, "score", first_row)
+
+        out_of_bounds = np.flatnonzero(~((values >= self.min_score) & (values <= self.max_score)))
+        if out_of_bounds.size:
+            i = out_of_bounds[0]
+            raise ValueError(f"{out_of_bounds.size} score(s) outside {self.min_score}-{self.max_score}, "
+                             f"first at row {first_row + i}: {values[i]}")
+
+        # Blank factors of directly scored criteria refer to the criterion itself
+        factors = np.where((factors == "") & np.isin(criteria, self.direct_criteria), criteria, factors)
+        keys, key_positions = np.unique(criteria + "\x1f" + factors, return_inverse=True)
+        key_columns = np.empty(len(keys), dtype=np.intp)
+        for position, key in enumerate(keys.tolist()):
+            if key not in self.column_keys:
+                criterion, factor = key.split("\x1f", 1)
+                raise ValueError(f"Unknown criterion/factor pair ('{criterion}', '{factor}') in the scores table.")
+            key_columns[position] = self.column_keys[key]
+        columns = key_columns[key_positions.ravel()]
+
+        # Number new options in order of first appearance
+        names, first_seen, name_positions = np.unique(options, return_index=True, return_inverse=True)
+        name_rows = np.empty(len(names), dtype=np.intp)
+        for position in np.argsort(first_seen, kind="stable"):
+            name = names[position]
+            if name not in self.option_index:
+                self.option_index[name] = len(self.options)
+                self.options.append(name)
+            name_rows[position] = self.option_index[name]
+        rows = name_rows[name_positions.ravel()]
+
+        if len(self.options) > len(self.scores):
+            grown = np.full((max(len(self.options), 2 * len(self.scores)), len(self.columns)), np.nan)
+            grown[:len(self.scores)] = self.scores
+            self.scores = grown
+
+        cells = rows * len(self.columns) + columns
+        if np.unique(cells).size != cells.size or not np.all(np.isnan(self.scores[rows, columns])):
+            repeated = np.flatnonzero(~np.isnan(self.scores[rows, columns]))
+            if repeated.size == 0:
+                _, first = np.unique(cells, return_index=True)
+                repeated = np.setdiff1d(np.arange(cells.size), first)
+            i = repeated[0]
+            raise ValueError(f"Row {first_row + i}: duplicate score for '{self.options[rows[i]]}' on {self.columns[columns[i]]}.")
+        self.scores[rows, columns] = values
+
+    def scores_array(self):
+        scores = self.scores[:len(self.options)]
+        missing = np.argwhere(np.isnan(scores))
+        if len(missing):
+            i, k = missing[0]
+            raise ValueError(f"{len(missing)} score(s) missing, first for '{self.options[i]}' on {self.columns[k]}.")
+        return scores
+
+# This function loads a scores table and a weights table and builds a DecisionMatrix directly,
+# reading the scores chunk_size rows at a time.
+
+@instrumented("load_decision_tables")
+def load_decision_tables(scores_path, weights_path, chunk_size=100000, min_score=MIN_SCORE, max_score=MAX_SCORE):
+    criteria, criterion_weights, factors, factor_weights = load_weights_table(weights_path)
+    builder = ScoreTableBuilder(criteria, factors, min_score, max_score)
+    for chunk in read_table_chunks(scores_path, ["option", "criterion", "factor", "score"], chunk_size):
+        builder.add_chunk(chunk["option"], chunk["criterion"], chunk["factor"], chunk["score"])
+        count("score_rows_loaded", len(chunk["option"]))
+
+    column_weights = [1.0 if factors[criterion] == [criterion] else factor_weights[criterion][factor]
+                      for criterion, factor in builder.columns]
+    return DecisionMatrix(builder.options, criteria, builder.columns, builder.scores_array(),
+                          [criterion_weights[criterion] for criterion in criteria], column_weights)
@@ -0,0 +1,203 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions and class below provide a compiled "decision matrix" version of calculate_weighted_scores.
+# The nested score dictionaries are flattened once into a dense options x factors array, so that the
+# option totals come from a single matrix-vector product instead of options x criteria x factors lookups.
+
+import numpy as np
+
+from .scoring import ScoreBreakdown
+
+# This class holds a compiled decision model.  Each column of the score array is a (criterion, factor)
+# pair, and columns are laid out criterion by criterion, so the factors of criterion j occupy columns
+# criterion_starts[j] up to criterion_starts[j + 1].  Weights are kept raw and normalised on demand.
+
+class DecisionMatrix:
+
+    def __init__(self, options, criteria, columns, scores, criterion_weights, factor_weights):
+        self.options = list(options)
+        self.criteria = list(criteria)
+        self.columns = [tuple(column) for column in columns]
+        self.scores = np.asarray(scores, dtype=float)
+        self.criterion_weights = np.asarray(criterion_weights, dtype=float)
+        self.factor_weights = np.asarray(factor_weights, dtype=float)
+
+        if self.scores.shape != (len(self.options), len(self.columns)):
+            raise ValueError(f"Score array has shape {self.scores.shape}, expected {(len(self.options), len(self.columns))}.")
+        if self.criterion_weights.shape != (len(self.criteria),):
+            raise ValueError("There must be exactly one criterion weight per criterion.")
+        if self.factor_weights.shape != (len(self.columns),):
+            raise ValueError("There must be exactly one factor weight per (criterion, factor) column.")
+
+        # Index maps back to the names
+        self.option_index = {option: i for i, option in enumerate(self.options)}
+        self.criterion_index = {criterion: j for j, criterion in enumerate(self.criteria)}
+        self.column_index = {column: k for k, column in enumerate(self.columns)}
+
+        # Criterion position of every column, and the first column of every criterion
+        self.column_criterion = np.array([self.criterion_index[criterion] for criterion, _ in self.columns], dtype=np.intp)
+        if np.any(np.diff(self.column_criterion) < 0):
+            raise ValueError("Columns must be grouped criterion by criterion, in the order of the criteria.")
+        self.criterion_starts = np.searchsorted(self.column_criterion, np.arange(len(self.criteria) + 1))
+        if np.any(np.diff(self.criterion_starts) == 0):
+            raise ValueError("Every criterion needs at least one factor (use the criterion itself for direct scoring).")
+
+        # Direct scoring criteria have a single factor named after the criterion
+        self.direct = np.array([
+            self.criterion_starts[j + 1] - self.criterion_starts[j] == 1 and self.columns[self.criterion_starts[j]][1] == criterion
+            for j, criterion in enumerate(self.criteria)
+        ], dtype=bool)
+
+    # This method normalises criterion weights and factor weights (within each criterion) the same way
+    # normalize_weights does.  Both arguments may carry leading dimensions, e.g. one row per scenario.
+
+    def normalized_weights(self, criterion_weights=None, factor_weights=None):
+        criterion_weights = self.criterion_weights if criterion_weights is None else np.asarray(criterion_weights, dtype=float)
+        factor_weights = self.factor_weights if factor_weights is None else np.asarray(factor_weights, dtype=float)
+
+        # Direct scoring criteria are not factor weighted
+        factor_weights = np.where(self.direct[self.column_criterion], 1.0, factor_weights)
+
+        criterion_total = criterion_weights.sum(axis=-1, keepdims=True)
+        norm_criterion_weights = np.divide(criterion_weights, criterion_total, out=criterion_weights.copy(), where=criterion_total > 0)
+
+        factor_total = np.add.reduceat(factor_weights, self.criterion_starts[:-1], axis=-1)[..., self.column_criterion]
+        norm_factor_weights = np.divide(factor_weights, factor_total, out=factor_weights.copy(), where=factor_total > 0)
+
+        return norm_criterion_weights, norm_factor_weights
+
+    # This method returns the effective weight of every column: normalised factor weight x normalised criterion weight.
+
+    def effective_weights(self, criterion_weights=None, factor_weights=None):
+        norm_criterion_weights, norm_factor_weights = self.normalized_weights(criterion_weights, factor_weights)
+        return norm_factor_weights * norm_criterion_weights[..., self.column_criterion]
+
+    # This method computes the total score of every option as one matrix-vector product.
+
+    def total_scores(self, weights=None):
+        if weights is None:
+            weights = self.effective_weights()
+        return self.scores @ weights
+
+    # This method returns the option scores in the same form as calculate_weighted_scores.
+
+    def option_scores(self):
+        return dict(zip(self.options, self.total_scores().tolist()))
+
+    # This method returns the per-criterion scores of every option (options x criteria) before criterion weighting.
+
+    def criterion_scores(self):
+        _, norm_factor_weights = self.normalized_weights()
+        return np.add.reduceat(self.scores * norm_factor_weights, self.criterion_starts[:-1], axis=1)
+
+    # This method returns a ScoreBreakdown of the matrix, as calculate_score_breakdown does for dictionaries.
+
+    def score_breakdown(self):
+        options, criteria, criterion_weights, factors, factor_weights, scores = self.to_model()
+        norm_criterion_weights, norm_factor_weights = self.normalized_weights()
+        criterion_scores = self.criterion_scores()
+        weighted_scores = criterion_scores * norm_criterion_weights
+        totals = weighted_scores.sum(axis=1)
+
+        norm_factor_table = {criterion: {} for criterion in criteria}
+        for (criterion, factor), weight in zip(self.columns, norm_factor_weights.tolist()):
+            norm_factor_table[criterion][factor] = weight
+        return ScoreBreakdown(
+            options, criteria, factors, criterion_weights, factor_weights, scores,
+            dict(zip(criteria, norm_criterion_weights.tolist())), norm_factor_table,
+            {option: dict(zip(criteria, row)) for option, row in zip(options, criterion_scores.tolist())},
+            {option: dict(zip(criteria, row)) for option, row in zip(options, weighted_scores.tolist())},
+            dict(zip(options, totals.tolist()))
+        )
+
+    # This method returns a DecisionMatrix with only the options at the given row indices, in that order.
+
+    def select_options(self, indices):
+        indices = np.asarray(indices, dtype=np.intp)
+        return DecisionMatrix([self.options[i] for i in indices.tolist()], self.criteria, self.columns,
+                              self.scores[indices], self.criterion_weights, self.factor_weights)
+
+    # This method converts the matrix back to options, criteria, criterion_weights, factors, factor_weights and scores.
+
+    def to_model(self):
+        criterion_weights = dict(zip(self.criteria, self.criterion_weights.tolist()))
+        factors = {criterion: [] for criterion in self.criteria}
+        factor_weights = {criterion: {} for criterion in self.criteria}
+        for (criterion, factor), weight in zip(self.columns, self.factor_weights.tolist()):
+            factors[criterion].append(factor)
+            factor_weights[criterion][factor] = weight
+        scores = {}
+        for option, row in zip(self.options, self.scores.tolist()):
+            scores[option] = {criterion: {} for criterion in self.criteria}
+            for (criterion, factor), score in zip(self.columns, row):
+                scores[option][criterion][factor] = score
+        return list(self.options), list(self.criteria), criterion_weights, factors, factor_weights, scores
+
+# This function compiles options, criteria, criterion_weights, factors, factor_weights and scores
+# (as returned by the examples or get_user_input) into a DecisionMatrix.
+
+def compile_decision_matrix(options, criteria, criterion_weights, factors, factor_weights, scores):
+    columns = [(criterion, factor) for criterion in criteria for factor in factors[criterion]]
+
+    score_matrix = np.fromiter(
+        (scores[option][criterion][factor] for option in options for criterion, factor in columns),
+        dtype=float, count=len(options) * len(columns)
+    ).reshape(len(options), len(columns))
+
+    column_weights = []
+    for criterion, factor in columns:
+        if len(factors[criterion]) == 1 and factors[criterion][0] == criterion:
+            column_weights.append(1.0)    # direct scoring, no factor weighting
+        else:
+            column_weights.append(factor_weights[criterion][factor])
+
+    return DecisionMatrix(options, criteria, columns, score_matrix,
+                          [criterion_weights[criterion] for criterion in criteria], column_weights)
+
+# This function lines up a list of weight profiles (one per scenario) with the columns of a DecisionMatrix.
+# criterion_weight_profiles is a list of {criterion: weight} dictionaries and factor_weight_profiles a list of
+# {criterion: {factor: weight}} dictionaries, as used everywhere else.  Either may be None to keep the
+# matrix's own weights.  Two arrays are returned, of shape (scenarios, criteria) and (scenarios, columns).
+
+def stack_weight_profiles(matrix, criterion_weight_profiles=None, factor_weight_profiles=None):
+    if criterion_weight_profiles is None and factor_weight_profiles is None:
+        raise ValueError("At least one list of weight profiles is needed.")
+    if criterion_weight_profiles is not None and factor_weight_profiles is not None \
+            and len(criterion_weight_profiles) != len(factor_weight_profiles):
+        raise ValueError("There must be the same number of criterion and factor weight profiles.")
+
+    if criterion_weight_profiles is None:
+        criterion_weight_array = np.tile(matrix.criterion_weights, (len(factor_weight_profiles), 1))
+    else:
+        criterion_weight_array = np.array(
+            [[profile[criterion] for criterion in matrix.criteria] for profile in criterion_weight_profiles],
+            dtype=float
+        ).reshape(len(criterion_weight_profiles), len(matrix.criteria))
+
+    if factor_weight_profiles is None:
+        factor_weight_array = np.tile(matrix.factor_weights, (len(criterion_weight_profiles), 1))
+    else:
+        factor_weight_array = np.array(
+            [[1.0 if matrix.direct[matrix.criterion_index[criterion]] else profile[criterion][factor]
+              for criterion, factor in matrix.columns]
+             for profile in factor_weight_profiles],
+            dtype=float
+        ).reshape(len(factor_weight_profiles), len(matrix.columns))
+
+    return criterion_weight_array, factor_weight_array
+
+# This function scores every option under many weight scenarios at once.  The weights are arrays with one
+# row per scenario (see stack_weight_profiles); a 1-D array applies the same weights to every scenario and
+# None keeps the matrix's own weights.  Normalisation is done for all scenarios together, and the result
+# is an options x scenarios array computed with a single matrix product.
+
+def evaluate_weight_scenarios(matrix, criterion_weights=None, factor_weights=None):
+    weights = matrix.effective_weights(criterion_weights, factor_weights)
+    weights = weights.reshape(-1, len(matrix.columns))
+    return matrix.scores @ weights.T
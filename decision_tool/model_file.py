@@ -0,0 +1,70 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions below save a DecisionMatrix in a compact binary file and load it back.  The file holds
+# a small JSON header (names, weights, shape) followed by the scores as one contiguous little-endian
+# float64 block aligned to 64 bytes, so the block can be memory-mapped read-only instead of parsed.
+# Processes that map the same file share its pages in the operating system's page cache.
+
+import json
+import struct
+
+import numpy as np
+
+from .instrumentation import instrumented
+from .matrix import DecisionMatrix
+
+MODEL_FILE_MAGIC = b"DTMODEL\x01"
+MODEL_FILE_ALIGNMENT = 64
+
+# This function writes a DecisionMatrix to a binary model file, a block of rows at a time.
+
+def save_decision_matrix(matrix, path, rows_per_block=65536):
+    header = {
+        "options": matrix.options,
+        "criteria": matrix.criteria,
+        "columns": [list(column) for column in matrix.columns],
+        "criterion_weights": matrix.criterion_weights.tolist(),
+        "factor_weights": matrix.factor_weights.tolist(),
+        "shape": list(matrix.scores.shape),
+        "dtype": "<f8",
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    prefix_length = len(MODEL_FILE_MAGIC) + 8 + len(header_bytes)
+    padding = -prefix_length % MODEL_FILE_ALIGNMENT
+
+    with open(path, "wb") as f:
+        f.write(MODEL_FILE_MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes) + padding))
+        f.write(header_bytes)
+        f.write(b" " * padding)    # JSON ignores trailing whitespace
+        for start in range(0, matrix.scores.shape[0], rows_per_block):
+            f.write(np.ascontiguousarray(matrix.scores[start:start + rows_per_block], dtype="<f8").tobytes())
+
+# This function loads a binary model file.  With mmap=True the score array is a read-only memory map
+# of the file, so loading costs only the header and scores are paged in as they are used.
+
+@instrumented("load_decision_matrix")
+def load_decision_matrix(path, mmap=True):
+    with open(path, "rb") as f:
+        if f.read(len(MODEL_FILE_MAGIC)) != MODEL_FILE_MAGIC:
+            raise ValueError(f"{path} is not a decision model file.")
+        (header_length,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_length).decode("utf-8"))
+        offset = f.tell()
+
+        shape = tuple(header["shape"])
+        if shape[0] * shape[1] == 0:
+            scores = np.zeros(shape)
+        elif mmap:
+            scores = np.memmap(path, dtype=header["dtype"], mode="r", offset=offset, shape=shape)
+        else:
+            scores = np.fromfile(f, dtype=header["dtype"], count=shape[0] * shape[1]).reshape(shape)
+
+    return DecisionMatrix(header["options"], header["criteria"], header["columns"], scores,
+                          header["criterion_weights"], header["factor_weights"])
@@ -0,0 +1,113 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions and class below spread scenario and sensitivity workloads over a pool of processes.
+# The score array is copied once into shared memory, and every worker maps it instead of receiving
+# a pickled copy with each task.  Only the weights of each shard travel to the workers.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .matrix import DecisionMatrix, evaluate_weight_scenarios
+from .sensitivity import SensitivityAccumulator, accumulate_weight_draws
+
+_worker_memory = None
+_worker_matrix = None
+
+# This function runs once in every worker process and attaches it to the shared score array.
+# Workers index options by position only, so the option names are not sent to them.
+
+def _attach_shared_matrix(memory_name, shape, criteria, columns, criterion_weights, factor_weights):
+    global _worker_memory, _worker_matrix
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    scores = np.ndarray(shape, dtype=float, buffer=_worker_memory.buf)
+    _worker_matrix = DecisionMatrix(range(shape[0]), criteria, columns, scores, criterion_weights, factor_weights)
+
+def _evaluate_scenario_shard(criterion_weights, factor_weights):
+    return evaluate_weight_scenarios(_worker_matrix, criterion_weights, factor_weights)
+
+def _sensitivity_shard(draws, seed, max_rank, chunk_size, sampling):
+    accumulator = SensitivityAccumulator(_worker_matrix.options, max_rank)
+    return accumulate_weight_draws(_worker_matrix, accumulator, draws, np.random.default_rng(seed), chunk_size, **sampling)
+
+# This class runs evaluate_weight_scenarios and weight_sensitivity_analysis on a process pool.
+# Use it as a context manager (or call close) so the pool and the shared memory are released.
+
+class ParallelScenarioExecutor:
+
+    def __init__(self, matrix, workers=None):
+        self.matrix = matrix
+        self.workers = workers or os.cpu_count() or 1
+
+        self._memory = shared_memory.SharedMemory(create=True, size=max(matrix.scores.nbytes, 1))
+        shared_scores = np.ndarray(matrix.scores.shape, dtype=float, buffer=self._memory.buf)
+        shared_scores[...] = matrix.scores
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_attach_shared_matrix,
+            initargs=(self._memory.name, matrix.scores.shape, matrix.criteria, matrix.columns,
+                      matrix.criterion_weights, matrix.factor_weights)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._memory.close()
+            self._memory.unlink()
+
+    # This method is the parallel version of evaluate_weight_scenarios.  Scenarios are split into
+    # contiguous shards, one or more per worker, and the results are joined back in scenario order.
+
+    def evaluate_weight_scenarios(self, criterion_weights=None, factor_weights=None, shards=None):
+        criterion_weights = self.matrix.criterion_weights if criterion_weights is None else np.asarray(criterion_weights, dtype=float)
+        factor_weights = self.matrix.factor_weights if factor_weights is None else np.asarray(factor_weights, dtype=float)
+        counts = {len(weights) for weights in (criterion_weights, factor_weights) if weights.ndim == 2}
+        if len(counts) > 1:
+            raise ValueError("There must be the same number of criterion and factor weight scenarios.")
+        scenario_count = counts.pop() if counts else 1
+        if scenario_count == 0:
+            return np.empty((len(self.matrix.options), 0))
+        criterion_weights = np.broadcast_to(criterion_weights, (scenario_count, len(self.matrix.criteria)))
+        factor_weights = np.broadcast_to(factor_weights, (scenario_count, len(self.matrix.columns)))
+
+        bounds = np.linspace(0, scenario_count, min(shards or self.workers, scenario_count) + 1).astype(int)
+        futures = [
+            self._pool.submit(_evaluate_scenario_shard, criterion_weights[start:stop], factor_weights[start:stop])
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        return np.concatenate([future.result() for future in futures], axis=1)
+
+    # This method is the parallel version of weight_sensitivity_analysis.  Draws are split into shards of
+    # shard_draws, each with its own seed spawned from seed, and the shard statistics are merged in shard
+    # order.  The result therefore depends on seed and shard_draws but not on the number of workers.
+
+    def weight_sensitivity_analysis(self, draws=100000, distribution="dirichlet", concentration=100.0, spread=0.1,
+                                    vary="both", max_rank=10, chunk_size=None, seed=None, shard_draws=50000):
+        sampling = dict(distribution=distribution, concentration=concentration, spread=spread, vary=vary)
+        shard_sizes = [shard_draws] * (draws // shard_draws) + ([draws % shard_draws] if draws % shard_draws else [])
+        seeds = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+
+        futures = [
+            self._pool.submit(_sensitivity_shard, size, shard_seed, max_rank, chunk_size, sampling)
+            for size, shard_seed in zip(shard_sizes, seeds)
+        ]
+        accumulator = SensitivityAccumulator(self.matrix.options, max_rank)
+        for future in futures:
+            accumulator.merge(future.result())
+        return accumulator
@@ -0,0 +1,117 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions below find the Pareto front (skyline) of a large option set: the options that no other
+# option dominates, i.e. beats on at least one criterion without doing worse on any.  A dominated option
+# can never be the best under any positive criterion weights, so scoring, sensitivity analysis and the
+# reports can be run on the front alone.
+#
+# pareto_front uses a blocked sort-filter-skyline algorithm.  Points are sorted so that a point can only be
+# dominated by points before it, then processed a block at a time: each block is checked against the front
+# found so far and against itself with array comparisons.  Before each block, every remaining point that the
+# current front's best worst-case point beats outright is dropped, which ends the scan early on the usual
+# inputs where most options are dominated.
+
+import numpy as np
+
+# This function returns, for every row of candidates, whether some row of dominators dominates it.  The
+# strict part of the test is only done for the pairs that pass the cheaper "at least as good everywhere" test.
+
+def _dominated_by(dominators, candidates):
+    at_least_as_good = (dominators[:, None, :] >= candidates).all(axis=2)
+    d, c = np.nonzero(at_least_as_good)
+    strictly_better = (dominators[d] > candidates[c]).any(axis=1)
+    dominated = np.zeros(len(candidates), dtype=bool)
+    dominated[c[strictly_better]] = True
+    return dominated
+
+# This function returns the indices (in increasing order) of the non-dominated rows of points, a
+# options x criteria array where higher is better.  Equal rows do not dominate each other, so duplicates
+# on the front are all kept.
+
+def pareto_front(points, block_size=1024):
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2:
+        raise ValueError(f"Points must be a 2-D options x criteria array, got shape {points.shape}.")
+    if np.isnan(points).any():
+        raise ValueError("Points must not contain NaN.")
+    count, dimensions = points.shape
+    if count == 0 or dimensions == 0:
+        return np.arange(count)
+
+    # Best sum first, ties broken lexicographically (best first), so a dominating point always comes
+    # before the points it dominates
+    keys = [-points[:, d] for d in range(dimensions - 1, -1, -1)] + [-points.sum(axis=1)]
+    order = np.lexsort(keys)
+    worst = points.min(axis=1)
+    best = points.max(axis=1)
+
+    front = []    # indices into points
+    front_points = np.empty((0, dimensions))
+    stop_value = -np.inf    # largest worst-case value on the front
+    remaining = order
+    while len(remaining):
+        block, remaining = remaining[:block_size], remaining[block_size:]
+        candidates = points[block]
+
+        # Against the front found so far.  The front is in the order it was found, so its first points
+        # have the best sums and dominate the most; they are checked first, in slices that grow as the
+        # surviving candidates shrink.
+        position, step = 0, 32
+        while position < len(front_points) and len(block):
+            chunk = front_points[position:position + step]
+            survivors = ~_dominated_by(chunk, candidates)
+            block, candidates = block[survivors], candidates[survivors]
+            position += step
+            step = min(2 * step, max(32, 2 ** 22 // max(len(block) * dimensions, 1)))
+
+        # Within the block, in slices of dominators as large as the front check's
+        dominated = np.zeros(len(block), dtype=bool)
+        step = max(1, 2 ** 22 // max(len(block) * dimensions, 1))
+        for position in range(0, len(block), step):
+            dominated |= _dominated_by(candidates[position:position + step], candidates)
+        block, candidates = block[~dominated], candidates[~dominated]
+
+        front.extend(block.tolist())
+        front_points = np.vstack([front_points, candidates])
+
+        # Points whose best value is below the stop point's worst value are dominated by it
+        if len(block) and worst[block].max() > stop_value:
+            stop_value = worst[block].max()
+            remaining = remaining[best[remaining] >= stop_value]
+    return np.sort(np.array(front, dtype=np.intp))
+
+# This function returns the points the Pareto front of a DecisionMatrix is computed on.  At the "criteria"
+# level these are the options' criterion scores, whose front holds every option that can win under some
+# criterion weights; at the "factors" level they are the raw scores, whose front holds every option that
+# can win under some criterion and factor weights.
+
+def dominance_points(matrix, level="criteria"):
+    if level == "criteria":
+        return matrix.criterion_scores()
+    elif level == "factors":
+        return matrix.scores
+    raise ValueError(f"Unknown dominance level '{level}', expected 'criteria' or 'factors'.")
+
+# This function returns the non-dominated options of a matrix as a new DecisionMatrix, together with their
+# row indices in the original matrix.
+
+def pareto_filter(matrix, level="criteria", block_size=1024):
+    front = pareto_front(dominance_points(matrix, level), block_size)
+    return matrix.select_options(front), front
+
+# This function returns options, criteria, criterion_weights, factors, factor_weights and scores with only
+# the non-dominated options kept, ready for calculate_weighted_scores and display_results.
+
+def pareto_filter_model(options, criteria, criterion_weights, factors, factor_weights, scores, level="criteria"):
+    from .matrix import compile_decision_matrix
+
+    matrix = compile_decision_matrix(options, criteria, criterion_weights, factors, factor_weights, scores)
+    front = pareto_front(dominance_points(matrix, level))
+    front_options = [matrix.options[i] for i in front.tolist()]
+    return front_options, criteria, criterion_weights, factors, factor_weights, {option: scores[option] for option in front_options}
@@ -0,0 +1,107 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions and class below rank options without sorting all of them.
+
+import heapq
+from bisect import bisect_left, insort
+
+from .scoring import TIE_TOLERANCE
+
+# This function groups (option, score) pairs, already sorted best first, into ties.  Like display_results,
+# an option is tied with a group when its score is within tolerance of the group's best score.
+
+def group_ties(ranked, tolerance=TIE_TOLERANCE):
+    groups = []
+    for option, score in ranked:
+        if groups and abs(groups[-1][0] - score) < tolerance:
+            groups[-1][1].append(option)
+        else:
+            groups.append((score, [option]))
+    return groups
+
+# This function returns the best k options as a list of (score, [options]) tie groups, best first.
+# option_scores is either a dictionary (as from calculate_weighted_scores) or an array of totals lined
+# up with options (as from DecisionMatrix.total_scores).  Options tied with the k-th best are included,
+# so the groups may hold slightly more than k options.
+
+def top_k_options(option_scores, k=10, options=None, tolerance=TIE_TOLERANCE):
+    if k <= 0:
+        return []
+
+    if isinstance(option_scores, dict):
+        if len(option_scores) <= k:
+            cutoff = min(option_scores.values(), default=0.0)
+        else:
+            cutoff = heapq.nlargest(k, option_scores.values())[-1]
+        ranked = [(option, score) for option, score in option_scores.items() if score > cutoff - tolerance]
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return group_ties(ranked, tolerance)
+
+    import numpy as np    # only needed for arrays of totals
+
+    totals = np.asarray(option_scores, dtype=float)
+    if totals.size == 0:
+        return []
+    if totals.size <= k:
+        cutoff = totals.min()
+    else:
+        cutoff = totals[np.argpartition(totals, totals.size - k)[totals.size - k]]
+    candidates = np.flatnonzero(totals > cutoff - tolerance)
+    candidates = candidates[np.argsort(-totals[candidates], kind="stable")]
+    names = options if options is not None else range(totals.size)
+    return group_ties(((names[i], totals[i].item()) for i in candidates), tolerance)
+
+# This class keeps options ordered by score as individual scores change, without re-sorting.
+# Entries are (-score, position) keys in a sorted list, so ties keep the original option order.
+
+class Leaderboard:
+
+    def __init__(self, options, totals):
+        self.options = list(options)
+        self.position = {option: i for i, option in enumerate(self.options)}
+        self.rebuild(totals)
+
+    # This method replaces every score at once, e.g. after a weight change.
+
+    def rebuild(self, totals):
+        self.totals = [float(total) for total in totals]
+        self._keys = sorted((-total, i) for i, total in enumerate(self.totals))
+
+    # This method moves one option to its new place in O(log n) search plus a list shift.
+
+    def update(self, option, total):
+        i = self.position[option]
+        del self._keys[bisect_left(self._keys, (-self.totals[i], i))]
+        self.totals[i] = float(total)
+        insort(self._keys, (-self.totals[i], i))
+
+    # This method returns the rank of an option, counting from 1.
+
+    def rank(self, option):
+        i = self.position[option]
+        return bisect_left(self._keys, (-self.totals[i], i)) + 1
+
+    # This method returns the best k options as (score, [options]) tie groups, like top_k_options.
+
+    def top(self, k=10, tolerance=TIE_TOLERANCE):
+        if k <= 0 or not self._keys:
+            return []
+        cutoff = -self._keys[min(k, len(self._keys)) - 1][0]
+        ranked = []
+        for negative_total, i in self._keys:
+            if -negative_total <= cutoff - tolerance:
+                break
+            ranked.append((self.options[i], -negative_total))
+        return group_ties(ranked, tolerance)
+
+    # This method returns the group of best options and their score.
+
+    def best(self, tolerance=TIE_TOLERANCE):
+        groups = self.top(1, tolerance)
+        return groups[0] if groups else None
@@ -0,0 +1,229 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions and classes below handle group decisions: a panel of raters each scores every option on
+# every (criterion, factor) column of the same model.  The scores are held as one raters x options x columns
+# array; they are combined into a consensus DecisionMatrix in one array pass, and every rater's own totals
+# and ranking, and statistics of how far the raters agree, are computed alongside.
+
+import numpy as np
+
+from .matrix import DecisionMatrix, compile_decision_matrix
+from .scoring import MIN_SCORE
+
+RATER_AGGREGATIONS = ("mean", "median", "geometric", "trimmed")
+
+# This class holds the scores of a rater panel.  matrix gives the options, criteria, columns and weights
+# shared by every rater (its own scores are not used), scores is a raters x options x columns array, and
+# rater_weights says how much each rater counts (equal by default).
+
+class RaterPanel:
+
+    def __init__(self, matrix, raters, scores, rater_weights=None):
+        self.matrix = matrix
+        self.raters = list(raters)
+        self.scores = np.asarray(scores, dtype=float)
+        expected = (len(self.raters), len(matrix.options), len(matrix.columns))
+        if self.scores.shape != expected:
+            raise ValueError(f"Rater score array has shape {self.scores.shape}, expected {expected}.")
+        self.rater_weights = normalize_rater_weights(rater_weights, len(self.raters))
+
+# This function returns rater weights that add up to 1; None gives every rater the same weight.
+
+def normalize_rater_weights(rater_weights, rater_count):
+    if rater_count == 0:
+        raise ValueError("A panel needs at least one rater.")
+    if rater_weights is None:
+        return np.full(rater_count, 1.0 / rater_count)
+    weights = np.asarray(rater_weights, dtype=float)
+    if weights.shape != (rater_count,):
+        raise ValueError(f"There must be exactly one weight per rater ({rater_count}).")
+    if np.any(weights < 0) or weights.sum() <= 0:
+        raise ValueError("Rater weights must not be negative and must not all be zero.")
+    return weights / weights.sum()
+
+# This function compiles a panel from the usual model arguments, with rater_scores a {rater: scores}
+# dictionary holding one scores dictionary (as from get_user_input) per rater.  rater_weights is
+# None, a list in rater order or a {rater: weight} dictionary.
+
+def compile_rater_panel(options, criteria, criterion_weights, factors, factor_weights, rater_scores, rater_weights=None):
+    raters = list(rater_scores)
+    if not raters:
+        raise ValueError("A panel needs at least one rater.")
+    matrix = compile_decision_matrix(options, criteria, criterion_weights, factors, factor_weights, rater_scores[raters[0]])
+    scores = np.empty((len(raters), len(matrix.options), len(matrix.columns)))
+    scores[0] = matrix.scores
+    for r, rater in enumerate(raters[1:], start=1):
+        rater_table = rater_scores[rater]
+        scores[r] = np.fromiter(
+            (rater_table[option][criterion][factor] for option in matrix.options for criterion, factor in matrix.columns),
+            dtype=float, count=scores[r].size
+        ).reshape(scores[r].shape)
+    if isinstance(rater_weights, dict):
+        rater_weights = [rater_weights[rater] for rater in raters]
+    return RaterPanel(matrix, raters, scores, rater_weights)
+
+# This function combines a raters x ... array of scores over its first axis with normalised rater weights.
+#     "mean"       weighted mean
+#     "median"     weighted median (the ordinary median for equal weights)
+#     "geometric"  weighted geometric mean, on scores shifted so the lowest possible score is 1 (a score of
+#                  0 would otherwise zero the result), then shifted back
+#     "trimmed"    weighted mean after dropping the lowest and highest trim share of the rater weight
+#                  in every cell
+
+def aggregate_rater_scores(scores, rater_weights, method="mean", trim=0.1, min_score=MIN_SCORE):
+    scores = np.asarray(scores, dtype=float)
+    weights = np.asarray(rater_weights, dtype=float).reshape((-1,) + (1,) * (scores.ndim - 1))
+    if method == "mean":
+        return (scores * weights).sum(axis=0)
+    elif method == "geometric":
+        return np.exp((np.log(scores - min_score + 1.0) * weights).sum(axis=0)) + min_score - 1.0
+    elif method not in ("median", "trimmed"):
+        raise ValueError(f"Unknown aggregation '{method}', expected one of {', '.join(RATER_AGGREGATIONS)}.")
+
+    # Both remaining methods work on each cell's scores in increasing order, with the rater weights carried
+    # along.  The rater axis is moved last so the sort runs over contiguous memory; the order of equal
+    # scores does not change either result, so an unstable sort is fine.
+    cells = np.ascontiguousarray(np.moveaxis(scores, 0, -1))
+    order = np.argsort(cells, axis=-1)
+    ordered = np.take_along_axis(cells, order, axis=-1)
+    ordered_weights = np.asarray(rater_weights, dtype=float)[order]
+    upper = np.cumsum(ordered_weights, axis=-1)
+
+    if method == "median":
+        # The first score whose cumulative weight reaches one half; averaged with the next one when it
+        # reaches exactly one half, as the ordinary median does for an even count
+        first = np.argmax(upper >= 0.5 - 1e-12, axis=-1)[..., None]
+        median = np.take_along_axis(ordered, first, axis=-1)[..., 0]
+        exact = np.isclose(np.take_along_axis(upper, first, axis=-1)[..., 0], 0.5)
+        following = np.take_along_axis(ordered, np.minimum(first + 1, ordered.shape[-1] - 1), axis=-1)[..., 0]
+        return np.where(exact, (median + following) / 2, median)
+
+    if not 0 <= trim < 0.5:
+        raise ValueError(f"The trim share must be at least 0 and below 0.5, got {trim}.")
+    kept = np.clip(np.minimum(upper, 1.0 - trim) - np.maximum(upper - ordered_weights, trim), 0.0, None)
+    return np.einsum("...r,...r->...", ordered, kept) / kept.sum(axis=-1)
+
+# This function returns the ranks (1 = best) of every row of totals, with tied options sharing the average
+# of their ranks.
+
+def average_ranks(totals):
+    totals = np.atleast_2d(totals)
+    ranks = np.empty(totals.shape)
+    for r, row in enumerate(totals):
+        ascending = np.sort(row)
+        below = np.searchsorted(ascending, row, side="left")
+        at_or_below = np.searchsorted(ascending, row, side="right")
+        ranks[r] = len(row) - (below + at_or_below - 1) / 2
+    return ranks
+
+# This function returns Kendall's coefficient of concordance W (0 = no agreement, 1 = identical rankings)
+# for a raters x options array of ranks, with the usual correction for tied ranks.
+
+def kendalls_w(ranks):
+    raters, options = ranks.shape
+    if raters < 2 or options < 2:
+        return 1.0
+    rank_sums = ranks.sum(axis=0)
+    spread = ((rank_sums - rank_sums.mean()) ** 2).sum()
+    ties = 0.0
+    for row in ranks:
+        _, counts = np.unique(row, return_counts=True)
+        ties += (counts ** 3 - counts).sum()
+    denominator = raters ** 2 * (options ** 3 - options) - raters * ties
+    return float(12 * spread / denominator) if denominator > 0 else 1.0
+
+# This function returns the Spearman rank correlation between every pair of rows of ranks.  Rows with no
+# variation (every option tied) have no correlation and give NaN.
+
+def rank_correlations(ranks):
+    centred = ranks - ranks.mean(axis=1, keepdims=True)
+    norms = np.sqrt((centred * centred).sum(axis=1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (centred @ centred.T) / np.outer(norms, norms)
+
+# This class holds the result of a panel analysis: the consensus matrix and totals, each rater's totals
+# and ranks, and the agreement statistics.
+
+class PanelResult:
+
+    def __init__(self, panel, method, consensus, consensus_totals, rater_totals, rater_ranks, consensus_ranks,
+                 score_spread, concordance, rater_correlations, consensus_correlations, top_choice_agreement):
+        self.panel = panel
+        self.method = method
+        self.consensus = consensus                              # DecisionMatrix of the aggregated scores
+        self.consensus_totals = consensus_totals                # options
+        self.rater_totals = rater_totals                        # raters x options
+        self.rater_ranks = rater_ranks                          # raters x options, 1 = best, ties averaged
+        self.consensus_ranks = consensus_ranks                  # options
+        self.score_spread = score_spread                        # options x columns, weighted std across raters
+        self.concordance = concordance                          # Kendall's W over the rater rankings
+        self.rater_correlations = rater_correlations            # raters x raters Spearman correlations
+        self.consensus_correlations = consensus_correlations    # raters, Spearman correlation with the consensus
+        self.top_choice_agreement = top_choice_agreement        # share of rater weight whose best option is the consensus best
+
+    # This method returns the mean Spearman correlation over all pairs of different raters.
+
+    def mean_rater_correlation(self):
+        count = len(self.rater_correlations)
+        if count < 2:
+            return 1.0
+        off_diagonal = self.rater_correlations[~np.eye(count, dtype=bool)]
+        return float(np.nanmean(off_diagonal)) if not np.isnan(off_diagonal).all() else float("nan")
+
+# This function aggregates a panel's scores into a consensus and computes every rater's totals and ranks
+# and the agreement statistics.  Criterion and factor weights are the panel matrix's.
+
+def analyse_panel(panel, method="mean", trim=0.1, min_score=MIN_SCORE):
+    matrix = panel.matrix
+    weights = matrix.effective_weights()
+
+    consensus_scores = aggregate_rater_scores(panel.scores, panel.rater_weights, method, trim, min_score)
+    consensus = DecisionMatrix(matrix.options, matrix.criteria, matrix.columns, consensus_scores,
+                               matrix.criterion_weights, matrix.factor_weights)
+    consensus_totals = consensus.total_scores(weights)
+    rater_totals = panel.scores @ weights
+
+    rater_ranks = average_ranks(rater_totals)
+    consensus_ranks = average_ranks(consensus_totals)[0]
+    correlations = rank_correlations(np.vstack([rater_ranks, consensus_ranks]))
+
+    rater_mean = (panel.scores * panel.rater_weights[:, None, None]).sum(axis=0)
+    score_spread = np.sqrt((((panel.scores - rater_mean) ** 2) * panel.rater_weights[:, None, None]).sum(axis=0))
+
+    best = int(np.argmax(consensus_totals)) if len(consensus_totals) else -1
+    top_choice_agreement = float(panel.rater_weights[np.argmax(rater_totals, axis=1) == best].sum()) if best >= 0 else 0.0
+
+    return PanelResult(panel, method, consensus, consensus_totals, rater_totals, rater_ranks, consensus_ranks,
+                       score_spread, kendalls_w(rater_ranks), correlations[:-1, :-1], correlations[-1, :-1],
+                       top_choice_agreement)
+
+# This function displays the consensus ranking, each rater's best option and the agreement statistics.
+
+def display_panel_results(result, top_k=10):
+    from tabulate import tabulate
+
+    panel = result.panel
+    options = panel.matrix.options
+    order = np.argsort(-result.consensus_totals, kind="stable")[:top_k]
+
+    print(f"\n=== Consensus Ranking ({result.method} of {len(panel.raters)} raters) ===")
+    rows = [[f"{result.consensus_ranks[i]:g}", options[i], f"{result.consensus_totals[i]:.2f}",
+             f"{result.rater_totals[:, i].min():.2f} - {result.rater_totals[:, i].max():.2f}"]
+            for i in order.tolist()]
+    print(tabulate(rows, headers=["Rank", "Option", "Consensus Score", "Rater Score Range"], tablefmt="grid"))
+
+    print("\n=== Raters ===")
+    rows = [[rater, f"{panel.rater_weights[r]:.1%}", options[int(np.argmax(result.rater_totals[r]))],
+             f"{result.consensus_correlations[r]:.2f}"]
+            for r, rater in enumerate(panel.raters)]
+    print(tabulate(rows, headers=["Rater", "Weight", "Best Option", "Correlation with Consensus"], tablefmt="grid"))
+
+    print(f"\nKendall's W (agreement between rater rankings): {result.concordance:.2f}")
+    print(f"Mean rank correlation between raters: {result.mean_rater_correlation():.2f}")
+    print(f"Rater weight agreeing with the consensus best option: {result.top_choice_agreement:.1%}")
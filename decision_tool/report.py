@@ -0,0 +1,261 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# This module writes the decision results to the console and to files.
+
+import csv
+import heapq
+import json
+import sys
+
+from .instrumentation import instrumented, timer
+from .scoring import calculate_score_breakdown
+
+REPORT_FORMATS = ("text", "csv", "jsonl")
+REPORT_MODES = ("full", "summary", "top", "page")
+
+# This function formats a table as plain aligned columns.  Unlike tabulate it measures each cell once with
+# len() and does no grid drawing, which matters for tables with many thousands of rows.  Columns whose
+# first value is a number (or a formatted number) are right-aligned and the others left-aligned.
+
+def _is_number(value):
+    if isinstance(value, (int, float)):
+        return True
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+def format_plain_table(headers, rows):
+    cells = [[str(value) for value in headers]]
+    numeric = [False] * len(headers)
+    for row in rows:
+        if len(cells) == 1:
+            numeric = [_is_number(value) for value in row]
+        cells.append([str(value) for value in row])
+    widths = [max(map(len, column)) for column in zip(*cells)] if len(cells) > 1 else [len(cell) for cell in cells[0]]
+    lines = []
+    for n, row in enumerate(cells):
+        lines.append("  ".join(cell.rjust(width) if numeric[i] else cell.ljust(width)
+                               for i, (cell, width) in enumerate(zip(row, widths))).rstrip())
+        if n == 0:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+# This class writes a report straight to one or more open streams as it is produced, in "text"
+# (the layout display_results has always printed), "csv" or "jsonl" (one JSON object per line) format.
+# Nothing is buffered beyond the table being written, so memory use does not depend on report size, and
+# writing the same report to the console and to a file only produces it once.  With plain_tables, text
+# tables are written by format_plain_table instead of as tabulate grids.
+
+class ReportWriter:
+
+    def __init__(self, *outputs, plain_tables=False):
+        # Each output is a stream, or a (stream, format) pair
+        self.outputs = []
+        for output in outputs:
+            stream, fmt = output if isinstance(output, tuple) else (output, "text")
+            if fmt not in REPORT_FORMATS:
+                raise ValueError(f"Unknown report format '{fmt}', expected one of {', '.join(REPORT_FORMATS)}.")
+            self.outputs.append((stream, fmt, csv.writer(stream) if fmt == "csv" else None))
+        self.current_section = ""
+        self.plain_tables = plain_tables
+
+    # This method starts a new section of the report.
+
+    def section(self, title):
+        self.current_section = title
+        for stream, fmt, _ in self.outputs:
+            if fmt == "text":
+                stream.write(f"\n=== {title} ===\n")
+
+    # This method writes a line of text, such as the best option.
+
+    def note(self, text):
+        for stream, fmt, writer in self.outputs:
+            if fmt == "text":
+                stream.write(f"{text}\n")
+            elif fmt == "csv":
+                writer.writerow([self.current_section, "note", text.strip()])
+            else:
+                stream.write(json.dumps({"section": self.current_section, "note": text.strip()}, ensure_ascii=False) + "\n")
+
+    # This method writes a table.  Rows may be any iterable and are consumed once.  formats gives an optional
+    # format spec per column for text output, and line_format writes text rows as plain lines instead of a grid.
+    # CSV and JSON Lines output always carry the unformatted values.
+
+    def table(self, headers, rows, title=None, formats=None, line_format=None):
+        label = title or ""
+        text_rows = {}
+        for stream, fmt, writer in self.outputs:
+            if fmt == "text":
+                if title:
+                    stream.write(f"\n{title}\n")
+                if line_format is None:
+                    text_rows[id(stream)] = []
+            elif fmt == "csv":
+                writer.writerow(["section", "table"] + list(headers))
+
+        for row in rows:
+            for stream, fmt, writer in self.outputs:
+                if fmt == "text":
+                    text_row = row
+                    if formats:
+                        text_row = [value if spec is None else format(value, spec) for value, spec in zip(row, formats)]
+                    if line_format is None:
+                        text_rows[id(stream)].append(text_row)
+                    else:
+                        stream.write(line_format.format(*text_row) + "\n")
+                elif fmt == "csv":
+                    writer.writerow([self.current_section, label] + list(row))
+                else:
+                    record = {"section": self.current_section, "table": label}
+                    record.update(zip(headers, row))
+                    stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        for stream, fmt, _ in self.outputs:
+            if fmt == "text" and line_format is None:
+                if self.plain_tables:
+                    with timer("plain_table"):
+                        text = format_plain_table(headers, text_rows[id(stream)])
+                else:
+                    from tabulate import tabulate    # imported on first use, headless callers never need it
+                    with timer("tabulate"):
+                        text = tabulate(text_rows[id(stream)], headers=headers, tablefmt="grid")
+                stream.write(text + "\n")
+
+# This function returns the options whose per-option tables a report mode shows, and the (option, score)
+# pairs of its ranking.  Only the full report needs every option sorted; the other modes keep the best
+# top_k (or offset + page_size) with a heap.
+
+def report_selection(breakdown, mode="full", top_k=10, page_size=50, offset=0):
+    if mode not in REPORT_MODES:
+        raise ValueError(f"Unknown report mode '{mode}', expected one of {', '.join(REPORT_MODES)}.")
+    if mode == "full":
+        return breakdown.options, breakdown.ranked_options()
+    if mode == "page":
+        if page_size <= 0 or offset < 0:
+            raise ValueError("The page size must be positive and the offset must not be negative.")
+        ranked = heapq.nlargest(offset + page_size, breakdown.option_scores.items(), key=lambda x: x[1])[offset:]
+    else:
+        ranked = heapq.nlargest(max(top_k, 0), breakdown.option_scores.items(), key=lambda x: x[1])
+    return ([] if mode == "summary" else [option for option, _ in ranked]), ranked
+
+# This function writes the final results from a ScoreBreakdown through a ReportWriter.  mode selects how
+# much is written:
+#     "full"     every option, as display_results has always printed
+#     "summary"  the best top_k options and the weights, without per-option tables
+#     "top"      as "summary", plus the per-option tables of the best top_k options
+#     "page"     the options ranked offset + 1 to offset + page_size, with their per-option tables
+# Per-option tables are only produced for the options shown.
+
+def write_results(writer, breakdown, mode="full", top_k=10, page_size=50, offset=0):
+    detail_options, ranked = report_selection(breakdown, mode, top_k, page_size, offset)
+
+    writer.section("Decision Results")
+    writer.table(["Option", "Score"], ranked, line_format="{0}: {1:.2f}")
+    if mode != "full":
+        first = offset + 1 if mode == "page" else 1
+        writer.note(f"(options ranked {first} to {first + len(ranked) - 1} of {len(breakdown.options)})"
+                    if ranked else f"(no options in this range; there are {len(breakdown.options)})")
+
+    best_options, max_score = breakdown.best_options()
+    if len(best_options) == 1:
+        writer.note(f"\nBest Option: {best_options[0]} with a score of {max_score:.2f}")
+    else:
+        writer.note(f"\nBest Options (tie): {', '.join(best_options)} with a score of {max_score:.2f}")
+
+    # Table 1: Raw Scores
+    if detail_options or mode == "full":
+        writer.section("Raw Scores (Criteria -> Factors)")
+    for option in detail_options:
+        rows = (
+            [criterion, factor, breakdown.scores[option][criterion][factor]]
+            for criterion in breakdown.criteria
+            for factor in breakdown.factors[criterion]
+        )
+        writer.table(["Criterion", "Factor", "Score"], rows, title=f"Option: {option}")
+
+    # Table 2: Normalized Criterion Weights
+    writer.section("Normalized Criterion Weights")
+    criterion_table = (
+        [criterion, breakdown.criterion_weights[criterion], breakdown.norm_criterion_weights[criterion]]
+        for criterion in breakdown.criteria
+    )
+    writer.table(["Criterion", "Raw Weight", "Normalized Weight"], criterion_table)
+
+    # Table 3: Normalized Factor Weights per Criterion
+    writer.section("Normalized Factor Weights")
+    for criterion in breakdown.criteria:
+        factor_table = (
+            [factor, weight, breakdown.norm_factor_weights[criterion][factor]]
+            for factor, weight in breakdown.factor_weights[criterion].items()
+        )
+        writer.table(["Factor", "Raw Weight", "Normalized Weight"], factor_table, title=f"Criterion: {criterion}")
+
+    # Table 4: Weighted Criterion Scores for each Option
+    if detail_options or mode == "full":
+        writer.section("Weighted Criterion Scores")
+    for option in detail_options:
+        rows = (
+            [criterion, breakdown.criterion_scores[option][criterion], breakdown.weighted_scores[option][criterion]]
+            for criterion in breakdown.criteria
+        )
+        writer.table(["Criterion", "Criterion Score", "Weighted Score"], rows, title=f"Option: {option}",
+                     formats=[None, ".2f", ".2f"])
+
+# This function rebuilds a ScoreBreakdown from the arguments display_results has always taken,
+# for callers that do not already have one.
+
+def breakdown_from_results(option_scores, scores, criterion_weights, factor_weights):
+    criteria = list(criterion_weights)
+    factors = {criterion: list(factor_weights[criterion]) for criterion in criteria}
+    return calculate_score_breakdown(list(option_scores), criteria, criterion_weights, factors, factor_weights, scores)
+
+# This function displays the final results.  report_options (mode, top_k, page_size, offset) are passed
+# to write_results, and plain_tables to ReportWriter; large models are best shown with mode "summary",
+# "top" or "page" and plain tables.
+
+@instrumented("display_results")
+def display_results(option_scores, scores, criterion_weights, factor_weights, breakdown=None, plain_tables=False,
+                    **report_options):
+    if breakdown is None:
+        breakdown = breakdown_from_results(option_scores, scores, criterion_weights, factor_weights)
+    write_results(ReportWriter(sys.stdout, plain_tables=plain_tables), breakdown, **report_options)
+
+# This function picks the report format from a file name: .csv, .jsonl or text for anything else.
+
+def report_format(filename):
+    if filename.lower().endswith(".csv"):
+        return "csv"
+    if filename.lower().endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return "text"
+
+# This function saves the final results to a file, writing the report as it is produced.  The report
+# options are those of display_results.
+
+@instrumented("save_display_results_to_file")
+def save_display_results_to_file(option_scores, scores, criterion_weights, factor_weights, filename="decision_results.txt",
+                                 fmt=None, breakdown=None, plain_tables=False, **report_options):
+    if breakdown is None:
+        breakdown = breakdown_from_results(option_scores, scores, criterion_weights, factor_weights)
+    with open(filename, "w", encoding="utf-8", newline="") as f:
+        write_results(ReportWriter((f, fmt or report_format(filename)), plain_tables=plain_tables), breakdown, **report_options)
+
+# This function displays the final results and saves them to a file in one pass.
+
+@instrumented("display_and_save_results")
+def display_and_save_results(option_scores, scores, criterion_weights, factor_weights, filename="decision_results.txt",
+                             fmt=None, breakdown=None, plain_tables=False, **report_options):
+    if breakdown is None:
+        breakdown = breakdown_from_results(option_scores, scores, criterion_weights, factor_weights)
+    with open(filename, "w", encoding="utf-8", newline="") as f:
+        write_results(ReportWriter(sys.stdout, (f, fmt or report_format(filename)), plain_tables=plain_tables),
+                      breakdown, **report_options)
@@ -0,0 +1,129 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# This module holds the weighted-sum scoring itself.  It only uses the standard library, so scripts
+# and batch jobs can import it and score a model without loading NumPy or the reporting code.
+
+from .instrumentation import instrumented
+
+MIN_SCORE = 0    # lowest score user should enter
+MAX_SCORE = 5    # highest score user should enter
+TIE_TOLERANCE = 1e-8    # scores closer than this are treated as tied
+
+# This function normalises a set of weights so that they add up to 1.
+
+@instrumented("normalize_weights")
+def normalize_weights(weights):
+    total = sum(weights.values())
+    return {key: value / total for key, value in weights.items()} if total > 0 else weights
+
+# This class holds the full breakdown of a scoring run: the raw and normalised weights, every option's
+# score on every criterion before and after criterion weighting, and the option totals.  The reports are
+# rendered from it directly, so they do no arithmetic of their own.
+
+class ScoreBreakdown:
+
+    def __init__(self, options, criteria, factors, criterion_weights, factor_weights, scores,
+                 norm_criterion_weights, norm_factor_weights, criterion_scores, weighted_scores, option_scores):
+        self.options = options
+        self.criteria = criteria
+        self.factors = factors
+        self.criterion_weights = criterion_weights
+        self.factor_weights = factor_weights
+        self.scores = scores
+        self.norm_criterion_weights = norm_criterion_weights
+        self.norm_factor_weights = norm_factor_weights
+        self.criterion_scores = criterion_scores      # criterion_scores[option][criterion], before criterion weighting
+        self.weighted_scores = weighted_scores        # weighted_scores[option][criterion], after criterion weighting
+        self.option_scores = option_scores
+
+    # This method returns (option, score) pairs from best to worst.
+
+    def ranked_options(self):
+        return sorted(self.option_scores.items(), key=lambda x: x[1], reverse=True)
+
+    # This method returns all options with the maximum score (allowing for floating point tolerance) and that score.
+
+    def best_options(self):
+        max_score = max(self.option_scores.values())
+        return [option for option, score in self.option_scores.items() if abs(score - max_score) < TIE_TOLERANCE], max_score
+
+# This function computes the option scores and keeps every intermediate result in a ScoreBreakdown.
+
+@instrumented("calculate_score_breakdown")
+def calculate_score_breakdown(options, criteria, criterion_weights, factors, factor_weights, scores):
+
+    # Sending the weights to be normalised first
+    norm_criterion_weights = normalize_weights(criterion_weights)
+    norm_factor_weights = {
+        criterion: normalize_weights(factor_weights[criterion])
+        for criterion in criteria
+    }
+
+    criterion_scores = {}
+    weighted_scores = {}
+    option_scores = {}
+    for option in options:
+        criterion_scores[option] = {}
+        weighted_scores[option] = {}
+        total_score = 0
+        for criterion in criteria:
+            criterion_score = 0
+            if len(factors[criterion]) == 1 and factors[criterion][0] == criterion:
+                # Direct criterion calculation
+                score = scores[option][criterion][criterion]
+                criterion_score = score  # No factor weighting
+            else:
+                # Factor-based calculation
+                for factor in factors[criterion]:
+                    score = scores[option][criterion][factor]
+                    criterion_score += score * norm_factor_weights[criterion][factor]
+
+            weighted_score = criterion_score * norm_criterion_weights[criterion]
+            criterion_scores[option][criterion] = criterion_score
+            weighted_scores[option][criterion] = weighted_score
+            total_score += weighted_score
+
+        option_scores[option] = total_score
+
+    return ScoreBreakdown(options, criteria, factors, criterion_weights, factor_weights, scores,
+                          norm_criterion_weights, norm_factor_weights, criterion_scores, weighted_scores, option_scores)
+
+# This function computes the option scores only.  It repeats the loop of calculate_score_breakdown without
+# keeping the intermediate results, which makes it noticeably faster on large models.
+
+@instrumented("calculate_weighted_scores")
+def calculate_weighted_scores(options, criteria, criterion_weights, factors, factor_weights, scores):
+
+    # Sending the weights to be normalised first
+    norm_criterion_weights = normalize_weights(criterion_weights)
+    norm_factor_weights = {
+        criterion: normalize_weights(factor_weights[criterion])
+        for criterion in criteria
+    }
+
+    option_scores = {}
+    for option in options:
+        total_score = 0
+        for criterion in criteria:
+            criterion_score = 0
+            if len(factors[criterion]) == 1 and factors[criterion][0] == criterion:
+                # Direct criterion calculation
+                score = scores[option][criterion][criterion]
+                criterion_score = score  # No factor weighting
+            else:
+                # Factor-based calculation
+                for factor in factors[criterion]:
+                    score = scores[option][criterion][factor]
+                    criterion_score += score * norm_factor_weights[criterion][factor]
+
+            total_score += criterion_score * norm_criterion_weights[criterion]
+
+        option_scores[option] = total_score
+
+    return option_scores
@@ -0,0 +1,182 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions and class below run a Monte Carlo weight-sensitivity analysis.  Criterion and factor
+# weights are sampled around the user's values, every option is rescored for every draw, and running
+# statistics are kept so that memory use does not depend on the number of draws.
+
+from statistics import NormalDist
+
+import numpy as np
+
+# This function samples raw criterion and factor weights around the matrix's own weights.
+# "dirichlet" draws normalised weights from a Dirichlet distribution centred on the user's normalised
+# weights (a larger concentration keeps the draws closer to them); "uniform" scales every weight by
+# a random factor between 1 - spread and 1 + spread.  vary selects "criteria", "factors" or "both".
+
+def sample_weights(matrix, rng, draws, distribution="dirichlet", concentration=100.0, spread=0.1, vary="both"):
+    if vary not in ("criteria", "factors", "both"):
+        raise ValueError(f"Unknown weight selection '{vary}', expected 'criteria', 'factors' or 'both'.")
+    norm_criterion_weights, norm_factor_weights = matrix.normalized_weights()
+
+    def perturb(weights):
+        if distribution == "dirichlet":
+            # Normalised gamma draws are Dirichlet distributed; the matrix normalises them later
+            return rng.gamma(concentration * np.broadcast_to(weights, (draws, len(weights))))
+        elif distribution == "uniform":
+            return weights * rng.uniform(1 - spread, 1 + spread, size=(draws, len(weights)))
+        raise ValueError(f"Unknown distribution '{distribution}', expected 'dirichlet' or 'uniform'.")
+
+    criterion_weights = perturb(norm_criterion_weights) if vary in ("criteria", "both") else norm_criterion_weights
+    factor_weights = perturb(norm_factor_weights) if vary in ("factors", "both") else norm_factor_weights
+    return criterion_weights, factor_weights
+
+# This class keeps running statistics over the sampled option totals: how often each option reached each
+# rank (rank-acceptability) and the mean, variance and range of each option's score.  Accumulators built
+# over separate batches of draws can be merged.  Only the first max_rank ranks are counted (None counts
+# every rank, which needs an options x options table and a full sort of every draw).
+
+class SensitivityAccumulator:
+
+    def __init__(self, options, max_rank=10):
+        self.options = list(options)
+        self.max_rank = len(self.options) if max_rank is None else min(max_rank, len(self.options))
+        self.draws = 0
+        self.rank_counts = np.zeros((len(self.options), self.max_rank), dtype=np.int64)
+        self.mean = np.zeros(len(self.options))
+        self.m2 = np.zeros(len(self.options))
+        self.minimum = np.full(len(self.options), np.inf)
+        self.maximum = np.full(len(self.options), -np.inf)
+
+    # This method adds a chunk of draws, given as a draws x options array of totals.
+
+    def update(self, totals):
+        draws, option_count = totals.shape
+        if draws == 0:
+            return
+
+        # Only the top max_rank options of each draw are needed, so avoid a full sort when possible
+        if self.max_rank < option_count:
+            ranked = np.argpartition(-totals, self.max_rank - 1, axis=1)[:, :self.max_rank]
+            order = np.argsort(-np.take_along_axis(totals, ranked, axis=1), axis=1, kind="stable")
+            ranked = np.take_along_axis(ranked, order, axis=1)
+        else:
+            ranked = np.argsort(-totals, axis=1, kind="stable")
+        cells = ranked * self.max_rank + np.arange(self.max_rank)
+        self.rank_counts += np.bincount(cells.ravel(), minlength=self.rank_counts.size).reshape(self.rank_counts.shape)
+
+        chunk_mean = totals.mean(axis=0)
+        chunk_m2 = ((totals - chunk_mean) ** 2).sum(axis=0)
+        self._merge_moments(draws, chunk_mean, chunk_m2)
+        np.minimum(self.minimum, totals.min(axis=0), out=self.minimum)
+        np.maximum(self.maximum, totals.max(axis=0), out=self.maximum)
+
+    # This method folds the statistics of another accumulator into this one.
+
+    def merge(self, other):
+        if other.rank_counts.shape != self.rank_counts.shape:
+            raise ValueError("Only accumulators over the same options and ranks can be merged.")
+        if other.draws == 0:
+            return self
+        self.rank_counts += other.rank_counts
+        self._merge_moments(other.draws, other.mean, other.m2)
+        np.minimum(self.minimum, other.minimum, out=self.minimum)
+        np.maximum(self.maximum, other.maximum, out=self.maximum)
+        return self
+
+    # Pairwise combination of means and sums of squared deviations (Chan et al.)
+
+    def _merge_moments(self, draws, mean, m2):
+        total = self.draws + draws
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (draws / total)
+        self.m2 = self.m2 + m2 + delta ** 2 * (self.draws * draws / total)
+        self.draws = total
+
+    # This method returns the share of draws in which each option reached each rank (options x ranks).
+
+    def rank_acceptability(self):
+        return self.rank_counts / max(self.draws, 1)
+
+    # This method returns the standard deviation of each option's score over the draws.
+
+    def std(self):
+        return np.sqrt(self.m2 / max(self.draws - 1, 1))
+
+    # This method returns the interval expected to hold the given share of each option's scores,
+    # assuming the sampled scores are roughly normally distributed.
+
+    def score_intervals(self, confidence=0.95):
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        spread = z * self.std()
+        return self.mean - spread, self.mean + spread
+
+    # This method returns Wilson confidence intervals for the rank-acceptability of every option and rank.
+
+    def acceptability_intervals(self, confidence=0.95):
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        n = max(self.draws, 1)
+        p = self.rank_counts / n
+        centre = (p + z ** 2 / (2 * n)) / (1 + z ** 2 / n)
+        half_width = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / (1 + z ** 2 / n)
+        return centre - half_width, centre + half_width
+
+# This function scores the options for a number of sampled weight draws, processing the draws in
+# fixed-size chunks so that only one chunk of draws x options totals and draws x columns weights is held
+# at a time.
+
+def accumulate_weight_draws(matrix, accumulator, draws, rng, chunk_size=None, **sampling):
+    if chunk_size is None:
+        # about 32 MB for the larger of the totals and each weight array per chunk
+        chunk_size = max(1, 2 ** 22 // max(len(matrix.options), len(matrix.columns), 1))
+    remaining = draws
+    while remaining > 0:
+        count = min(chunk_size, remaining)
+        criterion_weights, factor_weights = sample_weights(matrix, rng, count, **sampling)
+        weights = np.broadcast_to(matrix.effective_weights(criterion_weights, factor_weights), (count, len(matrix.columns)))
+        accumulator.update(weights @ matrix.scores.T)
+        remaining -= count
+    return accumulator
+
+# This function runs the whole sensitivity analysis and returns a SensitivityAccumulator.
+# max_rank limits the ranks that are counted (None for every rank); seed makes the draws repeatable.
+# With pareto_only, dominated options are dropped first: only options on the Pareto front can be ranked
+# first under any draw, so the "Ranked #1" shares are unchanged while every draw scores fewer options.
+
+def weight_sensitivity_analysis(matrix, draws=100000, distribution="dirichlet", concentration=100.0, spread=0.1,
+                                vary="both", max_rank=10, chunk_size=None, seed=None, pareto_only=False):
+    if pareto_only:
+        from .pareto import pareto_filter
+
+        matrix, _ = pareto_filter(matrix, "criteria" if vary == "criteria" else "factors")
+    rng = np.random.default_rng(seed)
+    accumulator = SensitivityAccumulator(matrix.options, max_rank)
+    return accumulate_weight_draws(matrix, accumulator, draws, rng, chunk_size,
+                                   distribution=distribution, concentration=concentration, spread=spread, vary=vary)
+
+# This function displays the results of a weight-sensitivity analysis.
+
+def display_sensitivity_results(accumulator, confidence=0.95):
+    from tabulate import tabulate
+
+    print(f"\n=== Weight Sensitivity ({accumulator.draws} draws) ===")
+    acceptability = accumulator.rank_acceptability()
+    low, high = accumulator.score_intervals(confidence)
+    first_low, first_high = accumulator.acceptability_intervals(confidence)
+    order = np.argsort(-accumulator.mean, kind="stable")
+
+    rows = []
+    for i in order:
+        rows.append([accumulator.options[i], f"{accumulator.mean[i]:.2f}", f"{low[i]:.2f} - {high[i]:.2f}",
+                     f"{acceptability[i, 0]:.1%}", f"{first_low[i, 0]:.1%} - {first_high[i, 0]:.1%}"])
+    print(tabulate(rows, headers=["Option", "Mean Score", f"{confidence:.0%} Score Range",
+                                  "Ranked #1", f"{confidence:.0%} CI (#1)"], tablefmt="grid"))
+
+    print("\n=== Rank Acceptability ===")
+    rows = [[accumulator.options[i]] + [f"{share:.1%}" for share in acceptability[i]] for i in order]
+    print(tabulate(rows, headers=["Option"] + [f"#{rank + 1}" for rank in range(accumulator.max_rank)], tablefmt="grid"))
@@ -0,0 +1,263 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# This module serves calculate_weighted_scores over a local HTTP endpoint (TCP or Unix socket), so other
+# tools can score models without shelling out to the script:
+#
+#     python -m decision_tool serve --port 8765            or   --unix /tmp/decision_tool.sock
+#     POST /score   body: {"options": [...], "criteria": [...], "criterion_weights": {...},
+#                          "factors": {...}, "factor_weights": {...}, "scores": {...}}
+#     GET  /stats   request counts, throughput and latency percentiles
+#
+# The event loop only reads requests and writes responses; keying, parsing, scoring and encoding the
+# result all run on a process pool.  Requests are keyed by the model they contain, so formatting and key
+# order do not matter: requests for the same model that arrive while it is being scored wait for that
+# single computation, and recent results are kept in a small LRU cache.
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .cache import LRUCache, _digest, model_key
+from .scoring import calculate_score_breakdown
+from .validation import validate_model
+
+MODEL_FIELDS = ("options", "criteria", "criterion_weights", "factors", "factor_weights", "scores")
+HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                413: "Payload Too Large", 500: "Internal Server Error"}
+
+# This function parses a request body into the six model fields.
+
+def parse_model(body):
+    try:
+        model = json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise ValueError(f"Request body is not valid JSON: {error}") from None
+    if not isinstance(model, dict):
+        raise ValueError("Request body must be a JSON object.")
+    missing = [field for field in MODEL_FIELDS if field not in model]
+    if missing:
+        raise ValueError(f"Model is missing the field(s): {', '.join(missing)}")
+    return [model[field] for field in MODEL_FIELDS]
+
+# This function runs on the process pool: it parses, validates and scores one request body and returns
+# the encoded response, so the event loop never handles the model itself.
+
+def score_request(body):
+    fields = parse_model(body)
+    try:
+        validate_model(*fields).raise_if_invalid()
+        breakdown = calculate_score_breakdown(*fields)
+    except (KeyError, TypeError, AttributeError) as error:
+        raise ValueError(f"Model is incomplete or malformed: {type(error).__name__}: {error}") from None
+    best_options, best_score = breakdown.best_options() if breakdown.option_scores else ([], None)
+    result = {
+        "option_scores": breakdown.option_scores,
+        "ranking": [option for option, _ in breakdown.ranked_options()],
+        "best_options": best_options,
+        "best_score": best_score,
+        "criterion_scores": breakdown.criterion_scores,
+    }
+    return json.dumps(result, ensure_ascii=False).encode("utf-8")
+
+# This function runs on the process pool and returns the key requests are coalesced and cached under: the
+# canonical key of the model in the body.  A model too malformed to key that way is keyed on its canonical
+# JSON instead, and the scoring worker then reports what is wrong with it.
+
+def request_key(body):
+    fields = parse_model(body)
+    try:
+        return model_key(*fields)
+    except (KeyError, TypeError, AttributeError):
+        return _digest("request", fields)
+
+# This function creates the scoring process pool.  Workers are spawned rather than forked, because the
+# service also runs threads and forking a threaded process can leave locks held in the child.
+
+def scoring_executor(workers=None):
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+# This class is the scoring service.  It keeps the in-flight computations, the result cache and the statistics.
+
+class ScoringService:
+
+    def __init__(self, executor=None, cache_size=256, latency_window=10000, max_body=64 * 1024 * 1024):
+        self.executor = executor or scoring_executor()
+        self.max_body = max_body
+        self.cache = LRUCache(max_entries=cache_size)
+        self.in_flight = {}
+        self.latencies = deque(maxlen=latency_window)
+        self.counts = {"requests": 0, "scored": 0, "computations": 0, "coalesced": 0, "errors": 0}
+        self.started = time.monotonic()
+
+    # This method returns the result for a request body, computing it at most once per model at a time.
+
+    async def score(self, body):
+        loop = asyncio.get_running_loop()
+        key = await loop.run_in_executor(self.executor, request_key, body)
+
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+
+        if key in self.in_flight:
+            self.counts["coalesced"] += 1
+            return await asyncio.shield(self.in_flight[key])
+
+        future = loop.run_in_executor(self.executor, score_request, body)
+        self.in_flight[key] = future
+        self.counts["computations"] += 1
+        try:
+            result = await asyncio.shield(future)
+        finally:
+            del self.in_flight[key]
+
+        return self.cache.put(key, result, len(result))
+
+    # This method returns the service statistics.  Latencies cover the most recent /score requests.
+
+    def stats(self):
+        uptime = time.monotonic() - self.started
+        latencies = sorted(self.latencies)
+
+        def percentile(share):
+            if not latencies:
+                return None
+            return round(1000 * latencies[min(len(latencies) - 1, int(share * len(latencies)))], 3)
+
+        return {
+            **self.counts,
+            "in_flight": len(self.in_flight),
+            "cache": self.cache.stats(),
+            "uptime_seconds": round(uptime, 3),
+            "throughput_per_second": round(self.counts["scored"] / uptime, 3) if uptime > 0 else 0.0,
+            "latency_ms": {"p50": percentile(0.50), "p90": percentile(0.90), "p99": percentile(0.99),
+                           "max": percentile(1.0), "window": len(latencies)},
+        }
+
+    # This method routes one request and returns the status code and the JSON body of the response.
+
+    async def respond(self, method, path, body):
+        if path == "/score":
+            if method != "POST":
+                return 405, {"error": "Use POST for /score."}
+            start = time.perf_counter()
+            try:
+                result = await self.score(body)
+            except ValueError as error:
+                self.counts["errors"] += 1
+                return 400, {"error": str(error)}
+            self.latencies.append(time.perf_counter() - start)
+            self.counts["scored"] += 1
+            return 200, result
+        if path == "/stats":
+            if method != "GET":
+                return 405, {"error": "Use GET for /stats."}
+            return 200, self.stats()
+        return 404, {"error": f"No endpoint {path}"}
+
+    # This method serves the HTTP/1.1 requests of one connection, keeping it open between requests.
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._send(writer, 400, {"error": "Malformed request line."}, close=True)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._send(writer, 400, {"error": "Content-Length must be a non-negative integer."}, close=True)
+                    break
+                if length > self.max_body:
+                    await self._send(writer, 413, {"error": f"Body larger than {self.max_body} bytes."}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                self.counts["requests"] += 1
+                close = headers.get("connection", "").lower() == "close" or version == "HTTP/1.0"
+                try:
+                    status, payload = await self.respond(method, target.split("?", 1)[0], body)
+                except Exception as error:
+                    self.counts["errors"] += 1
+                    status, payload = 500, {"error": f"{type(error).__name__}: {error}"}
+                await self._send(writer, status, payload, close)
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _send(self, writer, status, payload, close=False):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    # This method starts listening on a TCP port, or on a Unix socket when path is given.
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle_connection, path=path)
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+# This function runs the service until it is interrupted.
+
+async def serve(host="127.0.0.1", port=8765, path=None, workers=None, cache_size=256):
+    with scoring_executor(workers) as executor:
+        service = ScoringService(executor, cache_size)
+        server = await service.start(host, port, path)
+        print(f"Scoring service listening on {path or f'http://{host}:{port}'}")
+        async with server:
+            await server.serve_forever()
+
+# This function is the command line of the service.
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m decision_tool serve",
+                                     description="Serve weighted-sum scoring over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: %(default)s)")
+    parser.add_argument("--unix", default=None, help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="scoring processes (default: one per core)")
+    parser.add_argument("--cache-size", type=int, default=256, help="results kept in the cache (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.unix and os.path.exists(args.unix):
+            os.remove(args.unix)
+    return 0
@@ -0,0 +1,164 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# The functions and class below find, for every criterion weight and every factor weight, the range of
+# values over which the current best option stays the best, with every other weight held at its value.
+#
+# The option totals are linear in the normalised weights, so when one raw weight t changes, the difference
+# between the best option b and any rival a is (alpha + beta t) / (positive normaliser).  b stays ahead of
+# a exactly while alpha + beta t >= 0, which bounds t from below (beta > 0) or above (beta < 0) at
+# -alpha / beta.  All rivals and all weights are solved at once with array operations.  Rivals that one of
+# the top-scoring options dominates are dropped first: whatever single weight changes, the dominating
+# option stays ahead of them, so their bounds are never the binding ones.
+
+import numpy as np
+
+from .pareto import _dominated_by
+
+# This class holds the result of weight_stability_intervals.  Intervals are in raw weight units, with one
+# (low, high) row per criterion and per column; high is inf when no rival can take over however large the
+# weight gets.  Direct scoring criteria have no factor weight, so their column rows are NaN.  The rivals
+# arrays give the index of the option that takes over at each bound (-1 when there is none).
+
+class WeightStability:
+
+    def __init__(self, matrix, best, criterion_intervals, criterion_rivals, factor_intervals, factor_rivals):
+        self.matrix = matrix
+        self.best = best
+        self.criterion_intervals = criterion_intervals
+        self.criterion_rivals = criterion_rivals
+        self.factor_intervals = factor_intervals
+        self.factor_rivals = factor_rivals
+
+    @property
+    def best_option(self):
+        return self.matrix.options[self.best]
+
+    # This method converts the criterion intervals into ranges of the normalised criterion weight.
+
+    def normalized_criterion_intervals(self):
+        weights = self.matrix.criterion_weights
+        others = (weights.sum() - weights)[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shares = self.criterion_intervals / (others + self.criterion_intervals)
+        return np.where(np.isinf(self.criterion_intervals), 1.0, np.nan_to_num(shares, nan=0.0))
+
+# This function returns the (low, high) range of t keeping alpha + beta t >= 0 for every rival (rows of
+# alpha and beta, one column per weight), never going below zero, and the rival that sets each bound.
+
+def _solve_bounds(alpha, beta):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing = -alpha / beta
+    lower = np.where(beta > 0, crossing, -np.inf)
+    upper = np.where(beta < 0, crossing, np.inf)
+
+    low_rival = np.argmax(lower, axis=0) if len(lower) else np.zeros(alpha.shape[1], dtype=np.intp)
+    high_rival = np.argmin(upper, axis=0) if len(upper) else np.zeros(alpha.shape[1], dtype=np.intp)
+    columns = np.arange(alpha.shape[1])
+    low = lower[low_rival, columns] if len(lower) else np.full(alpha.shape[1], -np.inf)
+    high = upper[high_rival, columns] if len(upper) else np.full(alpha.shape[1], np.inf)
+
+    rivals = np.stack([np.where(low > 0, low_rival, -1), np.where(np.isfinite(high), high_rival, -1)], axis=1)
+    return np.stack([np.maximum(low, 0.0), high], axis=1), rivals
+
+# This function returns the options that none of the top_candidates best-scoring options dominates (on the
+# raw scores), apart from the best option itself.  The check is done a slice of options at a time.
+
+def _undominated_rivals(matrix, totals, best, top_candidates):
+    count = len(matrix.options)
+    top = np.argpartition(-totals, top_candidates - 1)[:top_candidates] if count > top_candidates else np.arange(count)
+    dominators = matrix.scores[top]
+    keep = np.ones(count, dtype=bool)
+    step = max(1, 2 ** 22 // max(len(top) * len(matrix.columns), 1))
+    for start in range(0, count, step):
+        keep[start:start + step] = ~_dominated_by(dominators, matrix.scores[start:start + step])
+    keep[best] = False
+    return np.flatnonzero(keep)
+
+# This function computes the stability intervals of a DecisionMatrix's best option (the first one, if
+# several are tied).  Rivals dominated by one of the top_candidates best options are pruned first; pass
+# top_candidates=0 to compare against every option.
+
+def weight_stability_intervals(matrix, top_candidates=8):
+    if not matrix.options:
+        raise ValueError("There are no options to analyse.")
+    totals = matrix.total_scores()
+    best = int(np.argmax(totals))
+
+    if top_candidates > 0:
+        rivals = _undominated_rivals(matrix, totals, best, top_candidates)
+    else:
+        rivals = np.flatnonzero(np.arange(len(matrix.options)) != best)
+
+    norm_criterion_weights, norm_factor_weights = matrix.normalized_weights()
+    criterion_scores = matrix.criterion_scores()
+    criterion_gap = criterion_scores[best] - criterion_scores[rivals]    # rivals x criteria
+
+    # Criterion weights: with t in place of weight j, the gap is (sum over k != j of gap_k w_k + gap_j t) / total
+    raw_criterion_weights = matrix.criterion_weights
+    weighted_gap = criterion_gap @ raw_criterion_weights
+    criterion_alpha = weighted_gap[:, None] - criterion_gap * raw_criterion_weights
+    criterion_intervals, criterion_rivals = _solve_bounds(criterion_alpha, criterion_gap)
+
+    # Factor weights: with t in place of the weight of factor f of criterion j, multiplying the gap by the
+    # criterion's factor weight total (V - v_f + t) gives a linear condition in t
+    raw_factor_weights = np.where(matrix.direct[matrix.column_criterion], 1.0, matrix.factor_weights)
+    column_criterion = matrix.column_criterion
+    factor_total = np.add.reduceat(raw_factor_weights, matrix.criterion_starts[:-1])[column_criterion]
+    score_gap = matrix.scores[best] - matrix.scores[rivals]    # rivals x columns
+    raw_sum_gap = np.add.reduceat(score_gap * raw_factor_weights, matrix.criterion_starts[:-1], axis=1)[:, column_criterion]
+    other_factors_gap = raw_sum_gap - score_gap * raw_factor_weights
+
+    criterion_weight = norm_criterion_weights[column_criterion]
+    total_gap = (criterion_gap * norm_criterion_weights).sum(axis=1)
+    other_criteria_gap = total_gap[:, None] - (criterion_gap * norm_criterion_weights)[:, column_criterion]
+
+    factor_alpha = other_criteria_gap * (factor_total - raw_factor_weights) + criterion_weight * other_factors_gap
+    factor_beta = other_criteria_gap + criterion_weight * score_gap
+    factor_intervals, factor_rivals = _solve_bounds(factor_alpha, factor_beta)
+    factor_intervals[matrix.direct[column_criterion]] = np.nan
+    factor_rivals[matrix.direct[column_criterion]] = -1
+
+    # Rival positions back to option indices
+    criterion_rivals = np.where(criterion_rivals >= 0, rivals[np.maximum(criterion_rivals, 0)], -1) if len(rivals) else criterion_rivals
+    factor_rivals = np.where(factor_rivals >= 0, rivals[np.maximum(factor_rivals, 0)], -1) if len(rivals) else factor_rivals
+    return WeightStability(matrix, best, criterion_intervals, criterion_rivals, factor_intervals, factor_rivals)
+
+# This function displays the stability intervals.
+
+def display_weight_stability(stability):
+    from tabulate import tabulate
+
+    matrix = stability.matrix
+
+    def bound(value):
+        return "no limit" if np.isinf(value) else f"{value:.2f}"
+
+    def rival(index):
+        return matrix.options[index] if index >= 0 else ""
+
+    print(f"\n=== Weight Stability of '{stability.best_option}' ===")
+    shares = stability.normalized_criterion_intervals()
+    rows = []
+    for j, criterion in enumerate(matrix.criteria):
+        (low, high), (low_rival, high_rival) = stability.criterion_intervals[j], stability.criterion_rivals[j]
+        rows.append([criterion, f"{matrix.criterion_weights[j]:.2f}", f"{bound(low)} - {bound(high)}",
+                     f"{shares[j, 0]:.1%} - {shares[j, 1]:.1%}", rival(low_rival), rival(high_rival)])
+    print(tabulate(rows, headers=["Criterion", "Weight", "Stable Range", "Normalised Range",
+                                  "Overtaken Below By", "Overtaken Above By"], tablefmt="grid"))
+
+    rows = []
+    for k, (criterion, factor) in enumerate(matrix.columns):
+        if matrix.direct[matrix.column_criterion[k]]:
+            continue
+        (low, high), (low_rival, high_rival) = stability.factor_intervals[k], stability.factor_rivals[k]
+        rows.append([criterion, factor, f"{matrix.factor_weights[k]:.2f}", f"{bound(low)} - {bound(high)}",
+                     rival(low_rival), rival(high_rival)])
+    if rows:
+        print(tabulate(rows, headers=["Criterion", "Factor", "Weight", "Stable Range",
+                                      "Overtaken Below By", "Overtaken Above By"], tablefmt="grid"))
@@ -0,0 +1,206 @@
+# Decision Tool
+# Copyright (c) 2025 Nathaniel Robson, Ph.D
+# 
+# This code is licensed under the MIT License.
+# See the LICENSE file in the GitHub repository root for full terms.
+#
+# If you use or modify this code, please acknowledge the original author.
+
+# This module checks a whole decision model before any scoring is done, and reports every problem it
+# finds at once instead of stopping at the first one.  It looks for duplicate names, missing or invalid
+# weights, negative weights and weight totals of zero (which normalize_weights would silently leave
+# unnormalised), missing score cells and scores outside [MIN_SCORE, MAX_SCORE].  Score cells are gathered
+# in a single pass and checked with array operations, so the cost is linear in the number of cells.
+
+from collections import Counter
+
+import numpy as np
+
+from .scoring import MAX_SCORE, MIN_SCORE
+
+NUMBER_TYPES = (int, float, np.integer, np.floating)    # bool is an int, but is rejected separately
+
+# This class is one problem found in a model.  location names the item concerned, e.g. (option, criterion,
+# factor) for a score cell.
+
+class ValidationIssue:
+
+    __slots__ = ("kind", "location", "message")
+
+    def __init__(self, kind, location, message):
+        self.kind = kind
+        self.location = location
+        self.message = message
+
+    def __repr__(self):
+        return f"ValidationIssue({self.kind!r}, {self.location!r}, {self.message!r})"
+
+# This exception is raised by ValidationReport.raise_if_invalid and carries the full report.  It is rebuilt
+# from the report when unpickled, so it can cross a process pool (e.g. from the scoring service's workers).
+
+class ModelValidationError(ValueError):
+
+    def __init__(self, report):
+        self.report = report
+        super().__init__(report.summary())
+
+    def __reduce__(self):
+        return (type(self), (self.report,))
+
+# This class collects the issues of one validation run.
+
+class ValidationReport:
+
+    def __init__(self):
+        self.issues = []
+
+    def add(self, kind, location, message):
+        self.issues.append(ValidationIssue(kind, location, message))
+
+    @property
+    def ok(self):
+        return not self.issues
+
+    # This method returns the number of issues of each kind.
+
+    def counts(self):
+        return dict(Counter(issue.kind for issue in self.issues))
+
+    # This method returns a short description: the number of issues of each kind and the first few messages.
+
+    def summary(self, examples=5):
+        if self.ok:
+            return "No problems found."
+        kinds = ", ".join(f"{count} {kind}" for kind, count in self.counts().items())
+        lines = [f"{len(self.issues)} problem(s) found: {kinds}"]
+        lines += [f"  - {issue.message}" for issue in self.issues[:examples]]
+        if len(self.issues) > examples:
+            lines.append(f"  ... and {len(self.issues) - examples} more")
+        return "\n".join(lines)
+
+    def raise_if_invalid(self):
+        if not self.ok:
+            raise ModelValidationError(self)
+        return self
+
+# This function reports duplicated names in a list.
+
+def _check_duplicates(report, names, what, location=()):
+    for name, count in Counter(names).items():
+        if count > 1:
+            report.add("duplicate_name", location + (name,), f"{what} '{name}' appears {count} times.")
+
+# This function checks one set of weights (as an array) for invalid, negative and zero-total weights.
+
+def _check_weight_array(report, weights, locations, what, total_location):
+    invalid = ~np.isfinite(weights)
+    for i in np.flatnonzero(invalid).tolist():
+        report.add("invalid_weight", locations[i], f"{what} weight for {locations[i]} is not a finite number.")
+    negative = weights < 0
+    for i in np.flatnonzero(negative).tolist():
+        report.add("negative_weight", locations[i], f"{what} weight for {locations[i]} is negative ({weights[i]}).")
+    if len(weights) and not invalid.any() and weights.sum() <= 0:
+        report.add("zero_weight_total", total_location, f"{what} weights for {total_location} add up to {weights.sum()}, so they cannot be normalised.")
+
+# This function converts values to floats, using NaN for anything that is not an int or a float.  Strings
+# such as "3" are not numbers here, since the scoring arithmetic fails on them, and neither are booleans.
+
+def _as_floats(values):
+    if set(map(type, values)) <= {int, float}:    # the usual case, checked without a Python loop
+        return np.array(values, dtype=float)
+    return np.array([value if isinstance(value, NUMBER_TYPES) and not isinstance(value, (bool, np.bool_)) else np.nan
+                     for value in values], dtype=float)
+
+# This function validates a model given as options, criteria, criterion_weights, factors, factor_weights
+# and scores, and returns a ValidationReport.
+
+def validate_model(options, criteria, criterion_weights, factors, factor_weights, scores,
+                   min_score=MIN_SCORE, max_score=MAX_SCORE):
+    report = ValidationReport()
+
+    _check_duplicates(report, options, "Option")
+    _check_duplicates(report, criteria, "Criterion")
+
+    # Criterion weights
+    present = [criterion for criterion in criteria if criterion in criterion_weights]
+    for criterion in criteria:
+        if criterion not in criterion_weights:
+            report.add("missing_weight", (criterion,), f"Criterion '{criterion}' has no weight.")
+    _check_weight_array(report, _as_floats([criterion_weights[criterion] for criterion in present]),
+                        [(criterion,) for criterion in present], "Criterion", ("criteria",))
+
+    # Factors and factor weights
+    columns = []
+    for criterion in criteria:
+        if criterion not in factors or not factors[criterion]:
+            report.add("missing_factors", (criterion,), f"Criterion '{criterion}' has no factors (use [criterion] for direct scoring).")
+            continue
+        _check_duplicates(report, factors[criterion], "Factor", (criterion,))
+        columns.extend((criterion, factor) for factor in factors[criterion])
+        if len(factors[criterion]) == 1 and factors[criterion][0] == criterion:
+            continue    # direct scoring, factor weights are not used
+        weights = factor_weights.get(criterion, {})
+        present = [factor for factor in factors[criterion] if factor in weights]
+        for factor in factors[criterion]:
+            if factor not in weights:
+                report.add("missing_weight", (criterion, factor), f"Factor '{factor}' of '{criterion}' has no weight.")
+        _check_weight_array(report, _as_floats([weights[factor] for factor in present]),
+                            [(criterion, factor) for factor in present], "Factor", (criterion,))
+
+    # Score cells, gathered in one pass with None marking a missing cell
+    missing = object()
+    empty = {}
+    cells = [
+        scores.get(option, empty).get(criterion, empty).get(factor, missing)
+        for option in options for criterion, factor in columns
+    ]
+    if cells:
+        cell_array = np.empty(len(cells), dtype=object)
+        cell_array[:] = cells
+        is_missing = np.equal(cell_array, missing)
+        values = _as_floats(np.where(is_missing, 0.0, cell_array).tolist())
+        invalid = ~is_missing & np.isnan(values)
+        out_of_bounds = ~is_missing & ~invalid & ~((values >= min_score) & (values <= max_score))
+
+        column_count = len(columns)
+        for i in np.flatnonzero(is_missing).tolist():
+            option, (criterion, factor) = options[i // column_count], columns[i % column_count]
+            report.add("missing_score", (option, criterion, factor), f"No score for '{option}' on '{factor}' ({criterion}).")
+        for i in np.flatnonzero(invalid).tolist():
+            option, (criterion, factor) = options[i // column_count], columns[i % column_count]
+            report.add("invalid_score", (option, criterion, factor),
+                       f"Score for '{option}' on '{factor}' ({criterion}) is not a number: {cells[i]!r}.")
+        for i in np.flatnonzero(out_of_bounds).tolist():
+            option, (criterion, factor) = options[i // column_count], columns[i % column_count]
+            report.add("score_out_of_bounds", (option, criterion, factor),
+                       f"Score for '{option}' on '{factor}' ({criterion}) is {values[i]}, outside {min_score}-{max_score}.")
+
+    return report
+
+# This function validates a DecisionMatrix with array operations only and returns a ValidationReport.
+
+def validate_matrix(matrix, min_score=MIN_SCORE, max_score=MAX_SCORE):
+    report = ValidationReport()
+
+    _check_duplicates(report, matrix.options, "Option")
+    _check_duplicates(report, matrix.criteria, "Criterion")
+    _check_duplicates(report, matrix.columns, "Column")
+
+    _check_weight_array(report, matrix.criterion_weights, [(criterion,) for criterion in matrix.criteria],
+                        "Criterion", ("criteria",))
+    for j, criterion in enumerate(matrix.criteria):
+        if matrix.direct[j]:
+            continue
+        start, stop = matrix.criterion_starts[j], matrix.criterion_starts[j + 1]
+        _check_weight_array(report, matrix.factor_weights[start:stop], matrix.columns[start:stop], "Factor", (criterion,))
+
+    invalid = np.isnan(matrix.scores)
+    out_of_bounds = ~invalid & ~((matrix.scores >= min_score) & (matrix.scores <= max_score))
+    for i, k in np.argwhere(invalid).tolist():
+        report.add("missing_score", (matrix.options[i],) + matrix.columns[k],
+                   f"No score for '{matrix.options[i]}' on '{matrix.columns[k][1]}' ({matrix.columns[k][0]}).")
+    for i, k in np.argwhere(out_of_bounds).tolist():
+        report.add("score_out_of_bounds", (matrix.options[i],) + matrix.columns[k],
+                   f"Score for '{matrix.options[i]}' on '{matrix.columns[k][1]}' ({matrix.columns[k][0]}) is "
+                   f"{matrix.scores[i, k]}, outside {min_score}-{max_score}.")
+    return report
@@ -0,0 +1,75 @@
+import math
+
+import numpy as np
+import pytest
+
+from decision_tool.aggregation import AggregationMethod, aggregate, ahp_priorities, ahp_weights, \
+    compare_aggregation_methods
+from decision_tool.matrix import DecisionMatrix
+
+# Three options on three directly scored criteria weighted 1, 1 and 2, i.e. effective weights 1/4, 1/4, 1/2
+SCORES = [[1.0, 2.0, 3.0],
+          [3.0, 1.0, 2.0],
+          [2.0, 2.0, 2.0]]
+WEIGHTS = [0.25, 0.25, 0.5]
+
+
+def example_matrix():
+    criteria = ["Cost", "Speed", "Quality"]
+    return DecisionMatrix(["A", "B", "C"], criteria, [(criterion, criterion) for criterion in criteria],
+                          SCORES, [1, 1, 2], [1, 1, 1])
+
+
+def test_weighted_product():
+    expected = [math.prod((s + 1) ** w for s, w in zip(row, WEIGHTS)) - 1 for row in SCORES]
+    assert aggregate(example_matrix(), "weighted_product") == pytest.approx(expected)
+    assert expected[2] == pytest.approx(2.0)    # equal scores everywhere give that score
+
+
+def test_ahp_distributive_synthesis():
+    column_sums = [6.0, 5.0, 7.0]
+    expected = [sum(w * s / total for s, w, total in zip(row, WEIGHTS, column_sums)) for row in SCORES]
+    assert aggregate(example_matrix(), "ahp") == pytest.approx(expected)
+
+
+def test_topsis():
+    norms = [math.sqrt(sum(row[j] ** 2 for row in SCORES)) for j in range(3)]
+    weighted = [[w * s / norm for s, w, norm in zip(row, WEIGHTS, norms)] for row in SCORES]
+    ideal = [max(row[j] for row in weighted) for j in range(3)]
+    anti_ideal = [min(row[j] for row in weighted) for j in range(3)]
+    expected = []
+    for row in weighted:
+        to_ideal = math.dist(row, ideal)
+        to_anti_ideal = math.dist(row, anti_ideal)
+        expected.append(to_anti_ideal / (to_ideal + to_anti_ideal))
+    assert aggregate(example_matrix(), "topsis") == pytest.approx(expected)
+
+
+def test_weighted_sum_and_all_methods_run_together():
+    results = compare_aggregation_methods(example_matrix())
+    assert set(results) == {"weighted_sum", "weighted_product", "topsis", "ahp"}
+    assert results["weighted_sum"] == pytest.approx([sum(w * s for s, w in zip(row, WEIGHTS)) for row in SCORES])
+
+
+def test_aggregation_method_is_abstract():
+    with pytest.raises(TypeError):
+        AggregationMethod()
+
+
+def test_ahp_priorities_and_consistency_ratio():
+    consistent = np.array([[1, 2, 4], [1 / 2, 1, 2], [1 / 4, 1 / 2, 1]])
+    inconsistent = np.array([[1, 3, 1 / 5], [1 / 3, 1, 5], [5, 1 / 5, 1]])
+    priorities, consistency_ratio = ahp_priorities(np.stack([consistent, inconsistent]))
+
+    assert priorities[0] == pytest.approx([4 / 7, 2 / 7, 1 / 7])
+    assert consistency_ratio[0] == pytest.approx(0.0, abs=1e-9)
+
+    # lambda_max from the priority vector, which the principal eigenvector satisfies exactly
+    lambda_max = np.mean(inconsistent @ priorities[1] / priorities[1])
+    assert priorities[1].sum() == pytest.approx(1.0)
+    assert consistency_ratio[1] == pytest.approx((lambda_max - 3) / 2 / 0.58)
+    assert consistency_ratio[1] > 0.1
+
+    weights, ratio = ahp_weights(["a", "b", "c"], {("a", "b"): 2, ("a", "c"): 4, ("b", "c"): 2})
+    assert weights == pytest.approx({"a": 4 / 7, "b": 2 / 7, "c": 1 / 7})
+    assert ratio == pytest.approx(0.0, abs=1e-9)
@@ -0,0 +1,26 @@
+import numpy as np
+
+from decision_tool.batch import score_model_files
+from decision_tool.examples import garfield_example, simple_2_by_2_example
+from decision_tool.matrix import compile_decision_matrix
+from decision_tool.model_file import save_decision_matrix
+from decision_tool.scoring import calculate_weighted_scores
+
+
+def test_batch_scores_valid_files_and_reports_invalid_ones(tmp_path):
+    save_decision_matrix(compile_decision_matrix(*garfield_example()), tmp_path / "garfield.dtm")
+    broken = compile_decision_matrix(*simple_2_by_2_example())
+    broken.scores[0, 0] = 9
+    save_decision_matrix(broken, tmp_path / "broken.dtm")
+
+    paths = [str(tmp_path / "garfield.dtm"), str(tmp_path / "broken.dtm")]
+    summary = score_model_files(paths, tmp_path / "out", workers=1, io_threads=2)
+
+    expected = calculate_weighted_scores(*garfield_example())
+    best = max(expected, key=expected.get)
+    garfield_row, broken_row = summary
+    assert garfield_row[3] == best
+    assert np.isclose(garfield_row[4], expected[best])
+    assert garfield_row[-1] == ""
+    assert broken_row[-1].startswith("ModelValidationError")
+    assert (tmp_path / "out" / "summary.csv").exists()
@@ -0,0 +1,63 @@
+import pytest
+
+from decision_tool.cache import LRUCache, ScoringCache, matrix_key
+from decision_tool.examples import garfield_example
+from decision_tool.matrix import compile_decision_matrix
+from decision_tool.scoring import calculate_weighted_scores
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.evictions == 1
+
+
+def test_byte_bound():
+    cache = LRUCache(max_entries=10, max_bytes=100)
+    cache.put("a", "x", size=60)
+    cache.put("b", "y", size=30)
+    cache.put("c", "z", size=30)    # 120 bytes: "a" has to go
+    assert "a" not in cache
+    assert cache.size_bytes == 60
+    cache.put("huge", "w", size=101)    # larger than the whole cache: not stored
+    assert "huge" not in cache
+    assert cache.stats()["bytes"] == 60
+
+
+def test_hit_and_miss_counters():
+    cache = LRUCache()
+    calls = []
+    for _ in range(3):
+        cache.get_or_compute("key", lambda: calls.append(1) or "value")
+    cache.get("other")
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_dictionary_scores_are_keyed_by_the_caller_and_copied():
+    cache = ScoringCache()
+    model = garfield_example()
+    first = cache.calculate_weighted_scores(("garfield", 1), *model)
+    first["Sleep"] = -1.0
+    assert cache.calculate_weighted_scores(("garfield", 1), *model) == calculate_weighted_scores(*model)
+    assert cache.stats()["hits"] == 1
+
+
+def test_matrix_breakdown_is_keyed_by_its_contents():
+    cache = ScoringCache()
+    matrix = compile_decision_matrix(*garfield_example())
+    key = matrix_key(matrix)
+    breakdown = cache.score_breakdown(matrix)
+    assert cache.score_breakdown(compile_decision_matrix(*garfield_example())) is breakdown
+
+    matrix.scores[0, 0] = 4.5 if matrix.scores[0, 0] != 4.5 else 3.5
+    assert matrix_key(matrix) != key
+    assert cache.score_breakdown(matrix).option_scores == pytest.approx(matrix.option_scores())
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from decision_tool.compact import CompactModel
+from decision_tool.examples import garfield_example, mixed_factors_example, simple_2_by_2_example
+from decision_tool.matrix import compile_decision_matrix
+from decision_tool.scoring import calculate_weighted_scores
+
+EXAMPLES = [simple_2_by_2_example, mixed_factors_example, garfield_example]
+
+
+def direct(factors, criterion):
+    return factors[criterion] == [criterion]
+
+
+@pytest.mark.parametrize("example", EXAMPLES)
+def test_dictionary_round_trip(example):
+    options, criteria, criterion_weights, factors, factor_weights, scores = example()
+    restored = CompactModel.from_dicts(options, criteria, criterion_weights, factors, factor_weights, scores).to_dicts()
+    restored_options, restored_criteria, restored_criterion_weights, restored_factors, restored_factor_weights, restored_scores = restored
+
+    assert restored_options == options
+    assert restored_criteria == criteria
+    assert restored_criterion_weights == criterion_weights
+    assert restored_factors == factors
+    assert restored_scores == scores
+    for criterion in criteria:
+        if not direct(factors, criterion):    # direct criteria carry no factor weights of their own
+            assert restored_factor_weights[criterion] == factor_weights[criterion]
+    assert calculate_weighted_scores(*restored) == pytest.approx(calculate_weighted_scores(*example()))
+
+
+@pytest.mark.parametrize("example", EXAMPLES)
+def test_matrix_round_trip(example):
+    matrix = compile_decision_matrix(*example())
+    restored = CompactModel.from_matrix(matrix).to_matrix()
+    assert restored.options == matrix.options
+    assert restored.criteria == matrix.criteria
+    assert restored.columns == matrix.columns
+    assert np.shares_memory(restored.scores, matrix.scores)
+    assert np.array_equal(restored.criterion_weights, matrix.criterion_weights)
+    assert np.array_equal(restored.factor_weights, matrix.factor_weights)
+    assert restored.option_scores() == matrix.option_scores()
+
+
+@pytest.mark.parametrize("example", EXAMPLES)
+def test_score_lookup(example):
+    options, criteria, criterion_weights, factors, factor_weights, scores = example()
+    compact = CompactModel.from_dicts(*example())
+    for option in options:
+        for criterion in criteria:
+            for factor in factors[criterion]:
+                assert compact.score(option, criterion, factor) == scores[option][criterion][factor]
+
+
+def test_float32_scores():
+    model = garfield_example()
+    compact = CompactModel.from_dicts(*model, dtype=np.float32)
+    full = CompactModel.from_dicts(*model)
+    assert compact.scores.dtype == np.float32
+    assert compact.scores.nbytes * 2 == full.scores.nbytes
+    assert np.array_equal(compact.scores, full.scores)    # whole-number scores are exact
+    assert compact.to_dicts()[5] == model[5]
+    assert compact.to_matrix().option_scores() == pytest.approx(calculate_weighted_scores(*model))
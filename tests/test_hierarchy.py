@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from decision_tool.examples import garfield_example, mixed_factors_example, simple_2_by_2_example
+from decision_tool.hierarchy import CriteriaTree, HierarchicalModel, compile_hierarchical_model, hierarchy_from_model
+from decision_tool.scoring import calculate_weighted_scores
+
+
+# A random tree of the given depth: the first child of every node goes all the way down.
+def random_tree(rng, depth, prefix="n"):
+    tree = {}
+    for c in range(rng.integers(2, 4)):
+        name = f"{prefix}{c}"
+        weight = float(rng.integers(0, 5)) if c else float(rng.integers(1, 5))
+        if depth > 0 and (c == 0 or rng.random() < 0.5):
+            tree[name] = (weight, random_tree(rng, depth - 1, name + "."))
+        else:
+            tree[name] = weight
+    return tree
+
+
+def subtree(tree, path):
+    node = (None, tree)
+    for name in path:
+        node = node[1][name]
+    return node
+
+
+def set_tree_weight(tree, path, weight):
+    parent = subtree(tree, path[:-1])[1]
+    value = parent[path[-1]]
+    parent[path[-1]] = (weight, value[1]) if isinstance(value, tuple) else weight
+
+
+# Reference score of every option on a node, straight from the nested dictionaries.
+def reference_node_scores(node, path, scores, leaf_index):
+    if not isinstance(node, tuple):
+        return scores[:, leaf_index[path]]
+    children = node[1]
+    weights = np.array([child[0] if isinstance(child, tuple) else child for child in children.values()], dtype=float)
+    weights = weights / weights.sum() if weights.sum() > 0 else weights
+    return sum(w * reference_node_scores(child, path + (name,), scores, leaf_index)
+               for w, (name, child) in zip(weights, children.items()))
+
+
+@pytest.mark.parametrize("example", [simple_2_by_2_example, mixed_factors_example, garfield_example])
+def test_two_level_model_matches_dict_scoring(example):
+    model = example()
+    assert hierarchy_from_model(*model).option_scores() == pytest.approx(calculate_weighted_scores(*model), abs=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_deep_weight_edits_match_a_fresh_compile(seed):
+    rng = np.random.default_rng(seed)
+    tree = random_tree(rng, 5)
+    compiled = CriteriaTree(tree)
+    options = [f"option {i}" for i in range(30)]
+    model = HierarchicalModel(options, CriteriaTree(tree), rng.uniform(0, 5, (len(options), len(compiled.leaf_paths))))
+
+    deep_interior = [path for n, path in enumerate(compiled.paths) if compiled.depths[n] >= 3 and not compiled.is_leaf[n]]
+    assert deep_interior
+    for _ in range(10):
+        path = deep_interior[rng.integers(len(deep_interior))]
+        weight = float(rng.uniform(0, 5))
+        start, stop = compiled.set_weight(path, weight)
+        assert (start, stop) == compiled.leaf_range(path[:-1])
+        assert all(p[:len(path) - 1] == path[:-1] for p in compiled.leaf_paths[start:stop])
+        assert sum(p[:len(path) - 1] == path[:-1] for p in compiled.leaf_paths) == stop - start
+        model.set_weight(path, weight)
+        set_tree_weight(tree, path, weight)
+
+    fresh = HierarchicalModel(options, CriteriaTree(tree), model.scores)
+    assert np.allclose(compiled.leaf_weights, fresh.tree.leaf_weights)
+    assert np.allclose(model.tree.leaf_weights, fresh.tree.leaf_weights)
+    assert np.allclose(model.total_scores(), fresh.total_scores())
+
+
+def test_node_scores():
+    rng = np.random.default_rng(7)
+    tree = random_tree(rng, 4)
+    compiled = CriteriaTree(tree)
+    scores = rng.uniform(0, 5, (12, len(compiled.leaf_paths)))
+    model = HierarchicalModel([f"option {i}" for i in range(12)], compiled, scores)
+
+    for path in compiled.paths:
+        if compiled.path_weights[compiled.node_index[path]] > 0:
+            expected = reference_node_scores(subtree(tree, path), path, scores, compiled.leaf_index)
+            assert np.allclose(model.node_scores(path), expected)
+    assert np.allclose(model.total_scores(), reference_node_scores((1.0, tree), (), scores, compiled.leaf_index))
+
+
+def test_nested_score_dictionaries():
+    tree = {"Cost": (4, {"Hardware": 5, "Running": (3, {"Energy": 2, "Staff": 1})}), "Speed": 3}
+    scores = {"A": {"Cost": {"Hardware": 2, "Running": {"Energy": 4, "Staff": 1}}, "Speed": 5}}
+    model = compile_hierarchical_model(["A"], tree, scores)
+    running = (2 * 4 + 1 * 1) / 3
+    cost = (5 * 2 + 3 * running) / 8
+    assert model.option_scores()["A"] == pytest.approx((4 * cost + 3 * 5) / 7)
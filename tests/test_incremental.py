@@ -0,0 +1,27 @@
+import numpy as np
+
+from decision_tool.benchmark import synthetic_example
+from decision_tool.incremental import DecisionModel
+from decision_tool.matrix import compile_decision_matrix
+
+
+def test_edits_match_a_full_recompute():
+    matrix = compile_decision_matrix(*synthetic_example(300, 6, seed=1))
+    model = DecisionModel(matrix)
+    rng = np.random.default_rng(1)
+
+    for _ in range(200):
+        kind = rng.integers(3)
+        if kind == 0:
+            option = matrix.options[rng.integers(len(matrix.options))]
+            criterion, factor = matrix.columns[rng.integers(len(matrix.columns))]
+            model.set_score(option, criterion, factor, float(rng.uniform(0, 5)))
+        elif kind == 1:
+            model.set_criterion_weight(matrix.criteria[rng.integers(len(matrix.criteria))], float(rng.uniform(0.1, 5)))
+        else:
+            factored = [column for k, column in enumerate(matrix.columns) if not matrix.direct[matrix.column_criterion[k]]]
+            criterion, factor = factored[rng.integers(len(factored))]
+            model.set_factor_weight(criterion, factor, float(rng.uniform(0.1, 5)))
+
+    recomputed = compile_decision_matrix(*model.to_matrix().to_model())
+    assert np.allclose(model.total_scores(), recomputed.total_scores(), atol=1e-9)
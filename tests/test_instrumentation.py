@@ -0,0 +1,100 @@
+import json
+import subprocess
+import sys
+import threading
+
+from decision_tool import instrumentation
+from decision_tool.examples import garfield_example
+from decision_tool.scoring import calculate_weighted_scores
+
+BIG = 50 * 1024 * 1024
+
+
+def run_capture(tmp_path, body):
+    path = tmp_path / "profile.json"
+    with instrumentation.capture(str(path), profile=False):
+        body()
+    return json.loads(path.read_text())
+
+
+def test_scoring_import_does_not_load_profilers():
+    code = ("import sys, decision_tool.scoring; "
+            "print(sorted(m for m in ('cProfile', 'pstats', 'tracemalloc', 'json') if m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
+
+
+def test_overall_peak_survives_stages_after_allocation(tmp_path):
+    def body():
+        block = bytearray(BIG)
+        del block
+        calculate_weighted_scores(*garfield_example())    # stages reset the tracemalloc peak
+
+    assert run_capture(tmp_path, body)["peak_memory_bytes"] >= BIG
+
+
+def test_peak_inside_a_stage(tmp_path):
+    def body():
+        with instrumentation.timer("allocate"):
+            block = bytearray(BIG)
+            del block
+        calculate_weighted_scores(*garfield_example())
+
+    result = run_capture(tmp_path, body)
+    assert result["peak_memory_bytes"] >= BIG
+    assert result["stages"]["allocate"]["peak_memory_bytes"] >= BIG
+    assert result["stages"]["calculate_weighted_scores"]["calls"] == 1
+
+
+def test_disabled_by_default_and_restored():
+    assert not instrumentation.is_enabled()
+    instrumentation.reset()
+    calculate_weighted_scores(*garfield_example())
+    assert instrumentation.stats()["stages"] == {}
+
+
+def test_threads_keep_their_own_stage_stacks(tmp_path):
+    first_open, second_open, first_closed = threading.Event(), threading.Event(), threading.Event()
+    held = []
+
+    def first():
+        with instrumentation.timer("first"):
+            first_open.set()
+            second_open.wait()
+        first_closed.set()
+
+    def second():
+        first_open.wait()
+        held.append(bytearray(BIG))    # allocated while "first" is open, before "second" starts
+        with instrumentation.timer("second"):
+            second_open.set()
+            first_closed.wait()    # "first" closes while "second" is still open
+
+    def body():
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    stages = run_capture(tmp_path, body)["stages"]
+    assert stages["first"]["peak_memory_bytes"] >= BIG
+    assert stages["second"]["peak_memory_bytes"] < BIG // 10
+
+
+def test_counts_from_many_threads(tmp_path):
+    def work():
+        for _ in range(500):
+            with instrumentation.timer("work"):
+                instrumentation.count("items")
+
+    def body():
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    result = run_capture(tmp_path, body)
+    assert result["stages"]["work"]["calls"] == 4000
+    assert result["counters"]["items"] == 4000
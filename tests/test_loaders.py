@@ -0,0 +1,46 @@
+import pytest
+
+from decision_tool.loaders import load_decision_tables
+
+WEIGHTS = """criterion,factor,weight
+Cost,,2
+Quality,,3
+Quality,Build,1
+Quality,Finish,1
+"""
+
+SCORES = """option,criterion,factor,score
+A,Cost,,4
+A,Quality,Build,3
+A,Quality,Finish,5
+B,Cost,,2
+B,Quality,Build,5
+B,Quality,Finish,4
+"""
+
+
+def load(tmp_path, scores):
+    (tmp_path / "weights.csv").write_text(WEIGHTS, encoding="utf-8")
+    (tmp_path / "scores.csv").write_text(scores, encoding="utf-8")
+    return load_decision_tables(tmp_path / "scores.csv", tmp_path / "weights.csv")
+
+
+def test_tables_load(tmp_path):
+    matrix = load(tmp_path, SCORES)
+    assert matrix.options == ["A", "B"]
+    assert matrix.option_scores()["A"] == pytest.approx((4 * 2 + 4 * 3) / 5)
+
+
+def test_duplicate_score_is_reported(tmp_path):
+    with pytest.raises(ValueError, match=r"Row 8: duplicate score for 'B'"):
+        load(tmp_path, SCORES + "B,Cost,,3\n")
+
+
+def test_missing_score_is_reported(tmp_path):
+    with pytest.raises(ValueError, match=r"1 score\(s\) missing, first for 'B'"):
+        load(tmp_path, SCORES.replace("B,Quality,Finish,4\n", ""))
+
+
+def test_out_of_bounds_score_is_reported(tmp_path):
+    with pytest.raises(ValueError, match=r"1 score\(s\) outside 0-5, first at row 3: 7"):
+        load(tmp_path, SCORES.replace("A,Quality,Build,3", "A,Quality,Build,7"))
@@ -0,0 +1,18 @@
+import pytest
+
+from decision_tool.examples import garfield_example, mixed_factors_example, simple_2_by_2_example
+from decision_tool.matrix import compile_decision_matrix
+from decision_tool.scoring import calculate_score_breakdown, calculate_weighted_scores
+
+
+@pytest.mark.parametrize("example", [simple_2_by_2_example, mixed_factors_example, garfield_example])
+def test_matrix_matches_dict_scoring(example):
+    model = example()
+    expected = calculate_weighted_scores(*model)
+    matrix = compile_decision_matrix(*model)
+    assert matrix.option_scores() == pytest.approx(expected, abs=1e-12)
+
+    breakdown = calculate_score_breakdown(*model)
+    matrix_breakdown = matrix.score_breakdown()
+    for option in breakdown.options:
+        assert matrix_breakdown.criterion_scores[option] == pytest.approx(breakdown.criterion_scores[option], abs=1e-12)
@@ -0,0 +1,37 @@
+import numpy as np
+
+from decision_tool.benchmark import synthetic_example
+from decision_tool.matrix import compile_decision_matrix, evaluate_weight_scenarios
+from decision_tool.parallel import ParallelScenarioExecutor
+
+
+def example_matrix():
+    return compile_decision_matrix(*synthetic_example(200, 6, seed=4))
+
+
+def test_scenarios_match_the_single_process_result():
+    matrix = example_matrix()
+    rng = np.random.default_rng(0)
+    criterion_weights = rng.uniform(0, 5, (23, len(matrix.criteria)))
+    factor_weights = rng.uniform(0, 5, (23, len(matrix.columns)))
+
+    with ParallelScenarioExecutor(matrix, workers=2) as executor:
+        for weights in ((criterion_weights, None), (None, factor_weights), (criterion_weights, factor_weights),
+                        (criterion_weights[0], factor_weights)):
+            assert np.allclose(executor.evaluate_weight_scenarios(*weights, shards=5),
+                               evaluate_weight_scenarios(matrix, *weights))
+        empty = executor.evaluate_weight_scenarios(criterion_weights[:0])
+    assert empty.shape == (len(matrix.options), 0)
+
+
+def test_sensitivity_does_not_depend_on_the_worker_count():
+    matrix = example_matrix()
+    results = []
+    for workers in (1, 3):
+        with ParallelScenarioExecutor(matrix, workers=workers) as executor:
+            results.append(executor.weight_sensitivity_analysis(draws=5000, seed=11, shard_draws=1200))
+    one, three = results
+    assert one.draws == three.draws == 5000
+    for name, value in vars(one).items():
+        if isinstance(value, np.ndarray):
+            assert np.array_equal(value, getattr(three, name)), name
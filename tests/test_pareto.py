@@ -0,0 +1,34 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from decision_tool.pareto import pareto_front
+
+
+def brute_force_front(points):
+    front = []
+    for i, point in enumerate(points):
+        if not any((other >= point).all() and (other > point).any() for other in points):
+            front.append(i)
+    return np.array(front, dtype=np.intp)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_front_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    count, dimensions = rng.integers(1, 120), rng.integers(1, 5)
+    points = rng.integers(0, 6, size=(count, dimensions)).astype(float)    # small range, so ties and duplicates
+    assert np.array_equal(pareto_front(points, block_size=16), brute_force_front(points))
+
+
+def test_within_block_check_is_chunked():
+    points = np.random.default_rng(0).random((2000, 300))
+    tracemalloc.start()
+    try:
+        front = pareto_front(points, block_size=2000)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert len(front) == 2000
+    assert peak < 100 * 1024 * 1024
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from decision_tool.ranking import Leaderboard, top_k_options
+
+SCORES = {"a": 5.0, "b": 4.0, "c": 4.0 + 1e-10, "d": 4.0, "e": 1.0}
+
+
+@pytest.mark.parametrize("as_array", [False, True])
+def test_ties_at_the_kth_place_are_kept_together(as_array):
+    def top(k):
+        if as_array:
+            return top_k_options(np.array(list(SCORES.values())), k, options=list(SCORES))
+        return top_k_options(SCORES, k)
+
+    tied = (5.0, ["a"]), (pytest.approx(4.0), ["c", "b", "d"])    # best first within the tie, then in order
+    assert top(1) == [(5.0, ["a"])]
+    for k in (2, 3, 4):
+        assert top(k) == list(tied)
+    assert top(5) == list(tied) + [(1.0, ["e"])]
+    assert top(50) == top(5)
+    assert top(0) == []
+
+
+def test_array_without_names_gives_indices():
+    assert top_k_options(np.array([1.0, 3.0, 3.0, 2.0]), 1) == [(3.0, [1, 2])]
+
+
+def test_leaderboard_follows_a_full_sort_after_random_edits():
+    rng = np.random.default_rng(0)
+    options = [f"option {i}" for i in range(60)]
+    totals = rng.integers(0, 10, len(options)).astype(float)    # whole numbers, so ties are common
+    leaderboard = Leaderboard(options, totals)
+
+    for step in range(300):
+        i = rng.integers(len(options))
+        totals[i] = float(rng.integers(0, 10))
+        leaderboard.update(options[i], totals[i])
+
+        order = sorted(range(len(options)), key=lambda n: (-totals[n], n))
+        for rank, n in enumerate(order[:10], start=1):
+            assert leaderboard.rank(options[n]) == rank
+        k = int(rng.integers(1, 15))
+        assert leaderboard.top(k) == top_k_options(dict(zip(options, totals.tolist())), k)
+
+    assert leaderboard.best() == top_k_options(dict(zip(options, totals.tolist())), 1)[0]
+    assert [leaderboard.rank(option) for option in options] == \
+        [sorted(range(len(options)), key=lambda n: (-totals[n], n)).index(i) + 1 for i in range(len(options))]
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from decision_tool.examples import garfield_example
+from decision_tool.raters import RATER_AGGREGATIONS, aggregate_rater_scores, analyse_panel, average_ranks, \
+    compile_rater_panel, kendalls_w
+
+
+def test_median_matches_numpy_for_equal_weights():
+    rng = np.random.default_rng(0)
+    for raters in (3, 4, 5, 6):    # odd and even counts
+        scores = rng.uniform(0, 5, (raters, 7, 3))
+        median = aggregate_rater_scores(scores, np.full(raters, 1 / raters), "median")
+        assert np.allclose(median, np.median(scores, axis=0))
+
+
+def test_weighted_median():
+    scores = np.array([[1.0], [2.0], [3.0]])
+    assert aggregate_rater_scores(scores, [0.6, 0.2, 0.2], "median")[0] == 1.0
+    assert aggregate_rater_scores(scores, [0.2, 0.2, 0.6], "median")[0] == 3.0
+    # Cumulative weight reaches exactly one half at the first score: average it with the next one
+    assert aggregate_rater_scores(scores, [0.5, 0.25, 0.25], "median")[0] == 1.5
+    assert aggregate_rater_scores(np.array([[4.0], [1.0], [3.0], [2.0]]), [0.25] * 4, "median")[0] == 2.5
+
+
+def test_trimmed_mean_limits():
+    rng = np.random.default_rng(1)
+    scores = rng.uniform(0, 5, (5, 6, 4))
+    weights = rng.uniform(0.5, 2, 5)
+    weights /= weights.sum()
+    assert np.allclose(aggregate_rater_scores(scores, weights, "trimmed", trim=0.0),
+                       aggregate_rater_scores(scores, weights, "mean"))
+
+    equal = np.full(5, 0.2)
+    assert np.allclose(aggregate_rater_scores(scores, equal, "trimmed", trim=0.2),    # drops one rater each side
+                       np.sort(scores, axis=0)[1:4].mean(axis=0))
+    assert np.allclose(aggregate_rater_scores(scores, equal, "trimmed", trim=0.4999),
+                       np.median(scores, axis=0))
+    for trim in (-0.1, 0.5):
+        with pytest.raises(ValueError):
+            aggregate_rater_scores(scores, equal, "trimmed", trim=trim)
+
+
+def test_average_ranks_share_tied_places():
+    assert average_ranks(np.array([3.0, 5.0, 5.0, 1.0])).tolist() == [[3.0, 1.5, 1.5, 4.0]]
+    assert average_ranks(np.array([2.0, 2.0, 2.0])).tolist() == [[2.0, 2.0, 2.0]]
+
+
+def test_kendalls_w_with_ties():
+    ranks = np.array([[1, 2, 3, 4], [1, 2.5, 2.5, 4], [2, 1, 3, 4]])
+    # Rank sums 4, 5.5, 8.5, 12 spread 37.5 from their mean; one tie of two gives a correction of 6
+    assert kendalls_w(ranks) == pytest.approx(12 * 37.5 / (3 ** 2 * (4 ** 3 - 4) - 3 * 6))
+    assert kendalls_w(np.array([[1, 2, 3], [1, 2, 3]])) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("method", RATER_AGGREGATIONS)
+def test_identical_raters_agree_completely(method):
+    options, criteria, criterion_weights, factors, factor_weights, scores = garfield_example()
+    panel = compile_rater_panel(options, criteria, criterion_weights, factors, factor_weights,
+                                {"Jon": scores, "Liz": scores, "Odie": scores}, {"Jon": 2, "Liz": 1, "Odie": 1})
+    result = analyse_panel(panel, method)
+
+    assert np.allclose(result.consensus.scores, panel.matrix.scores)
+    assert np.allclose(result.rater_totals, result.consensus_totals)
+    assert np.allclose(result.score_spread, 0.0)
+    assert result.concordance == pytest.approx(1.0)
+    assert np.allclose(result.rater_correlations, 1.0)
+    assert np.allclose(result.consensus_correlations, 1.0)
+    assert result.mean_rater_correlation() == pytest.approx(1.0)
+    assert result.top_choice_agreement == pytest.approx(1.0)
@@ -0,0 +1,141 @@
+import contextlib
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from decision_tool.examples import garfield_example, mixed_factors_example
+from decision_tool.report import ReportWriter, display_results, format_plain_table, report_selection, \
+    save_display_results_to_file, write_results
+from decision_tool.scoring import calculate_score_breakdown, calculate_weighted_scores
+
+DATA = Path(__file__).parent / "data"
+
+
+def garfield_results():
+    options, criteria, criterion_weights, factors, factor_weights, scores = garfield_example()
+    option_scores = calculate_weighted_scores(options, criteria, criterion_weights, factors, factor_weights, scores)
+    return option_scores, scores, criterion_weights, factor_weights
+
+
+# The expected files hold what display_results printed before the report was streamed
+@pytest.mark.parametrize("name, example", [("garfield", garfield_example), ("mixed_factors", mixed_factors_example)])
+def test_text_report_is_unchanged(name, example):
+    options, criteria, criterion_weights, factors, factor_weights, scores = example()
+    option_scores = calculate_weighted_scores(options, criteria, criterion_weights, factors, factor_weights, scores)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        display_results(option_scores, scores, criterion_weights, factor_weights)
+    assert output.getvalue() == (DATA / f"{name}_results.txt").read_text(encoding="utf-8")
+
+
+def test_csv_report(tmp_path):
+    option_scores, scores, criterion_weights, factor_weights = garfield_results()
+    filename = tmp_path / "results.csv"
+    save_display_results_to_file(option_scores, scores, criterion_weights, factor_weights, filename=str(filename))
+    with open(filename, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+
+    results = [row for row in rows if row[0] == "Decision Results" and row[2:] != ["Option", "Score"] and row[1] == ""]
+    assert {option: float(score) for _, _, option, score in results} == pytest.approx(option_scores)
+    assert [option for _, _, option, _ in results] == sorted(option_scores, key=option_scores.get, reverse=True)
+    best = max(option_scores, key=option_scores.get)
+    assert ["Decision Results", "note", f"Best Option: {best} with a score of {option_scores[best]:.2f}"] in rows
+
+    raw = [row for row in rows if row[0] == "Raw Scores (Criteria -> Factors)" and row[2:] != ["Criterion", "Factor", "Score"]]
+    assert len(raw) == sum(len(factors) for option in scores.values() for factors in option.values())
+    for _, label, criterion, factor, score in raw:
+        assert float(score) == scores[label.removeprefix("Option: ")][criterion][factor]
+
+
+def test_jsonl_report(tmp_path):
+    option_scores, scores, criterion_weights, factor_weights = garfield_results()
+    filename = tmp_path / "results.jsonl"
+    save_display_results_to_file(option_scores, scores, criterion_weights, factor_weights, filename=str(filename))
+    records = [json.loads(line) for line in filename.read_text(encoding="utf-8").splitlines()]
+
+    results = [record for record in records if record["section"] == "Decision Results" and "Option" in record]
+    assert {record["Option"]: record["Score"] for record in results} == pytest.approx(option_scores)
+
+    weights = [record for record in records if record["section"] == "Normalized Criterion Weights"]
+    total = sum(criterion_weights.values())
+    assert {record["Criterion"]: record["Normalized Weight"] for record in weights} == \
+        pytest.approx({criterion: weight / total for criterion, weight in criterion_weights.items()})
+
+    weighted = [record for record in records if record["section"] == "Weighted Criterion Scores"]
+    assert len(weighted) == len(scores) * len(criterion_weights)
+    for option in option_scores:
+        option_total = sum(record["Weighted Score"] for record in weighted if record["table"] == f"Option: {option}")
+        assert option_total == pytest.approx(option_scores[option])
+
+
+def garfield_breakdown():
+    return calculate_score_breakdown(*garfield_example())
+
+
+def ranked_names(breakdown):
+    return [option for option, _ in breakdown.ranked_options()]
+
+
+def test_report_selection_modes():
+    breakdown = garfield_breakdown()
+    ranking = ranked_names(breakdown)
+
+    details, ranked = report_selection(breakdown, "full")
+    assert details == breakdown.options and [option for option, _ in ranked] == ranking
+
+    details, ranked = report_selection(breakdown, "summary", top_k=2)
+    assert details == [] and [option for option, _ in ranked] == ranking[:2]
+
+    details, ranked = report_selection(breakdown, "top", top_k=3)
+    assert details == ranking[:3] and [option for option, _ in ranked] == ranking[:3]
+
+    with pytest.raises(ValueError):
+        report_selection(breakdown, "everything")
+
+
+def test_report_pages():
+    breakdown = garfield_breakdown()
+    ranking = ranked_names(breakdown)
+    assert report_selection(breakdown, "page", page_size=2, offset=0)[0] == ranking[0:2]
+    assert report_selection(breakdown, "page", page_size=2, offset=2)[0] == ranking[2:4]
+    assert report_selection(breakdown, "page", page_size=2, offset=4)[0] == ranking[4:]
+    assert report_selection(breakdown, "page", page_size=2, offset=5) == ([], [])
+    for page_size, offset in ((0, 0), (2, -1)):
+        with pytest.raises(ValueError):
+            report_selection(breakdown, "page", page_size=page_size, offset=offset)
+
+    output = io.StringIO()
+    write_results(ReportWriter(output), breakdown, mode="page", page_size=2, offset=2)
+    assert f"(options ranked 3 to 4 of {len(ranking)})" in output.getvalue()
+    output = io.StringIO()
+    write_results(ReportWriter(output), breakdown, mode="page", page_size=2, offset=10)
+    assert f"(no options in this range; there are {len(ranking)})" in output.getvalue()
+
+
+@pytest.mark.parametrize("mode, shown", [("summary", 0), ("top", 2), ("page", 2)])
+def test_per_option_tables_only_for_selected_options(mode, shown):
+    breakdown = garfield_breakdown()
+    ranking = ranked_names(breakdown)
+    output = io.StringIO()
+    write_results(ReportWriter(output, plain_tables=True), breakdown, mode=mode, top_k=2, page_size=2, offset=1)
+    text = output.getvalue()
+
+    selected = ranking[1:3] if mode == "page" else ranking[:shown]
+    for option in ranking:
+        assert text.count(f"\nOption: {option}\n") == (2 if option in selected else 0)    # raw and weighted tables
+    assert ("Raw Scores" in text) == bool(shown)
+    assert "Normalized Criterion Weights" in text
+
+
+def test_plain_table_alignment():
+    text = format_plain_table(["Option", "Score", "Rank"], [["Sleep", "1.13", 5], ["Eat Jon's lasagne", "12.76", 10]])
+    assert text.splitlines() == [
+        "Option             Score  Rank",
+        "-----------------  -----  ----",
+        "Sleep               1.13     5",
+        "Eat Jon's lasagne  12.76    10",
+    ]
+    assert format_plain_table(["A", "B"], []).splitlines() == ["A  B", "-  -"]
@@ -0,0 +1,9 @@
+from decision_tool.benchmark import synthetic_example
+from decision_tool.scoring import calculate_score_breakdown, calculate_weighted_scores
+
+
+def test_weighted_scores_match_breakdown_totals():
+    example = synthetic_example(200, 8, seed=3)
+    totals = calculate_weighted_scores(*example)
+    breakdown = calculate_score_breakdown(*example)
+    assert totals == breakdown.option_scores
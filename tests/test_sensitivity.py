@@ -0,0 +1,48 @@
+import tracemalloc
+
+import numpy as np
+
+from decision_tool.benchmark import synthetic_example
+from decision_tool.examples import garfield_example
+from decision_tool.matrix import DecisionMatrix, compile_decision_matrix
+from decision_tool.sensitivity import SensitivityAccumulator, weight_sensitivity_analysis
+
+
+def test_default_max_rank_is_bounded():
+    accumulator = SensitivityAccumulator([f"Option {i}" for i in range(20000)])
+    assert accumulator.rank_counts.shape == (20000, 10)
+    assert SensitivityAccumulator(["a", "b", "c"]).rank_counts.shape == (3, 3)
+    assert SensitivityAccumulator(["a", "b", "c"], max_rank=None).rank_counts.shape == (3, 3)
+
+
+def test_first_rank_shares_add_up():
+    matrix = compile_decision_matrix(*garfield_example())
+    accumulator = weight_sensitivity_analysis(matrix, draws=5000, seed=1)
+    assert accumulator.draws == 5000
+    assert np.allclose(accumulator.rank_acceptability().sum(axis=0), 1.0)
+    assert accumulator.rank_acceptability()[matrix.options.index("Eat Jon's lasagne"), 0] > 0.5
+
+
+def test_chunks_are_sized_by_columns_too():
+    # Few options but many columns: the draws x columns weight arrays must stay bounded
+    criteria = [f"C{j}" for j in range(107)]
+    columns = [(criterion, f"{criterion} f{k}") for criterion in criteria for k in range(4)]
+    scores = np.random.default_rng(0).random((4, len(columns))) * 5
+    matrix = DecisionMatrix(["a", "b", "c", "d"], criteria, columns, scores, np.ones(len(criteria)), np.ones(len(columns)))
+    tracemalloc.start()
+    try:
+        weight_sensitivity_analysis(matrix, draws=50000, seed=0)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 400 * 1024 * 1024
+
+
+def test_pareto_only_keeps_first_rank_shares():
+    matrix = compile_decision_matrix(*synthetic_example(3000, 4, seed=2))
+    full = weight_sensitivity_analysis(matrix, draws=2000, seed=0, vary="criteria", max_rank=1)
+    front = weight_sensitivity_analysis(matrix, draws=2000, seed=0, vary="criteria", max_rank=1, pareto_only=True)
+    shares = dict(zip(full.options, full.rank_acceptability()[:, 0]))
+    assert len(front.options) < len(full.options)
+    for option, share in zip(front.options, front.rank_acceptability()[:, 0]):
+        assert abs(shares[option] - share) < 1e-12
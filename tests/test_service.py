@@ -0,0 +1,68 @@
+import asyncio
+import json
+import time
+
+from decision_tool.benchmark import synthetic_example
+
+from decision_tool.examples import garfield_example
+from decision_tool.service import MODEL_FIELDS, ScoringService, scoring_executor
+
+
+def test_same_model_is_scored_once_whatever_its_formatting():
+    model = dict(zip(MODEL_FIELDS, garfield_example()))
+    compact = json.dumps(model, separators=(",", ":")).encode("utf-8")
+    reordered = json.dumps(dict(reversed(list(model.items()))), indent=4, sort_keys=True).encode("utf-8")
+
+    async def run():
+        with scoring_executor(1) as executor:
+            service = ScoringService(executor)
+            first = await service.respond("POST", "/score", compact)
+            second = await service.respond("POST", "/score", reordered)
+        return first, second, service.counts
+
+    first, second, counts = asyncio.run(run())
+    assert first == second
+    assert first[0] == 200
+    assert counts["computations"] == 1
+
+
+def test_bad_content_length_is_a_400():
+    async def run():
+        with scoring_executor(1) as executor:
+            service = ScoringService(executor)
+            server = await service.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"POST /score HTTP/1.1\r\nContent-Length: lots\r\n\r\n")
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            server.close()
+            await server.wait_closed()
+        return response
+
+    response = asyncio.run(run())
+    assert response.startswith(b"HTTP/1.1 400 ")
+    assert b"Content-Length" in response
+
+
+def test_event_loop_keeps_running_while_a_large_body_is_keyed():
+    body = json.dumps(dict(zip(MODEL_FIELDS, synthetic_example(5000, 40, seed=2)))).encode("utf-8")
+
+    async def run():
+        with scoring_executor(1) as executor:
+            service = ScoringService(executor)
+            await service.respond("POST", "/score", json.dumps(dict(zip(MODEL_FIELDS, garfield_example()))).encode("utf-8"))
+
+            request = asyncio.ensure_future(service.respond("POST", "/score", body))
+            longest, last = 0.0, time.perf_counter()
+            while not request.done():
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                longest, last = max(longest, now - last), now
+            status, _ = await request
+        return status, longest
+
+    status, longest = asyncio.run(run())
+    assert status == 200
+    assert longest < 0.1
@@ -0,0 +1,54 @@
+import copy
+
+import numpy as np
+import pytest
+
+from decision_tool.benchmark import synthetic_example
+from decision_tool.matrix import compile_decision_matrix
+from decision_tool.scoring import calculate_weighted_scores
+from decision_tool.stability import weight_stability_intervals
+
+
+def best_option(model):
+    option_scores = calculate_weighted_scores(*model)
+    return max(option_scores, key=option_scores.get)
+
+
+def with_criterion_weight(model, criterion, weight):
+    model = copy.deepcopy(model)
+    model[2][criterion] = weight
+    return model
+
+
+def with_factor_weight(model, criterion, factor, weight):
+    model = copy.deepcopy(model)
+    model[4][criterion][factor] = weight
+    return model
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_intervals_match_rescoring(seed):
+    model = list(synthetic_example(40, 5, seed=seed))
+    stability = weight_stability_intervals(compile_decision_matrix(*model))
+    best = stability.best_option
+    assert best == best_option(model)
+
+    for j, criterion in enumerate(stability.matrix.criteria):
+        low, high = stability.criterion_intervals[j]
+        assert best_option(with_criterion_weight(model, criterion, low * 1.001 + 1e-9)) == best
+        if np.isfinite(high):
+            assert best_option(with_criterion_weight(model, criterion, high * 0.999)) == best
+            assert best_option(with_criterion_weight(model, criterion, high * 1.001)) != best
+        if low > 0:
+            assert best_option(with_criterion_weight(model, criterion, low * 0.999)) != best
+
+    for k, (criterion, factor) in enumerate(stability.matrix.columns):
+        low, high = stability.factor_intervals[k]
+        if np.isnan(low):
+            continue
+        if np.isfinite(high):
+            assert best_option(with_factor_weight(model, criterion, factor, high * 0.999)) == best
+            assert best_option(with_factor_weight(model, criterion, factor, high * 1.001)) != best
+        if low > 0:
+            assert best_option(with_factor_weight(model, criterion, factor, low * 1.001)) == best
+            assert best_option(with_factor_weight(model, criterion, factor, low * 0.999)) != best
@@ -0,0 +1,90 @@
+import asyncio
+import copy
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+from decision_tool.examples import garfield_example, mixed_factors_example, simple_2_by_2_example
+from decision_tool.matrix import compile_decision_matrix
+from decision_tool.service import MODEL_FIELDS, ScoringService, scoring_executor
+from decision_tool.validation import ModelValidationError, validate_matrix, validate_model
+
+
+def broken_garfield():
+    options, criteria, criterion_weights, factors, factor_weights, scores = copy.deepcopy(garfield_example())
+    del scores["Hassle Jon"]["Have fun"]["Hilarity of action"]
+    scores["Sleep"]["Have fun"]["Good idea what to do"] = 9
+    scores["Prank Odie"]["Satisfy hunger"]["Current hunger level"] = "lots"
+    criterion_weights["Have fun"] = -1
+    factor_weights["Relieve tiredness"] = {factor: 0 for factor in factor_weights["Relieve tiredness"]}
+    return options, criteria, criterion_weights, factors, factor_weights, scores
+
+
+@pytest.mark.parametrize("example", [simple_2_by_2_example, mixed_factors_example, garfield_example])
+def test_examples_are_valid(example):
+    assert validate_model(*example()).ok
+    assert validate_matrix(compile_decision_matrix(*example())).ok
+
+
+def test_every_problem_is_reported():
+    report = validate_model(*broken_garfield())
+    assert report.counts() == {"negative_weight": 1, "zero_weight_total": 1, "missing_score": 1,
+                               "invalid_score": 1, "score_out_of_bounds": 1}
+    with pytest.raises(ModelValidationError):
+        report.raise_if_invalid()
+
+
+def test_matrix_validation_finds_bad_cells():
+    matrix = compile_decision_matrix(*garfield_example())
+    matrix.scores[1, 2] = float("nan")
+    matrix.scores[0, 0] = 7
+    assert validate_matrix(matrix).counts() == {"missing_score": 1, "score_out_of_bounds": 1}
+
+
+def test_validation_error_pickles():
+    error = ModelValidationError(validate_model(*broken_garfield()))
+    restored = pickle.loads(pickle.dumps(error))
+    assert isinstance(restored, ModelValidationError)
+    assert str(restored) == str(error)
+    assert len(restored.report.issues) == len(error.report.issues)
+
+
+def test_service_survives_invalid_model():
+    def body(model):
+        return json.dumps(dict(zip(MODEL_FIELDS, model))).encode("utf-8")
+
+    async def run():
+        with scoring_executor(1) as executor:
+            service = ScoringService(executor)
+            bad_status, bad_payload = await service.respond("POST", "/score", body(broken_garfield()))
+            good_status, good_payload = await service.respond("POST", "/score", body(simple_2_by_2_example()))
+        return bad_status, bad_payload, good_status, json.loads(good_payload)
+
+    bad_status, bad_payload, good_status, good_payload = asyncio.run(run())
+    assert bad_status == 400
+    assert "problem(s) found" in bad_payload["error"]
+    assert good_status == 200
+    assert "Project B" in good_payload["best_options"]
+
+
+def test_numbers_given_as_text_or_booleans_are_invalid():
+    options, criteria, criterion_weights, factors, factor_weights, scores = copy.deepcopy(simple_2_by_2_example())
+    option, criterion = options[0], criteria[0]
+    factor = factors[criterion][0]
+    scores[option][criterion][factor] = "3"
+    scores[options[1]][criterion][factor] = True
+    criterion_weights[criteria[1]] = "4"
+
+    report = validate_model(options, criteria, criterion_weights, factors, factor_weights, scores)
+    assert report.counts() == {"invalid_score": 2, "invalid_weight": 1}
+    with pytest.raises(ModelValidationError):
+        report.raise_if_invalid()
+
+
+def test_numpy_numbers_are_valid():
+    options, criteria, criterion_weights, factors, factor_weights, scores = copy.deepcopy(simple_2_by_2_example())
+    criterion_weights[criteria[0]] = np.int64(2)
+    scores[options[0]][criteria[0]][factors[criteria[0]][0]] = np.float64(2.5)
+    assert validate_model(options, criteria, criterion_weights, factors, factor_weights, scores).ok